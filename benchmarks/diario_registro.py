@@ -0,0 +1,88 @@
+"""
+Costo de guardar un ciclo de riego: registro completo contra diario.
+
+Sobre un registro de 100.000 cultivos (por defecto) repite un riego por
+lote y lo guarda:
+  - reescribiendo el registro completo (persistir)
+  - anotando el riego en el diario (con y sin fsync)
+
+Al final mide la lectura (snapshot + reproduccion del diario) y la
+compactacion, y verifica que el registro leido coincida con el original.
+
+Uso:
+    python -m benchmarks.diario_registro [CANTIDAD] [CICLOS]
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+
+from benchmarks.escritura_atomica import crear_registro
+from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
+from python_forestacion.servicios.terrenos.registro_forestal_service import RegistroForestalService
+
+
+def medir_ciclos(ciclos: int, guardar) -> float:
+    """Mediana en milisegundos de `ciclos` llamadas a guardar()."""
+    tiempos = []
+    for _ in range(ciclos):
+        inicio = time.perf_counter()
+        guardar()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tiempos)
+
+
+def main() -> int:
+    """Funcion principal del benchmark."""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    ciclos = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    registro = crear_registro(cantidad)
+    plantacion = registro.get_plantacion()
+    plantacion.set_agua_disponible(10 ** 12)
+    plantacion_service = PlantacionService()
+    fecha = date(2024, 1, 15)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        servicio = RegistroForestalService(directorio)
+        sin_fsync = RegistroForestalService(directorio, sincronizar=False)
+        servicio.persistir(registro)
+
+        completo = medir_ciclos(ciclos, lambda: servicio.persistir(registro))
+        print(f"[OK] persistir completo:   {completo:9.3f} ms/ciclo")
+
+        for nombre, instancia in (("diario con fsync", servicio), ("diario sin fsync", sin_fsync)):
+            with instancia.abrir_diario("Benchmark") as diario:
+                diario.regar({}, {}, plantacion.get_agua_disponible())
+                anotar = medir_ciclos(ciclos, lambda: diario.regar({}, {}, 0))
+            print(f"[OK] {nombre}:   {anotar:9.3f} ms/ciclo")
+
+        # Ciclos reales: riego por lote anotado en el diario
+        servicio.persistir(registro)
+        with servicio.abrir_diario("Benchmark") as diario:
+            for _ in range(ciclos):
+                plantacion_service.regar_por_lote(plantacion, fecha, diario=diario)
+            tamanio = diario.get_tamanio()
+        print(f"[OK] diario tras {ciclos} riegos: {tamanio:,} bytes")
+
+        inicio = time.perf_counter()
+        leido = RegistroForestalService.leer_registro("Benchmark", directorio)
+        lectura = time.perf_counter() - inicio
+        print(f"[OK] leer snapshot + diario: {lectura:8.3f} s")
+
+        cultivos = plantacion.get_cultivos()
+        leidos = leido.get_plantacion().get_cultivos()
+        if [c.get_agua() for c in leidos] != [c.get_agua() for c in cultivos]:
+            raise RuntimeError("El registro reproducido no coincide con el original")
+
+        inicio = time.perf_counter()
+        servicio.compactar("Benchmark", 0)
+        print(f"[OK] compactar: {time.perf_counter() - inicio:8.3f} s "
+              f"(diario: {os.path.getsize(os.path.join(directorio, 'Benchmark.diario'))} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
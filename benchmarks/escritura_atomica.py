@@ -0,0 +1,87 @@
+"""
+Latencia agregada por la escritura atomica de registros.
+
+Persiste un registro de 100.000 cultivos (por defecto) con:
+  - escritura directa sobre el archivo (comportamiento anterior)
+  - temporal + os.replace sin fsync
+  - temporal + fsync + os.replace (por defecto del servicio)
+  - lo anterior mas un respaldo rotativo
+
+y reporta la mediana de varias repeticiones.
+
+Uso:
+    python -m benchmarks.escritura_atomica [CANTIDAD] [REPETICIONES]
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from python_forestacion.entidades.terrenos.tierra import Tierra
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+from python_forestacion.persistencia.impl.serializador_pickle import SerializadorPickle
+from python_forestacion.persistencia.escritura_atomica import EscrituraAtomica
+
+ESPECIES = ("Pino", "Olivo", "Lechuga", "Zanahoria")
+
+
+def crear_registro(cantidad: int) -> RegistroForestal:
+    """Registro con `cantidad` cultivos repartidos entre las especies."""
+    tierra = Tierra(1, float("inf"), "Benchmark")
+    plantacion = Plantacion("Benchmark", float("inf"))
+    tierra.set_finca(plantacion)
+    por_especie = cantidad // len(ESPECIES)
+    for especie in ESPECIES:
+        plantacion.add_cultivos(CultivoFactory.crear_cultivos(especie, por_especie))
+    return RegistroForestal(1, tierra, plantacion, "Benchmark", 0.0)
+
+
+def medir(guardar, repeticiones: int) -> float:
+    """Mediana en milisegundos de `repeticiones` llamadas a `guardar`."""
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        guardar()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tiempos)
+
+
+def main() -> int:
+    """Funcion principal del benchmark."""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    registro = crear_registro(cantidad)
+
+    def contenido(archivo):
+        SerializadorPickle().escribir(registro, archivo)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "Benchmark.dat")
+
+        def directa():
+            with open(ruta, 'wb') as archivo:
+                contenido(archivo)
+
+        variantes = (
+            ("Directa (open 'wb')", directa),
+            ("Atomica sin fsync", lambda: EscrituraAtomica.escribir(ruta, contenido, sincronizar=False)),
+            ("Atomica con fsync", lambda: EscrituraAtomica.escribir(ruta, contenido)),
+            ("Atomica + 2 respaldos", lambda: EscrituraAtomica.escribir(ruta, contenido, 2)),
+        )
+
+        print(f"[INFO] Registro de {len(registro.get_plantacion().get_cultivos()):,} cultivos, "
+              f"mediana de {repeticiones} escrituras")
+        base = None
+        for nombre, guardar in variantes:
+            ms = medir(guardar, repeticiones)
+            base = base or ms
+            print(f"[OK] {nombre:<24} {ms:8.1f} ms  ({ms - base:+7.1f} ms)")
+        print(f"     Tamanio: {os.path.getsize(ruta) / (1024 * 1024):.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
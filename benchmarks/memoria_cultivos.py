@@ -0,0 +1,78 @@
+"""
+Reporte de memoria para un millon de cultivos de especies mezcladas.
+
+Mide con tracemalloc la memoria retenida por los cultivos creados con
+CultivoFactory, tanto como objetos sueltos como dentro de una plantacion
+columnar, y el tamanio del pickle resultante.
+
+Uso:
+    python -m benchmarks.memoria_cultivos [CANTIDAD]
+"""
+import gc
+import pickle
+import sys
+import tracemalloc
+
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+
+ESPECIES = ("Pino", "Olivo", "Lechuga", "Zanahoria")
+
+
+def medir(construir) -> tuple:
+    """
+    Ejecuta `construir` y mide la memoria que queda retenida.
+
+    Args:
+        construir: Funcion sin argumentos que devuelve la estructura a medir
+
+    Returns:
+        Tupla (estructura, megabytes retenidos)
+    """
+    gc.collect()
+    tracemalloc.start()
+    inicial = tracemalloc.get_traced_memory()[0]
+    estructura = construir()
+    gc.collect()
+    final = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return estructura, (final - inicial) / (1024 * 1024)
+
+
+def crear_objetos(cantidad: int) -> list:
+    """Crea `cantidad` cultivos alternando especies, uno por uno."""
+    return [CultivoFactory.crear_cultivo(ESPECIES[i % len(ESPECIES)])
+            for i in range(cantidad)]
+
+
+def crear_columnar(cantidad: int) -> Plantacion:
+    """Crea una plantacion columnar con `cantidad` cultivos alternados."""
+    plantacion = Plantacion("Benchmark", float("inf"), columnar=True)
+    for i in range(cantidad):
+        plantacion.add_cultivo(CultivoFactory.crear_cultivo(ESPECIES[i % len(ESPECIES)]))
+    return plantacion
+
+
+def main() -> int:
+    """Funcion principal del benchmark."""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    # Carga perezosa de clases y prototipos fuera de la medicion
+    crear_objetos(len(ESPECIES))
+
+    print(f"[INFO] Cultivos: {cantidad:,} ({', '.join(ESPECIES)} alternados)")
+
+    cultivos, mb = medir(lambda: crear_objetos(cantidad))
+    print(f"[OK] Objetos:  {mb:8.1f} MB ({mb * 1024 * 1024 / cantidad:6.1f} bytes/cultivo)")
+    tamanio = len(pickle.dumps(cultivos, protocol=pickle.HIGHEST_PROTOCOL))
+    print(f"     Pickle:   {tamanio / (1024 * 1024):8.1f} MB")
+    del cultivos
+
+    plantacion, mb = medir(lambda: crear_columnar(cantidad))
+    print(f"[OK] Columnar: {mb:8.1f} MB ({mb * 1024 * 1024 / cantidad:6.1f} bytes/cultivo)")
+    tamanio = len(pickle.dumps(plantacion, protocol=pickle.HIGHEST_PROTOCOL))
+    print(f"     Pickle:   {tamanio / (1024 * 1024):8.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""
+Prueba de estres de una plantacion compartida entre hilos.
+
+Durante unos segundos, varios hilos a la vez sobre la misma plantacion:
+  - riegan (regar y regar_por_lote, como ControlRiegoTask)
+  - plantan (plantar y plantar_lote)
+  - cosechan (cosechar_especie)
+  - agregan trabajadores
+  - leen (PlantacionStats y el indice de alturas)
+
+Al terminar verifica que el agua se conserve: lo que bajo el agua
+disponible es lo que devolvieron los riegos, y el agua de los cultivos
+(presentes y cosechados) es su agua inicial mas lo regado. Tambien
+contrasta el contador de superficie, la cantidad de cultivos y el
+indice de alturas contra un recorrido completo.
+
+Corre con Plantacion(concurrente=True), en modo objetos y columnar, y
+como referencia sin bloqueo (donde las diferencias son esperables).
+
+Uso:
+    python -m benchmarks.plantacion_concurrente [SEGUNDOS]
+"""
+import contextlib
+import math
+import os
+import sys
+import threading
+import time
+
+from python_forestacion.entidades.cultivos.pino import Pino
+from python_forestacion.entidades.personal.trabajador import Trabajador
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.entidades.terrenos.plantacion_stats import PlantacionStats
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
+
+AGUA_INICIAL = 10 ** 12
+ESPECIES = ("Pino", "Olivo", "Lechuga", "Zanahoria")
+
+
+class Estres:
+    """Estado compartido por los hilos de una corrida."""
+
+    def __init__(self, plantacion: Plantacion, segundos: float):
+        self.plantacion = plantacion
+        self.servicio = PlantacionService()
+        self.limite = time.monotonic() + segundos
+        self.lock = threading.Lock()
+        self.regado = 0
+        self.riegos = 0
+        self.plantados = {especie: 0 for especie in ESPECIES}
+        self.cosechados = []
+        self.trabajadores = 0
+        self.lecturas = 0
+        self.errores = []
+
+    def activo(self) -> bool:
+        return time.monotonic() < self.limite
+
+    def regar(self, por_lote: bool) -> None:
+        regar = self.servicio.regar_por_lote if por_lote else self.servicio.regar
+        while self.activo():
+            litros = regar(self.plantacion)
+            with self.lock:
+                self.regado += litros
+                self.riegos += 1
+
+    def plantar(self, indice: int) -> None:
+        vuelta = 0
+        while self.activo():
+            especie = ESPECIES[(indice + vuelta) % len(ESPECIES)]
+            cantidad = 1 + vuelta % 50
+            if vuelta % 2:
+                self.servicio.plantar_lote(self.plantacion, especie, cantidad)
+            else:
+                self.servicio.plantar(self.plantacion, especie, cantidad)
+            with self.lock:
+                self.plantados[especie] += cantidad
+            vuelta += 1
+
+    def cosechar(self) -> None:
+        vuelta = 0
+        while self.activo():
+            especie = ESPECIES[vuelta % len(ESPECIES)]
+            cosechados = self.servicio.cosechar_especie(self.plantacion, especie, 20)
+            with self.lock:
+                self.cosechados.extend(cosechados)
+            vuelta += 1
+            time.sleep(0.001)
+
+    def contratar(self) -> None:
+        dni = 0
+        while self.activo():
+            self.plantacion.add_trabajador(Trabajador(dni, f"Trabajador {dni}", []))
+            dni += 1
+            self.trabajadores = dni
+            time.sleep(0.001)
+
+    def leer(self) -> None:
+        while self.activo():
+            stats = PlantacionStats.calcular(self.plantacion)
+            with self.plantacion.leyendo():
+                indice = self.plantacion.get_indice_alturas(Pino)
+                if len(indice) != self.plantacion.contar_por_tipo(Pino):
+                    raise AssertionError("indice de alturas desincronizado")
+                indice.percentil(50)
+            if stats.get_cantidad_cultivos() < 0:
+                raise AssertionError("estadisticas invalidas")
+            self.lecturas += 1
+
+    def correr(self, funcion, *argumentos) -> None:
+        try:
+            funcion(*argumentos)
+        except Exception as e:
+            self.errores.append(f"{funcion.__name__}: {type(e).__name__}: {e}")
+
+
+def verificar(estres: Estres) -> list:
+    """Diferencias entre lo que registraron los hilos y el estado final."""
+    plantacion = estres.plantacion
+    cultivos = plantacion.get_cultivos()
+    diferencias = list(estres.errores)
+
+    agua_consumida = AGUA_INICIAL - plantacion.get_agua_disponible()
+    if agua_consumida != estres.regado:
+        diferencias.append(f"agua disponible: bajo {agua_consumida}L, los riegos informaron {estres.regado}L")
+
+    agua_inicial_cultivos = sum(CultivoFactory.get_prototipo(especie).get_agua() * cantidad
+                                for especie, cantidad in estres.plantados.items())
+    agua_cultivos = sum(c.get_agua() for c in cultivos) + sum(c.get_agua() for c in estres.cosechados)
+    if agua_cultivos != agua_inicial_cultivos + estres.regado:
+        diferencias.append(f"agua de cultivos: {agua_cultivos}L, esperado "
+                           f"{agua_inicial_cultivos + estres.regado}L")
+
+    plantados = sum(estres.plantados.values())
+    if len(cultivos) + len(estres.cosechados) != plantados:
+        diferencias.append(f"cultivos: {len(cultivos)} + {len(estres.cosechados)} cosechados, "
+                           f"plantados {plantados}")
+
+    superficie = sum(c.get_superficie() for c in cultivos)
+    if not math.isclose(superficie, plantacion.get_superficie_ocupada(), abs_tol=1e-6):
+        diferencias.append(f"superficie: contador {plantacion.get_superficie_ocupada():.2f}m2, "
+                           f"suma {superficie:.2f}m2")
+
+    alturas = sorted(c.get_altura() for c in cultivos if isinstance(c, Pino))
+    if list(plantacion.get_indice_alturas(Pino)) != alturas:
+        diferencias.append("indice de alturas distinto de las alturas de los pinos")
+
+    if len(plantacion.get_trabajadores()) != estres.trabajadores:
+        diferencias.append(f"trabajadores: {len(plantacion.get_trabajadores())} de {estres.trabajadores}")
+    return diferencias
+
+
+def ejecutar(concurrente: bool, columnar: bool, segundos: float) -> Estres:
+    plantacion = Plantacion("Estres", 10 ** 9, columnar=columnar, concurrente=concurrente)
+    plantacion.set_agua_disponible(AGUA_INICIAL)
+    estres = Estres(plantacion, segundos)
+    tareas = [(estres.regar, False), (estres.regar, True),
+              (estres.plantar, 0), (estres.plantar, 1),
+              (estres.cosechar,), (estres.contratar,), (estres.leer,)]
+    hilos = [threading.Thread(target=estres.correr, args=tarea) for tarea in tareas]
+    # Cambios de hilo frecuentes: más intercalados por segundo
+    intervalo = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    try:
+        with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+            for hilo in hilos:
+                hilo.start()
+            for hilo in hilos:
+                hilo.join()
+    finally:
+        sys.setswitchinterval(intervalo)
+    return estres
+
+
+def main() -> int:
+    """Funcion principal del benchmark."""
+    segundos = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    fallas = 0
+    for concurrente, columnar in ((True, False), (True, True), (False, False)):
+        estres = ejecutar(concurrente, columnar, segundos)
+        diferencias = verificar(estres)
+        modo = f"{'concurrente' if concurrente else 'sin bloqueo'} {'columnar' if columnar else 'objetos'}"
+        estado = "OK" if not diferencias else ("FALLA" if concurrente else "ESPERADO")
+        print(f"[{estado}] {modo:24s} {estres.riegos} riegos | "
+              f"{sum(estres.plantados.values())} plantados | {len(estres.cosechados)} cosechados | "
+              f"{estres.lecturas} lecturas")
+        for diferencia in diferencias[:5]:
+            print(f"    - {diferencia}")
+        if concurrente and diferencias:
+            fallas += 1
+    return 1 if fallas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""
+Huella de hilos y memoria del riego automatico: hilos, planificador y asyncio.
+
+Pone en marcha el riego automatico de 1.000 plantaciones (por defecto)
+durante unos segundos con cada modelo:
+  - hilos: TemperaturaReaderTask + HumedadReaderTask + ControlRiegoTask
+    por plantacion (tres hilos cada una)
+  - planificador: los mismos sensores, pero un solo PlanificadorRiego
+    con un pool de MAX_HILOS_RIEGO hilos en lugar de un controlador
+    por plantacion
+  - asyncio: RuntimeRiegoAsync, con sensores y controladores como
+    corrutinas sobre un solo event loop
+
+Cada modelo corre en un proceso aparte para que la memoria de uno no
+afecte al otro. Reporta hilos vivos, memoria residente agregada, tiempo
+de CPU y riegos ejecutados.
+
+Uso:
+    python -m benchmarks.riego_asincrono [PLANTACIONES] [SEGUNDOS]
+"""
+import contextlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
+
+MODELOS = ("hilos", "planificador", "asyncio")
+
+
+def memoria_residente() -> int:
+    """Bytes de memoria residente del proceso (Linux: /proc; si no, el pico)."""
+    try:
+        with open("/proc/self/statm") as archivo:
+            return int(archivo.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def crear_plantaciones(cantidad: int) -> list:
+    """Plantaciones chicas con agua de sobra."""
+    plantaciones = []
+    for i in range(cantidad):
+        plantacion = Plantacion(f"Finca {i}", 1000.0)
+        plantacion.add_cultivos(CultivoFactory.crear_cultivos("Pino", 5))
+        plantacion.add_cultivos(CultivoFactory.crear_cultivos("Lechuga", 5))
+        plantacion.set_agua_disponible(10 ** 9)
+        plantaciones.append(plantacion)
+    return plantaciones
+
+
+def medir_hilos(plantaciones: list, segundos: float) -> dict:
+    from python_forestacion.riego.sensores.temperatura_reader_task import TemperaturaReaderTask
+    from python_forestacion.riego.sensores.humedad_reader_task import HumedadReaderTask
+    from python_forestacion.riego.control.control_riego_task import ControlRiegoTask
+
+    servicio = PlantacionService()
+    tareas = []
+    for plantacion in plantaciones:
+        temperatura, humedad = TemperaturaReaderTask(), HumedadReaderTask()
+        tareas += [temperatura, humedad, ControlRiegoTask(temperatura, humedad, plantacion, servicio)]
+    for tarea in tareas:
+        tarea.start()
+    time.sleep(segundos)
+    hilos = threading.active_count()
+    memoria = memoria_residente()
+    for tarea in tareas:
+        tarea.detener()
+    for tarea in tareas:
+        tarea.join(timeout=5)
+    return {"hilos": hilos, "memoria": memoria}
+
+
+def medir_planificador(plantaciones: list, segundos: float) -> dict:
+    from python_forestacion.riego.sensores.temperatura_reader_task import TemperaturaReaderTask
+    from python_forestacion.riego.sensores.humedad_reader_task import HumedadReaderTask
+    from python_forestacion.riego.control.planificador_riego import PlanificadorRiego
+
+    planificador = PlanificadorRiego(PlantacionService())
+    sensores = []
+    for plantacion in plantaciones:
+        temperatura, humedad = TemperaturaReaderTask(), HumedadReaderTask()
+        planificador.agregar_plantacion(plantacion, [temperatura, humedad])
+        sensores += [temperatura, humedad]
+    planificador.start()
+    for sensor in sensores:
+        sensor.start()
+    time.sleep(segundos)
+    hilos = threading.active_count()
+    memoria = memoria_residente()
+    for sensor in sensores:
+        sensor.detener()
+    planificador.detener()
+    planificador.join(timeout=5)
+    for sensor in sensores:
+        sensor.join(timeout=5)
+    return {"hilos": hilos, "memoria": memoria}
+
+
+def medir_asyncio(plantaciones: list, segundos: float) -> dict:
+    import asyncio
+    from python_forestacion.riego.runtime_riego_async import RuntimeRiegoAsync
+
+    runtime = RuntimeRiegoAsync(PlantacionService())
+    for plantacion in plantaciones:
+        runtime.agregar_plantacion(plantacion)
+    medicion = {}
+
+    async def medir():
+        await asyncio.sleep(segundos)
+        medicion.update(hilos=threading.active_count(), memoria=memoria_residente())
+        runtime.detener()
+
+    async def principal():
+        await asyncio.gather(runtime.ejecutar(), medir())
+
+    asyncio.run(principal())
+    return medicion
+
+
+def medir_modelo(modelo: str, cantidad: int, segundos: float) -> dict:
+    """Corre un modelo en este proceso y devuelve sus mediciones."""
+    plantaciones = crear_plantaciones(cantidad)
+    base = memoria_residente()
+    cpu = time.process_time()
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+        medir = {"hilos": medir_hilos, "planificador": medir_planificador,
+                 "asyncio": medir_asyncio}[modelo]
+        medicion = medir(plantaciones, segundos)
+    medicion["cpu"] = time.process_time() - cpu
+    medicion["memoria"] -= base
+    medicion["riegos"] = sum(p.get_cultivos()[0].get_agua() > 2 for p in plantaciones)
+    return medicion
+
+
+def main() -> int:
+    """Funcion principal del benchmark."""
+    if len(sys.argv) > 1 and sys.argv[1] == "--modelo":
+        modelo, cantidad, segundos = sys.argv[2], int(sys.argv[3]), float(sys.argv[4])
+        print(json.dumps(medir_modelo(modelo, cantidad, segundos)))
+        return 0
+
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    segundos = float(sys.argv[2]) if len(sys.argv) > 2 else 8.0
+    for modelo in MODELOS:
+        salida = subprocess.run(
+            [sys.executable, "-m", "benchmarks.riego_asincrono", "--modelo",
+             modelo, str(cantidad), str(segundos)],
+            capture_output=True, text=True, check=True
+        ).stdout
+        medicion = json.loads(salida.strip().splitlines()[-1])
+        print(f"[OK] {modelo:12s} {cantidad} plantaciones: {medicion['hilos']:5d} hilos | "
+              f"+{medicion['memoria'] / 2 ** 20:7.1f} MB | CPU {medicion['cpu']:6.2f} s | "
+              f"{medicion['riegos']} plantaciones regadas")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
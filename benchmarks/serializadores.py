@@ -0,0 +1,93 @@
+"""
+Comparacion de los serializadores de registros: tamanio, guardado y carga.
+
+Para cada cantidad de cultivos (por defecto 10.000, 100.000 y 1.000.000,
+especies alternadas en una plantacion de objetos) guarda y vuelve a leer
+el registro con cada serializador disponible, sin comprimir y con cada
+codec de compresion.
+
+Uso:
+    python -m benchmarks.serializadores [CANTIDAD ...]
+"""
+import gc
+import os
+import sys
+import tempfile
+import time
+
+from python_forestacion.entidades.terrenos.tierra import Tierra
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+from python_forestacion.persistencia.serializador_registro import SerializadorRegistro
+from python_forestacion.persistencia.compresion_registro import CompresionRegistro
+
+ESPECIES = ("Pino", "Olivo", "Lechuga", "Zanahoria")
+SERIALIZADORES = ("pickle", "binario", "jsonl")
+COMPRESIONES = (None, "zlib", "lzma", "bz2")
+
+
+def crear_registro(cantidad: int) -> RegistroForestal:
+    """Registro con `cantidad` cultivos repartidos entre las especies."""
+    tierra = Tierra(1, float("inf"), "Benchmark")
+    plantacion = Plantacion("Benchmark", float("inf"))
+    tierra.set_finca(plantacion)
+    por_especie = cantidad // len(ESPECIES)
+    for especie in ESPECIES:
+        plantacion.add_cultivos(CultivoFactory.crear_cultivos(especie, por_especie))
+    return RegistroForestal(1, tierra, plantacion, "Benchmark", 0.0)
+
+
+def medir(serializador: SerializadorRegistro, compresion: CompresionRegistro,
+          registro: RegistroForestal, ruta: str) -> tuple:
+    """
+    Guarda y lee el registro con `serializador` y `compresion` (o sin comprimir si es None).
+
+    Returns:
+        Tupla (kilobytes, segundos de guardado, segundos de carga)
+    """
+    gc.collect()
+    inicio = time.perf_counter()
+    with open(ruta, 'wb') as archivo:
+        if compresion is None:
+            serializador.escribir(registro, archivo)
+        else:
+            with compresion.abrir_escritura(archivo) as comprimido:
+                serializador.escribir(registro, comprimido)
+    guardado = time.perf_counter() - inicio
+
+    gc.collect()
+    inicio = time.perf_counter()
+    with open(ruta, 'rb') as archivo, CompresionRegistro.abrir_lectura(archivo) as legible:
+        leido = serializador.leer(legible)
+    carga = time.perf_counter() - inicio
+
+    esperado = len(registro.get_plantacion().get_cultivos())
+    if len(leido.get_plantacion().get_cultivos()) != esperado:
+        raise RuntimeError(f"{serializador.get_nombre()}: cantidad de cultivos distinta")
+    return os.path.getsize(ruta) / 1024, guardado, carga
+
+
+def main() -> int:
+    """Funcion principal del benchmark."""
+    cantidades = [int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "Benchmark.dat")
+        for cantidad in cantidades:
+            registro = crear_registro(cantidad)
+            print(f"\n[INFO] {cantidad:,} cultivos")
+            print(f"     {'Formato':<16} {'Tamanio':>10} {'Guardar':>10} {'Leer':>10}")
+            for nombre in SERIALIZADORES:
+                serializador = SerializadorRegistro.por_nombre(nombre)
+                for codec in COMPRESIONES:
+                    compresion = None if codec is None else CompresionRegistro(codec)
+                    kb, guardado, carga = medir(serializador, compresion, registro, ruta)
+                    formato = nombre if codec is None else f"{nombre}+{codec}"
+                    print(f"[OK] {formato:<16} {kb:8.0f} KB {guardado:8.3f} s {carga:8.3f} s")
+            del registro
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+Proyeccion de muchos ciclos de riego: bucle de riegos contra simulador.
+
+Sobre una plantacion de 20.000 cultivos (por defecto) proyecta un riego
+diario durante 365 dias (por defecto):
+  - llamando a PlantacionService.regar_por_lote una vez por dia
+  - con SimuladorCrecimientoService.simular
+
+y verifica que el agua y la altura final de cada planta coincidan
+exactamente en ambos caminos, en modo objetos y columnar.
+
+Uso:
+    python -m benchmarks.simulador_crecimiento [CANTIDAD] [DIAS]
+"""
+import contextlib
+import io
+import sys
+import time
+from array import array
+from datetime import date, timedelta
+
+from python_forestacion.entidades.cultivos.arbol import Arbol
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
+from python_forestacion.servicios.terrenos.simulador_crecimiento_service import SimuladorCrecimientoService
+
+ESPECIES = ("Pino", "Olivo", "Lechuga", "Zanahoria")
+
+
+def crear_plantacion(cantidad: int, columnar: bool) -> Plantacion:
+    """Plantacion con `cantidad` cultivos repartidos entre las especies."""
+    plantacion = Plantacion("Benchmark", float("inf"), columnar=columnar)
+    plantacion.set_agua_disponible(10 ** 12)
+    por_especie = cantidad // len(ESPECIES)
+    for especie in ESPECIES:
+        plantacion.add_cultivos(CultivoFactory.crear_cultivos(especie, por_especie))
+    # Algunas alturas iniciales distintas, como en una plantacion real
+    for i, arbol in enumerate(plantacion.get_cultivos_por_tipo(Arbol)):
+        arbol.set_altura(arbol.get_altura() + (i % 10) * 0.25)
+    return plantacion
+
+
+def main() -> int:
+    """Funcion principal del benchmark."""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    dias = int(sys.argv[2]) if len(sys.argv) > 2 else 365
+    inicio_riegos = date(2024, 1, 1)
+    fin_riegos = inicio_riegos + timedelta(days=dias - 1)
+    plantacion_service = PlantacionService()
+    simulador = SimuladorCrecimientoService()
+
+    for columnar in (False, True):
+        modo = "columnar" if columnar else "objetos"
+        plantacion = crear_plantacion(cantidad, columnar)
+
+        inicio = time.perf_counter()
+        resultado = simulador.simular(plantacion, inicio_riegos, fin_riegos)
+        simulado = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for fecha in simulador.fechas_riego(inicio_riegos, fin_riegos):
+                plantacion_service.regar_por_lote(plantacion, fecha)
+        bucle = time.perf_counter() - inicio
+
+        cultivos = plantacion.get_cultivos()
+        aguas = array('q', [c.get_agua() for c in cultivos])
+        alturas = array('d', [c.get_altura() if isinstance(c, Arbol) else 0.0 for c in cultivos])
+        if (aguas != resultado.get_aguas() or alturas != resultado.get_alturas()
+                or plantacion.get_agua_disponible() != resultado.get_agua_disponible()):
+            raise RuntimeError(f"La simulacion ({modo}) no coincide con el riego real")
+
+        print(f"[OK] {modo:8s} {dias} riegos x {cantidad:,} cultivos: "
+              f"bucle {bucle:7.3f} s | simulador {simulado:7.3f} s "
+              f"(x{bucle / simulado:,.0f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
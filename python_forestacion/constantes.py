@@ -7,8 +7,12 @@ TEMP_MIN_RIEGO = 8
 TEMP_MAX_RIEGO = 15
 HUMEDAD_MAX_RIEGO = 50
 INTERVALO_CONTROL_RIEGO = 2.5
+DEBOUNCE_CONTROL_RIEGO = 0.25  # Segundos que se esperan lecturas de una misma ráfaga antes de evaluar
+CONTROL_RIEGO_POR_EVENTOS = True  # False: el control consulta cada INTERVALO_CONTROL_RIEGO
 INTERVALO_SENSOR_TEMPERATURA = 2.0
 INTERVALO_SENSOR_HUMEDAD = 3.0
+ANTIGUEDAD_MAXIMA_LECTURA = 10.0  # Segundos tras los que una lectura ya no habilita a regar
+MAX_HILOS_RIEGO = 4  # Hilos del pool con que PlanificadorRiego riega varias plantaciones
 
 # Estaciones
 MES_INICIO_VERANO = 12
@@ -19,6 +23,7 @@ ABSORCION_SEASONAL_VERANO = 5
 ABSORCION_SEASONAL_INVIERNO = 2
 ABSORCION_CONSTANTE_LECHUGA = 1
 ABSORCION_CONSTANTE_ZANAHORIA = 2
+TAMANIO_CACHE_ABSORCION = 256  # Resultados de estrategia memorizados por servicio de cultivo (0: sin cache)
 
 # Crecimiento
 CRECIMIENTO_PINO_POR_RIEGO = 0.10
@@ -46,5 +51,19 @@ TEMP_MAX = 50.0
 HUMEDAD_MIN = 0.0
 HUMEDAD_MAX = 100.0
 
+# Plantación
+VERIFICAR_SUPERFICIE_OCUPADA = False  # Depuración: contrasta el contador con la suma completa
+
 # Persistencia
-DIRECTORIO_DATOS = "data"
\ No newline at end of file
+DIRECTORIO_DATOS = "data"
+TAMANIO_BLOQUE_CULTIVOS = 10_000  # Cultivos por bloque en el formato por bloques
+GENERACIONES_RESPALDO = 0  # Versiones anteriores de cada registro que se conservan
+SINCRONIZAR_ESCRITURAS = True  # fsync antes del rename atómico
+MAX_PROCESOS_PERSISTENCIA = None  # Procesos para persistir_todos/leer_todos (None: CPUs)
+PRESUPUESTO_CACHE_REGISTROS = 256 * 1024 * 1024  # Bytes en disco de registros cacheados (0: sin cache)
+SERIALIZADOR_REGISTROS = "pickle"  # Formato de escritura: "pickle", "binario" o "jsonl"
+COMPRESION_REGISTROS = None  # Codec de los registros: "zlib", "lzma", "bz2" o None
+TAMANIO_COMPACTACION_DIARIO = 4 * 1024 * 1024  # Bytes de diario a partir de los que se compacta
+
+# Estadísticas
+INTERVALO_HISTOGRAMA_ALTURA = 0.5  # Ancho (m) de cada intervalo del histograma de alturas
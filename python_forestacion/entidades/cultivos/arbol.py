@@ -6,12 +6,21 @@ from python_forestacion.entidades.cultivos.cultivo import Cultivo
 class Arbol(Cultivo):
     """Cultivo de tipo árbol con altura."""
     
-    def __init__(self, agua: int, superficie: float, altura: float):
-        super().__init__(agua, superficie)
+    __slots__ = ('_altura',)
+    
+    def __init__(self, agua: int, superficie: float, altura: float, **valores):
+        super().__init__(agua, superficie, **valores)
         self._altura = altura
     
     def get_altura(self) -> float:
         return self._altura
     
     def set_altura(self, altura: float) -> None:
-        self._altura = altura
\ No newline at end of file
+        anterior = self._altura
+        self._altura = altura
+        if self._plantacion is not None:
+            self._plantacion._altura_modificada(self, anterior, altura)
+    
+    def _copiar_en(self, clon: 'Arbol') -> None:
+        super()._copiar_en(clon)
+        clon._altura = self._altura
\ No newline at end of file
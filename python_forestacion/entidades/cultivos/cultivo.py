@@ -2,13 +2,92 @@
 
 from abc import ABC
 
+from python_forestacion.entidades.cultivos.descriptor_cultivo import DescriptorCultivo
+
 
 class Cultivo(ABC):
-    """Clase base para todos los cultivos."""
+    """
+    Clase base para todos los cultivos.
+    
+    Toda la jerarquía usa __slots__: cada cultivo guarda sólo sus campos,
+    sin __dict__ por instancia.
+    
+    La superficie y los atributos de la especie (variedad, invernadero, ...)
+    se repiten entre plantas, así que viven en un DescriptorCultivo
+    compartido (flyweight); cada cultivo guarda sólo su agua, su altura si
+    es árbol y la referencia al descriptor.
+    """
+    
+    # _plantacion: plantación que contiene al cultivo; se asigna al plantarlo
+    # y se usa para mantener al día su contador de superficie ocupada
+    __slots__ = ('_agua', '_descriptor', '_plantacion')
     
-    def __init__(self, agua: int, superficie: float):
+    def __init__(self, agua: int, superficie: float, **valores):
+        # Los atributos de la especie llegan de las subclases para armar el
+        # descriptor con una sola búsqueda (con_valor queda para los setters)
         self._agua = agua
-        self._superficie = superficie
+        self._descriptor = DescriptorCultivo.obtener(superficie, **valores)
+        self._plantacion = None
+    
+    @property
+    def _superficie(self) -> float:
+        return self._descriptor.get_superficie()
+    
+    @_superficie.setter
+    def _superficie(self, superficie: float) -> None:
+        self._descriptor = self._descriptor.con_superficie(superficie)
+    
+    def __getstate__(self):
+        """
+        Estado para pickle, sin la plantación contenedora.
+        
+        Así un cultivo (o un lote de cultivos) se serializa sin arrastrar
+        toda la plantación; Plantacion vuelve a vincularlo al restaurarse.
+        """
+        campos = _CAMPOS_PERSISTIBLES.get(type(self))
+        if campos is None:
+            campos = _CAMPOS_PERSISTIBLES[type(self)] = tuple(
+                nombre
+                for clase in reversed(type(self).__mro__)
+                for nombre in getattr(clase, '__slots__', ())
+                if nombre != '_plantacion'
+            )
+        return (None, {nombre: getattr(self, nombre) for nombre in campos})
+    
+    def __setstate__(self, estado) -> None:
+        """
+        Restaura desde pickle.
+        
+        Acepta tanto el estado de slots (dict_estado, slots) como el __dict__
+        de los registros guardados antes de que la jerarquía usara __slots__.
+        En los registros anteriores al descriptor compartido, la superficie y
+        los atributos vienen sueltos y se pasan a un descriptor internado.
+        """
+        if isinstance(estado, tuple):
+            estado_dict, estado_slots = estado
+            estado = {**(estado_dict or {}), **(estado_slots or {})}
+        if '_descriptor' not in estado:
+            self._descriptor = DescriptorCultivo.obtener(estado.pop('_superficie', 0.0))
+        estado.setdefault('_plantacion', None)
+        for nombre, valor in estado.items():
+            setattr(self, nombre, valor)
+    
+    def clonar(self) -> 'Cultivo':
+        """
+        Crea una copia del cultivo sin pasar por el constructor (patrón Prototype).
+        
+        El clon no pertenece a ninguna plantación.
+        """
+        clase = type(self)
+        clon = clase.__new__(clase)
+        self._copiar_en(clon)
+        return clon
+    
+    def _copiar_en(self, clon: 'Cultivo') -> None:
+        """Copia los campos propios de la clase; cada subclase agrega los suyos."""
+        clon._agua = self._agua
+        clon._descriptor = self._descriptor
+        clon._plantacion = None
     
     def get_agua(self) -> int:
         return self._agua
@@ -20,4 +99,11 @@ class Cultivo(ABC):
         return self._superficie
     
     def set_superficie(self, superficie: float) -> None:
-        self._superficie = superficie
\ No newline at end of file
+        anterior = self._superficie
+        self._superficie = superficie
+        if self._plantacion is not None:
+            self._plantacion._superficie_modificada(anterior, superficie)
+
+
+# Cache clase -> nombres de slots que se serializan
+_CAMPOS_PERSISTIBLES: dict = {}
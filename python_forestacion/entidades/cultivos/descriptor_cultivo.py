@@ -0,0 +1,120 @@
+"""
+Datos compartidos (flyweight) de los cultivos.
+"""
+
+import threading
+import weakref
+from typing import Dict, Tuple
+
+
+class DescriptorCultivo:
+    """
+    Datos de un cultivo que se repiten entre plantas: superficie y atributos
+    de la especie (variedad, tipo de aceituna, invernadero, es_baby).
+
+    Los descriptores son inmutables e internados: todos los cultivos con los
+    mismos datos comparten una única instancia, y cada cultivo guarda sólo
+    su estado propio (agua, altura) más la referencia al descriptor.
+    Modificar un dato compartido de un cultivo lo pasa a otro descriptor
+    (con_superficie / con_valor) sin afectar al resto.
+    """
+
+    __slots__ = ('_superficie', '_valores', '_clave', '_tuplas', '__weakref__')
+
+    # Sólo se conservan los descriptores en uso por algún cultivo: referencias
+    # débiles que se quitan solas al liberarse el descriptor. Un dict común
+    # en lugar de WeakValueDictionary porque obtener se llama en cada
+    # constructor y su get es código Python.
+    _internados: Dict[tuple, "weakref.ref[DescriptorCultivo]"] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, superficie: float, valores: Dict[str, object], clave: tuple):
+        # Usar DescriptorCultivo.obtener: el constructor no interna
+        self._superficie = superficie
+        self._valores = valores
+        self._clave = clave
+        self._tuplas: Dict[Tuple[str, ...], Tuple] = {}
+
+    @staticmethod
+    def obtener(superficie: float, **valores) -> 'DescriptorCultivo':
+        """Descriptor compartido con esa superficie y esos atributos."""
+        items = tuple(valores.items())
+        clave = (superficie,) + (tuple(sorted(items)) if len(items) > 1 else items)
+        referencia = DescriptorCultivo._internados.get(clave)
+        if referencia is not None:
+            descriptor = referencia()
+            if descriptor is not None:
+                return descriptor
+        return DescriptorCultivo._internar(superficie, valores, clave)
+
+    @staticmethod
+    def _internar(superficie: float, valores: Dict[str, object], clave: tuple) -> 'DescriptorCultivo':
+        internados = DescriptorCultivo._internados
+        with DescriptorCultivo._lock:
+            referencia = internados.get(clave)
+            descriptor = referencia() if referencia is not None else None
+            if descriptor is None:
+                descriptor = DescriptorCultivo(superficie, valores, clave)
+
+                def descartar(muerta, clave=clave):
+                    # Sin lock (puede correr dentro del GC de este mismo hilo):
+                    # en el peor caso se pierde el internado de un descriptor
+                    # recién creado, que sigue siendo válido
+                    if internados.get(clave) is muerta:
+                        internados.pop(clave, None)
+
+                internados[clave] = weakref.ref(descriptor, descartar)
+        return descriptor
+
+    @staticmethod
+    def _desde_clave(clave: tuple) -> 'DescriptorCultivo':
+        return DescriptorCultivo.obtener(clave[0], **dict(clave[1:]))
+
+    def __reduce__(self):
+        # Al leer un pickle se vuelve a internar en lugar de duplicarse
+        return (DescriptorCultivo._desde_clave, (self._clave,))
+
+    def get_superficie(self) -> float:
+        return self._superficie
+
+    def get_valor(self, campo: str) -> object:
+        return self._valores[campo]
+
+    def get_valores(self, campos: Tuple[str, ...]) -> Tuple:
+        """Valores de `campos` como tupla (se arma una sola vez por descriptor)."""
+        tupla = self._tuplas.get(campos)
+        if tupla is None:
+            tupla = self._tuplas[campos] = tuple(self._valores[campo] for campo in campos)
+        return tupla
+    
+    def con_superficie(self, superficie: float) -> 'DescriptorCultivo':
+        return DescriptorCultivo.obtener(superficie, **self._valores)
+
+    def con_valor(self, campo: str, valor: object) -> 'DescriptorCultivo':
+        return DescriptorCultivo.obtener(self._superficie, **{**self._valores, campo: valor})
+
+    @staticmethod
+    def cantidad_internados() -> int:
+        """Descriptores distintos en uso."""
+        return sum(1 for referencia in list(DescriptorCultivo._internados.values())
+                   if referencia() is not None)
+
+    def __repr__(self) -> str:
+        valores = ", ".join(f"{campo.lstrip('_')}={valor!r}" for campo, valor in self._valores.items())
+        return f"DescriptorCultivo(superficie={self._superficie}, {valores})"
+
+
+def campo_compartido(nombre: str) -> property:
+    """
+    Propiedad `nombre` de un cultivo guardada en su descriptor compartido.
+
+    Permite que los constructores, getters y setters sigan usando
+    self._variedad, self._invernadero, ... como si fueran slots propios.
+    """
+    def leer(self):
+        return self._descriptor.get_valor(nombre)
+
+    def escribir(self, valor):
+        self._descriptor = self._descriptor.con_valor(nombre, valor)
+
+    return property(leer, escribir)
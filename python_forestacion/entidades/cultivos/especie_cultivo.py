@@ -0,0 +1,80 @@
+
+
+from enum import IntEnum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from python_forestacion.entidades.cultivos.cultivo import Cultivo
+
+
+class EspecieCultivo(IntEnum):
+    """Códigos compactos de especie, usados por los almacenes columnares."""
+    PINO = 0
+    OLIVO = 1
+    LECHUGA = 2
+    ZANAHORIA = 3
+
+    def get_nombre(self) -> str:
+        """Nombre de la especie tal como lo recibe CultivoFactory."""
+        return self.name.capitalize()
+
+    def get_clase(self) -> type:
+        """Clase de entidad asociada a la especie."""
+        return _clases_por_especie()[self]
+
+    @classmethod
+    def desde_nombre(cls, nombre: str) -> 'EspecieCultivo':
+        """
+        Obtiene la especie a partir de su nombre ("Pino", "Olivo", ...).
+
+        Raises:
+            ValueError: Si la especie es desconocida
+        """
+        try:
+            return cls[nombre.upper()]
+        except KeyError:
+            raise ValueError(f"Especie desconocida: {nombre}") from None
+
+    @classmethod
+    def de_cultivo(cls, cultivo: 'Cultivo') -> 'EspecieCultivo':
+        """
+        Obtiene la especie de un cultivo (acepta subclases, p. ej. vistas).
+
+        Raises:
+            ValueError: Si el tipo de cultivo es desconocido
+        """
+        return cls.de_clase(type(cultivo))
+
+    @classmethod
+    def de_clase(cls, clase: type) -> 'EspecieCultivo':
+        """Obtiene la especie de una clase de cultivo recorriendo su MRO."""
+        especie = _ESPECIE_POR_CLASE.get(clase)
+        if especie is None:
+            por_clase = {clase_especie: candidata
+                         for candidata, clase_especie in _clases_por_especie().items()}
+            for base in clase.__mro__:
+                if base in por_clase:
+                    especie = por_clase[base]
+                    break
+            else:
+                raise ValueError(f"Tipo de cultivo desconocido: {clase.__name__}")
+            _ESPECIE_POR_CLASE[clase] = especie
+        return especie
+
+
+# Cache clase -> especie, resuelta una sola vez por clase
+_ESPECIE_POR_CLASE: dict = {}
+
+
+def _clases_por_especie() -> dict:
+    """Mapa especie -> clase (import diferido para evitar ciclos)."""
+    from python_forestacion.entidades.cultivos.pino import Pino
+    from python_forestacion.entidades.cultivos.olivo import Olivo
+    from python_forestacion.entidades.cultivos.lechuga import Lechuga
+    from python_forestacion.entidades.cultivos.zanahoria import Zanahoria
+    return {
+        EspecieCultivo.PINO: Pino,
+        EspecieCultivo.OLIVO: Olivo,
+        EspecieCultivo.LECHUGA: Lechuga,
+        EspecieCultivo.ZANAHORIA: Zanahoria
+    }
@@ -1,14 +1,18 @@
 
 
 from python_forestacion.entidades.cultivos.cultivo import Cultivo
+from python_forestacion.entidades.cultivos.descriptor_cultivo import campo_compartido
 
 
 class Hortaliza(Cultivo):
     """Cultivo de tipo hortaliza."""
     
-    def __init__(self, agua: int, superficie: float, invernadero: bool):
-        super().__init__(agua, superficie)
-        self._invernadero = invernadero
+    __slots__ = ()
+    
+    _invernadero = campo_compartido('_invernadero')
+    
+    def __init__(self, agua: int, superficie: float, invernadero: bool, **valores):
+        super().__init__(agua, superficie, _invernadero=invernadero, **valores)
     
     def tiene_invernadero(self) -> bool:
         return self._invernadero
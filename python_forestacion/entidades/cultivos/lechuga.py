@@ -1,5 +1,6 @@
 
 from python_forestacion.entidades.cultivos.hortaliza import Hortaliza
+from python_forestacion.entidades.cultivos.descriptor_cultivo import campo_compartido
 from python_forestacion.constantes import (
     AGUA_INICIAL_LECHUGA,
     SUPERFICIE_LECHUGA
@@ -9,13 +10,17 @@ from python_forestacion.constantes import (
 class Lechuga(Hortaliza):
     """Hortaliza tipo Lechuga."""
     
+    __slots__ = ()
+    
+    _variedad = campo_compartido('_variedad')
+    
     def __init__(self, variedad: str):
         super().__init__(
             agua=AGUA_INICIAL_LECHUGA,
             superficie=SUPERFICIE_LECHUGA,
-            invernadero=True
+            invernadero=True,
+            _variedad=variedad
         )
-        self._variedad = variedad
     
     def get_variedad(self) -> str:
         return self._variedad
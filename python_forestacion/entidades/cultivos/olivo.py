@@ -1,5 +1,6 @@
 
 from python_forestacion.entidades.cultivos.arbol import Arbol
+from python_forestacion.entidades.cultivos.descriptor_cultivo import campo_compartido
 from python_forestacion.entidades.cultivos.tipo_aceituna import TipoAceituna
 from python_forestacion.constantes import (
     AGUA_INICIAL_OLIVO,
@@ -11,13 +12,17 @@ from python_forestacion.constantes import (
 class Olivo(Arbol):
     """Árbol tipo Olivo."""
     
+    __slots__ = ()
+    
+    _tipo_aceituna = campo_compartido('_tipo_aceituna')
+    
     def __init__(self, tipo_aceituna: TipoAceituna):
         super().__init__(
             agua=AGUA_INICIAL_OLIVO,
             superficie=SUPERFICIE_OLIVO,
-            altura=ALTURA_INICIAL_OLIVO
+            altura=ALTURA_INICIAL_OLIVO,
+            _tipo_aceituna=tipo_aceituna
         )
-        self._tipo_aceituna = tipo_aceituna
     
     def get_tipo_aceituna(self) -> TipoAceituna:
         return self._tipo_aceituna
@@ -1,5 +1,6 @@
 
 from python_forestacion.entidades.cultivos.arbol import Arbol
+from python_forestacion.entidades.cultivos.descriptor_cultivo import campo_compartido
 from python_forestacion.constantes import (
     AGUA_INICIAL_PINO,
     SUPERFICIE_PINO,
@@ -10,13 +11,17 @@ from python_forestacion.constantes import (
 class Pino(Arbol):
     """Árbol tipo Pino."""
     
+    __slots__ = ()
+    
+    _variedad = campo_compartido('_variedad')
+    
     def __init__(self, variedad: str):
         super().__init__(
             agua=AGUA_INICIAL_PINO,
             superficie=SUPERFICIE_PINO,
-            altura=ALTURA_INICIAL_PINO
+            altura=ALTURA_INICIAL_PINO,
+            _variedad=variedad
         )
-        self._variedad = variedad
     
     def get_variedad(self) -> str:
         return self._variedad
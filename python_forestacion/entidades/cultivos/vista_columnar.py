@@ -0,0 +1,138 @@
+
+"""
+Vistas livianas sobre una fila de un AlmacenColumnar.
+
+Cada vista es subclase de la especie real (Pino, Olivo, ...), de modo que
+los servicios existentes la tratan como un cultivo más. Los atributos
+privados que usan los getters/setters heredados (_agua, _superficie, ...)
+se redefinen como propiedades que leen y escriben directamente las columnas.
+"""
+
+from typing import TYPE_CHECKING
+
+from python_forestacion.entidades.cultivos.pino import Pino
+from python_forestacion.entidades.cultivos.olivo import Olivo
+from python_forestacion.entidades.cultivos.lechuga import Lechuga
+from python_forestacion.entidades.cultivos.zanahoria import Zanahoria
+from python_forestacion.entidades.cultivos.especie_cultivo import EspecieCultivo
+from python_forestacion.entidades.cultivos.descriptor_cultivo import DescriptorCultivo
+
+if TYPE_CHECKING:
+    from python_forestacion.entidades.terrenos.almacen_columnar import AlmacenColumnar
+
+
+def _columna(nombre: str) -> property:
+    """Propiedad respaldada por la columna `nombre` del almacén."""
+    def leer(self):
+        return getattr(self._almacen, nombre)[self._indice]
+
+    def escribir(self, valor):
+        self._almacen.escribir_columna(nombre, self._indice, valor)
+
+    return property(leer, escribir)
+
+
+def _atributo(posicion: int) -> property:
+    """Propiedad respaldada por la tupla de atributos compartidos de la fila."""
+    def leer(self):
+        return self._almacen.leer_atributos(self._indice)[posicion]
+
+    def escribir(self, valor):
+        self._almacen.escribir_atributo(self._indice, posicion, valor)
+
+    return property(leer, escribir)
+
+
+class VistaCultivo:
+    """Mixin común: una vista es sólo (almacén, índice de fila)."""
+
+    __slots__ = ()
+
+    _agua = _columna('_agua')
+    _superficie = _columna('_superficie')
+
+    @property
+    def _plantacion(self):
+        return self._almacen.get_plantacion()
+
+    @property
+    def _descriptor(self) -> DescriptorCultivo:
+        # La fila no tiene descriptor propio: se obtiene el equivalente (p. ej. al clonar)
+        campos = CAMPOS_ATRIBUTO_POR_ESPECIE[EspecieCultivo.de_cultivo(self)]
+        return DescriptorCultivo.obtener(self._superficie,
+                                         **{campo: getattr(self, campo) for campo in campos})
+
+    def __init__(self, almacen: 'AlmacenColumnar', indice: int):
+        # No se invoca el constructor de la especie: el estado vive en el almacén
+        self._almacen = almacen
+        self._indice = indice
+
+    def get_indice(self) -> int:
+        return self._indice
+
+    def clonar(self):
+        """Copia la fila a un cultivo independiente de la especie real."""
+        clase = EspecieCultivo.de_cultivo(self).get_clase()
+        clon = clase.__new__(clase)
+        self._copiar_en(clon)
+        return clon
+
+    def __reduce__(self):
+        # Los campos heredados son propiedades sobre el almacén: se serializa
+        # sólo la referencia (almacén, índice)
+        return (type(self), (self._almacen, self._indice))
+
+    def __eq__(self, otro) -> bool:
+        if not isinstance(otro, VistaCultivo):
+            return NotImplemented
+        return self._almacen is otro._almacen and self._indice == otro._indice
+
+    def __hash__(self) -> int:
+        return hash((id(self._almacen), self._indice))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(indice={self._indice})"
+
+
+class VistaPino(VistaCultivo, Pino):
+    """Fila columnar vista como Pino."""
+    __slots__ = ('_almacen', '_indice')
+    _altura = _columna('_altura')
+    _variedad = _atributo(0)
+
+
+class VistaOlivo(VistaCultivo, Olivo):
+    """Fila columnar vista como Olivo."""
+    __slots__ = ('_almacen', '_indice')
+    _altura = _columna('_altura')
+    _tipo_aceituna = _atributo(0)
+
+
+class VistaLechuga(VistaCultivo, Lechuga):
+    """Fila columnar vista como Lechuga."""
+    __slots__ = ('_almacen', '_indice')
+    _variedad = _atributo(0)
+    _invernadero = _atributo(1)
+
+
+class VistaZanahoria(VistaCultivo, Zanahoria):
+    """Fila columnar vista como Zanahoria."""
+    __slots__ = ('_almacen', '_indice')
+    _es_baby = _atributo(0)
+    _invernadero = _atributo(1)
+
+
+VISTAS_POR_ESPECIE = {
+    EspecieCultivo.PINO: VistaPino,
+    EspecieCultivo.OLIVO: VistaOlivo,
+    EspecieCultivo.LECHUGA: VistaLechuga,
+    EspecieCultivo.ZANAHORIA: VistaZanahoria
+}
+
+# Campos propios de cada especie que se guardan como tupla de atributos compartida
+CAMPOS_ATRIBUTO_POR_ESPECIE = {
+    EspecieCultivo.PINO: ('_variedad',),
+    EspecieCultivo.OLIVO: ('_tipo_aceituna',),
+    EspecieCultivo.LECHUGA: ('_variedad', '_invernadero'),
+    EspecieCultivo.ZANAHORIA: ('_es_baby', '_invernadero')
+}
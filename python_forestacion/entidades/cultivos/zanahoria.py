@@ -1,5 +1,6 @@
 
 from python_forestacion.entidades.cultivos.hortaliza import Hortaliza
+from python_forestacion.entidades.cultivos.descriptor_cultivo import campo_compartido
 from python_forestacion.constantes import (
     AGUA_INICIAL_ZANAHORIA,
     SUPERFICIE_ZANAHORIA
@@ -9,13 +10,17 @@ from python_forestacion.constantes import (
 class Zanahoria(Hortaliza):
     """Hortaliza tipo Zanahoria."""
     
+    __slots__ = ()
+    
+    _es_baby = campo_compartido('_es_baby')
+    
     def __init__(self, es_baby: bool):
         super().__init__(
             agua=AGUA_INICIAL_ZANAHORIA,
             superficie=SUPERFICIE_ZANAHORIA,
-            invernadero=False
+            invernadero=False,
+            _es_baby=es_baby
         )
-        self._es_baby = es_baby
     
     def es_baby(self) -> bool:
         return self._es_baby
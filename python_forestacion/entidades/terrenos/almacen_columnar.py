@@ -0,0 +1,327 @@
+# python_forestacion/entidades/terrenos/almacen_columnar.py
+"""
+Almacenamiento columnar de cultivos para plantaciones grandes.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, Iterator, List, Mapping, Tuple, TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se usa el camino puro Python
+    np = None
+
+from python_forestacion.entidades.cultivos.arbol import Arbol
+from python_forestacion.entidades.cultivos.especie_cultivo import EspecieCultivo
+from python_forestacion.entidades.cultivos.vista_columnar import (
+    VISTAS_POR_ESPECIE,
+    CAMPOS_ATRIBUTO_POR_ESPECIE
+)
+
+if TYPE_CHECKING:
+    from python_forestacion.entidades.cultivos.cultivo import Cultivo
+    from python_forestacion.entidades.terrenos.plantacion import Plantacion
+
+
+class AlmacenColumnar:
+    """
+    Guarda los cultivos como columnas tipadas en lugar de objetos.
+
+    Cada fila ocupa un byte de especie, un entero de agua, dos dobles
+    (superficie y altura) y un índice a una tupla de atributos compartida
+    (variedad, tipo de aceituna, invernadero, ...). Se comporta como una
+    secuencia de cultivos: indexar o iterar devuelve vistas livianas
+    (VistaPino, VistaOlivo, ...) que leen y escriben sobre las columnas.
+    """
+
+    def __init__(self, plantacion: 'Plantacion' = None):
+        self._plantacion = plantacion
+        self._especie = array('B')
+        self._agua = array('q')
+        self._superficie = array('d')
+        self._altura = array('d')
+        self._atributo = array('I')
+        # Tuplas de atributos internadas: cada combinación distinta se guarda una vez
+        self._atributos: List[Tuple] = []
+        self._codigos_atributo: Dict[Tuple, int] = {}
+        # Índice especie -> filas; None si debe reconstruirse (tras deserializar)
+        self._filas_por_especie: Dict[EspecieCultivo, array] = {}
+
+    def __getstate__(self) -> dict:
+        estado = self.__dict__.copy()
+        estado['_filas_por_especie'] = None
+        return estado
+
+    # ------------------------------------------------------------------
+    # Protocolo de secuencia
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._especie)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self._vista(i) for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("indice de cultivo fuera de rango")
+        return self._vista(indice)
+
+    def __iter__(self) -> Iterator['Cultivo']:
+        for i in range(len(self)):
+            yield self._vista(i)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def append(self, cultivo: 'Cultivo') -> None:
+        """Agrega un cultivo copiando su estado a las columnas."""
+        especie = EspecieCultivo.de_cultivo(cultivo)
+        if self._filas_por_especie is not None:
+            self._filas(especie).append(len(self))
+        # Superficie y atributos salen del descriptor compartido del cultivo
+        descriptor = cultivo._descriptor
+        self._especie.append(especie)
+        self._agua.append(cultivo.get_agua())
+        self._superficie.append(descriptor.get_superficie())
+        self._altura.append(cultivo.get_altura() if isinstance(cultivo, Arbol) else 0.0)
+        campos = CAMPOS_ATRIBUTO_POR_ESPECIE[especie]
+        self._atributo.append(self._internar(descriptor.get_valores(campos)))
+
+    def extend(self, cultivos: Iterable['Cultivo']) -> None:
+        """Agrega varios cultivos."""
+        for cultivo in cultivos:
+            self.append(cultivo)
+
+    def extend_repetido(self, cultivo: 'Cultivo', cantidad: int) -> None:
+        """Agrega `cantidad` filas idénticas a `cultivo` extendiendo cada columna de una vez."""
+        if cantidad <= 0:
+            return
+        inicio = len(self)
+        self.append(cultivo)
+        for columna in (self._especie, self._agua, self._superficie,
+                        self._altura, self._atributo):
+            columna.extend(columna[inicio:inicio + 1] * (cantidad - 1))
+        if self._filas_por_especie is not None:
+            self._filas(EspecieCultivo(self._especie[inicio])).extend(range(inicio + 1, inicio + cantidad))
+
+    def __delitem__(self, indice: int) -> None:
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("indice de cultivo fuera de rango")
+        especie = EspecieCultivo(self._especie[indice])
+        for columna in (self._especie, self._agua, self._superficie,
+                        self._altura, self._atributo):
+            del columna[indice]
+        if self._filas_por_especie is not None:
+            filas = self._filas_por_especie[especie]
+            del filas[bisect_left(filas, indice)]
+            # Las filas posteriores se desplazan una posición
+            for filas in self._filas_por_especie.values():
+                desde = bisect_right(filas, indice)
+                if desde < len(filas):
+                    filas[desde:] = array('L', [fila - 1 for fila in filas[desde:]])
+
+    def remove(self, cultivo: 'Cultivo') -> None:
+        """
+        Quita la fila de una vista de este almacén.
+
+        Las vistas de filas posteriores quedan desplazadas una posición.
+
+        Raises:
+            ValueError: Si el cultivo no es una vista de este almacén
+        """
+        if getattr(cultivo, '_almacen', None) is not self:
+            raise ValueError("El cultivo no pertenece a este almacén")
+        del self[cultivo.get_indice()]
+
+    def quitar_filas(self, filas: Iterable[int]) -> None:
+        """
+        Quita varias filas en una sola pasada por columna.
+
+        A diferencia de borrar fila por fila, el costo no crece con la
+        cantidad de filas quitadas. Las vistas existentes quedan desplazadas.
+        """
+        quitar = set(filas)
+        if not quitar:
+            return
+        conservar = [i for i in range(len(self)) if i not in quitar]
+        for nombre in ('_especie', '_agua', '_superficie', '_altura', '_atributo'):
+            columna = getattr(self, nombre)
+            setattr(self, nombre, array(columna.typecode, [columna[i] for i in conservar]))
+        if self._filas_por_especie is not None:
+            quitadas = sorted(quitar)
+            for filas in self._filas_por_especie.values():
+                # Las filas anteriores a la primera quitada no cambian
+                desde = bisect_left(filas, quitadas[0])
+                if desde < len(filas):
+                    filas[desde:] = array('L', [fila - bisect_left(quitadas, fila)
+                                                for fila in filas[desde:] if fila not in quitar])
+
+    def copy(self) -> List['Cultivo']:
+        """Lista de vistas (mismo contrato que list.copy sobre get_cultivos)."""
+        return list(self)
+
+    # ------------------------------------------------------------------
+    # Acceso por fila (usado por las vistas)
+    # ------------------------------------------------------------------
+    def get_plantacion(self) -> 'Plantacion':
+        return self._plantacion
+
+    def _vista(self, indice: int) -> 'Cultivo':
+        return VISTAS_POR_ESPECIE[self._especie[indice]](self, indice)
+
+    def _filas(self, especie: EspecieCultivo) -> array:
+        filas = self._filas_por_especie.get(especie)
+        if filas is None:
+            filas = self._filas_por_especie[especie] = array('L')
+        return filas
+
+    def _indice_especies(self) -> Dict[EspecieCultivo, array]:
+        if self._filas_por_especie is None:
+            self._filas_por_especie = {}
+            for fila, codigo in enumerate(self._especie):
+                self._filas(EspecieCultivo(codigo)).append(fila)
+        return self._filas_por_especie
+
+    def especies_presentes(self) -> List[EspecieCultivo]:
+        """Especies con al menos una fila."""
+        return [especie for especie, filas in self._indice_especies().items() if filas]
+
+    def filas_de_especie(self, especie: EspecieCultivo) -> array:
+        """Índices de fila de una especie, en orden (no debe modificarse)."""
+        return self._indice_especies().get(especie, array('L'))
+
+    def cultivos_de_especie(self, especie: EspecieCultivo) -> List['Cultivo']:
+        """Vistas de las filas de una especie."""
+        vista = VISTAS_POR_ESPECIE[especie]
+        return [vista(self, fila) for fila in self.filas_de_especie(especie)]
+
+    def escribir_columna(self, nombre: str, indice: int, valor) -> None:
+        """Escribe un valor en la columna `nombre` para la fila indicada."""
+        getattr(self, nombre)[indice] = valor
+
+    def leer_atributos(self, indice: int) -> Tuple:
+        """Tupla de atributos propios de la especie para la fila."""
+        return self._atributos[self._atributo[indice]]
+
+    def escribir_atributo(self, indice: int, posicion: int, valor) -> None:
+        """Reemplaza un atributo de la fila, reinternando la tupla resultante."""
+        actual = list(self.leer_atributos(indice))
+        actual[posicion] = valor
+        self._atributo[indice] = self._internar(tuple(actual))
+
+    def _internar(self, atributos: Tuple) -> int:
+        codigo = self._codigos_atributo.get(atributos)
+        if codigo is None:
+            codigo = len(self._atributos)
+            self._atributos.append(atributos)
+            self._codigos_atributo[atributos] = codigo
+        return codigo
+
+    # ------------------------------------------------------------------
+    # Acceso a columnas completas (operaciones masivas)
+    # ------------------------------------------------------------------
+    def get_especies(self) -> array:
+        return self._especie
+
+    def get_aguas(self) -> array:
+        return self._agua
+
+    def get_superficies(self) -> array:
+        return self._superficie
+
+    def get_alturas(self) -> array:
+        return self._altura
+
+    def get_atributos(self) -> List[Tuple]:
+        """Tabla de tuplas de atributos internadas (código -> tupla)."""
+        return self._atributos
+
+    def exportar_columnas(self, inicio: int, fin: int) -> Tuple[array, ...]:
+        """
+        Copia de las filas [inicio, fin) de cada columna.
+
+        Returns:
+            (especie, agua, superficie, altura, atributo); los códigos de
+            atributo refieren a get_atributos()
+        """
+        return tuple(columna[inicio:fin] for columna in
+                     (self._especie, self._agua, self._superficie,
+                      self._altura, self._atributo))
+
+    def importar_columnas(self, columnas: Tuple[array, ...],
+                          atributos: List[Tuple]) -> None:
+        """
+        Agrega filas exportadas con exportar_columnas.
+
+        Args:
+            columnas: (especie, agua, superficie, altura, atributo)
+            atributos: Tabla de atributos a la que refieren los códigos
+        """
+        especie, agua, superficie, altura, atributo = columnas
+        inicio = len(self)
+        # Remapea los códigos de atributo a la tabla de este almacén
+        codigos = [self._internar(tuple(t)) for t in atributos]
+        self._especie.extend(especie)
+        self._agua.extend(agua)
+        self._superficie.extend(superficie)
+        self._altura.extend(altura)
+        self._atributo.extend(array('I', [codigos[c] for c in atributo]))
+        if self._filas_por_especie is not None:
+            especies = list(EspecieCultivo)
+            for fila, codigo in enumerate(especie, inicio):
+                self._filas(especies[codigo]).append(fila)
+
+    def calcular_superficie_ocupada(self) -> float:
+        """Suma de superficies recorriendo sólo la columna contigua."""
+        return sum(self._superficie)
+
+    def contar_por_especie(self) -> Dict[EspecieCultivo, int]:
+        """Cantidad de filas por especie (sólo especies presentes)."""
+        return {especie: len(filas)
+                for especie, filas in self._indice_especies().items() if filas}
+
+    def sumar_por_especie(self, columna: str,
+                          incrementos: Mapping[EspecieCultivo, float]) -> None:
+        """
+        Suma a cada fila de `columna` el incremento de su especie.
+
+        Equivale a `fila = fila + incremento` fila por fila (mismo resultado
+        en punto flotante), pero en una sola pasada sobre memoria contigua.
+
+        Args:
+            columna: '_agua' o '_altura'
+            incrementos: Incremento por especie (las ausentes suman 0)
+        """
+        datos = getattr(self, columna)
+        tabla = [0] * len(EspecieCultivo)
+        for especie, incremento in incrementos.items():
+            tabla[especie] = incremento
+        if not any(tabla):
+            return
+
+        if np is not None:
+            vista = np.frombuffer(datos, dtype=datos.typecode)
+            especies = np.frombuffer(self._especie, dtype=np.uint8)
+            vista += np.array(tabla, dtype=vista.dtype)[especies]
+            del vista, especies  # libera el buffer exportado del array
+        else:
+            datos[:] = array(datos.typecode,
+                             [valor + tabla[e] for valor, e in zip(datos, self._especie)])
+
+    def sumar_en_filas(self, columna: str, filas: Iterable[int],
+                       incrementos: Iterable[float]) -> None:
+        """
+        Suma a cada fila indicada de `columna` su propio incremento.
+
+        Args:
+            columna: '_agua' o '_altura'
+            filas: Índices de fila (p. ej. filas_de_especie)
+            incrementos: Incremento de cada fila, en el mismo orden
+        """
+        datos = getattr(self, columna)
+        for fila, incremento in zip(filas, incrementos):
+            datos[fila] = datos[fila] + incremento
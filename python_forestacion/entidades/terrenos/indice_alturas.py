@@ -0,0 +1,201 @@
+# python_forestacion/entidades/terrenos/indice_alturas.py
+"""
+Índice ordenado de alturas de los árboles de una especie.
+"""
+
+import math
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from typing import Iterable, Iterator, List, Optional
+
+
+class IndiceAlturas:
+    """
+    Alturas de una especie, ordenadas, para consultas por rango y percentil.
+
+    Las alturas se guardan en bloques ordenados (arrays de dobles) de a lo
+    sumo 2 * TAMANIO_BLOQUE valores, más la lista del máximo de cada
+    bloque. Ubicar una altura es una búsqueda binaria sobre los máximos y
+    otra dentro del bloque; insertar o quitar mueve sólo los valores de un
+    bloque, no los de toda la especie. Las cantidades acumuladas por
+    bloque se recalculan sólo en la primera consulta tras un cambio, así
+    que contar y seleccionar son logarítmicos mientras no haya altas ni
+    bajas intercaladas.
+
+    Plantacion lo mantiene al día: cada set_altura de un árbol reemplaza
+    su valor, y el crecimiento por lote (igual para toda la especie) se
+    aplica con desplazar, que conserva el orden.
+    """
+
+    TAMANIO_BLOQUE = 512
+
+    def __init__(self, alturas: Iterable[float] = ()):
+        self._construir(sorted(alturas))
+
+    def _construir(self, ordenadas: List[float]) -> None:
+        tamanio = self.TAMANIO_BLOQUE
+        self._bloques: List[array] = [array('d', ordenadas[i:i + tamanio])
+                                      for i in range(0, len(ordenadas), tamanio)]
+        self._maximos: List[float] = [bloque[-1] for bloque in self._bloques]
+        self._cantidad = len(ordenadas)
+        self._acumulados: Optional[List[int]] = None
+
+    def __len__(self) -> int:
+        return self._cantidad
+
+    def __iter__(self) -> Iterator[float]:
+        for bloque in self._bloques:
+            yield from bloque
+
+    # ------------------------------------------------------------------
+    # Actualización
+    # ------------------------------------------------------------------
+    def agregar(self, altura: float) -> None:
+        if not self._bloques:
+            self._bloques.append(array('d', [altura]))
+            self._maximos.append(altura)
+            self._cantidad = 1
+            self._acumulados = None
+            return
+        i = min(bisect_left(self._maximos, altura), len(self._bloques) - 1)
+        bloque = self._bloques[i]
+        insort(bloque, altura)
+        self._maximos[i] = bloque[-1]
+        self._cantidad += 1
+        self._acumulados = None
+        if len(bloque) > 2 * self.TAMANIO_BLOQUE:
+            # Partir el bloque a la mitad mantiene acotado el costo de insertar
+            mitad = len(bloque) // 2
+            self._bloques[i:i + 1] = [bloque[:mitad], bloque[mitad:]]
+            self._maximos[i:i + 1] = [bloque[mitad - 1], bloque[-1]]
+
+    def agregar_varios(self, alturas: Iterable[float]) -> None:
+        """Agrega varias alturas; un lote grande reconstruye los bloques de una vez."""
+        alturas = list(alturas)
+        if len(alturas) > self.TAMANIO_BLOQUE:
+            self._construir(sorted(list(self) + alturas))
+        else:
+            for altura in alturas:
+                self.agregar(altura)
+
+    def quitar(self, altura: float) -> None:
+        """
+        Quita una aparición de `altura`.
+
+        Raises:
+            ValueError: Si la altura no está en el índice
+        """
+        i = bisect_left(self._maximos, altura)
+        if i < len(self._bloques):
+            bloque = self._bloques[i]
+            j = bisect_left(bloque, altura)
+            if j < len(bloque) and bloque[j] == altura:
+                del bloque[j]
+                self._cantidad -= 1
+                self._acumulados = None
+                if bloque:
+                    self._maximos[i] = bloque[-1]
+                else:
+                    del self._bloques[i]
+                    del self._maximos[i]
+                return
+        raise ValueError(f"Altura no indexada: {altura}")
+
+    def reemplazar(self, anterior: float, nueva: float) -> None:
+        """Un árbol pasó de `anterior` a `nueva` metros."""
+        if anterior != nueva:
+            self.quitar(anterior)
+            self.agregar(nueva)
+
+    def desplazar(self, incremento: float) -> None:
+        """
+        Suma `incremento` a todas las alturas.
+
+        La suma en punto flotante es monótona, así que el orden se conserva
+        y no hace falta reordenar; cada valor queda idéntico al del árbol.
+        """
+        if not incremento:
+            return
+        for bloque in self._bloques:
+            bloque[:] = array('d', [altura + incremento for altura in bloque])
+        self._maximos = [bloque[-1] for bloque in self._bloques]
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+    def _get_acumulados(self) -> List[int]:
+        """Cantidad de alturas en los bloques anteriores a cada bloque."""
+        if self._acumulados is None:
+            acumulados = [0]
+            for bloque in self._bloques:
+                acumulados.append(acumulados[-1] + len(bloque))
+            self._acumulados = acumulados
+        return self._acumulados
+
+    def _contar_hasta(self, altura: float, incluir: bool) -> int:
+        """Cantidad de alturas < `altura` (o <= si `incluir`)."""
+        buscar = bisect_right if incluir else bisect_left
+        i = buscar(self._maximos, altura)
+        # Los bloques anteriores a i tienen todos sus valores por debajo del límite
+        cantidad = self._get_acumulados()[i]
+        if i < len(self._bloques):
+            cantidad += buscar(self._bloques[i], altura)
+        return cantidad
+
+    def contar_rango(self, desde: float = -math.inf, hasta: float = math.inf) -> int:
+        """Cantidad de árboles con desde <= altura < hasta."""
+        if hasta <= desde:
+            return 0
+        return self._contar_hasta(hasta, False) - self._contar_hasta(desde, False)
+
+    def contar_mayores(self, altura: float) -> int:
+        """Cantidad de árboles de más de `altura` metros."""
+        return self._cantidad - self._contar_hasta(altura, True)
+
+    def contar_menores(self, altura: float) -> int:
+        """Cantidad de árboles de menos de `altura` metros."""
+        return self._contar_hasta(altura, False)
+
+    def seleccionar(self, posicion: int) -> float:
+        """
+        Altura en la posición `posicion` del orden ascendente.
+
+        Raises:
+            IndexError: Si la posición está fuera de rango
+        """
+        if not 0 <= posicion < self._cantidad:
+            raise IndexError("posición de altura fuera de rango")
+        acumulados = self._get_acumulados()
+        i = bisect_right(acumulados, posicion) - 1
+        return self._bloques[i][posicion - acumulados[i]]
+
+    def percentil(self, porcentaje: float) -> Optional[float]:
+        """
+        Percentil por rango más cercano (p. ej. 50 -> mediana).
+
+        Returns:
+            La altura, o None si no hay árboles
+
+        Raises:
+            ValueError: Si el porcentaje no está entre 0 y 100
+        """
+        if not 0 <= porcentaje <= 100:
+            raise ValueError(f"Porcentaje fuera de rango: {porcentaje}")
+        if not self._cantidad:
+            return None
+        rango = max(math.ceil(porcentaje / 100 * self._cantidad), 1)
+        return self.seleccionar(rango - 1)
+
+    def sumar(self) -> float:
+        """Suma de todas las alturas (bloque por bloque, sin recorrer árboles)."""
+        return sum(sum(bloque) for bloque in self._bloques)
+
+    def get_minimo(self) -> Optional[float]:
+        return self._bloques[0][0] if self._bloques else None
+
+    def get_maximo(self) -> Optional[float]:
+        return self._maximos[-1] if self._maximos else None
+
+    def __repr__(self) -> str:
+        return (f"IndiceAlturas(cantidad={self._cantidad}, "
+                f"minimo={self.get_minimo()}, maximo={self.get_maximo()})")
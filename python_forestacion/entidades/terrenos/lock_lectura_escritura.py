@@ -0,0 +1,155 @@
+# python_forestacion/entidades/terrenos/lock_lectura_escritura.py
+"""
+Lock de lectores/escritor para las plantaciones compartidas entre hilos.
+"""
+
+import threading
+
+
+class _Contexto:
+    """Adaptador para usar un par adquirir/liberar con `with`."""
+
+    __slots__ = ('_adquirir', '_liberar')
+
+    def __init__(self, adquirir, liberar):
+        self._adquirir = adquirir
+        self._liberar = liberar
+
+    def __enter__(self) -> None:
+        self._adquirir()
+
+    def __exit__(self, *excepcion) -> None:
+        self._liberar()
+
+
+class LockLecturaEscritura:
+    """
+    Muchos lectores o un escritor a la vez.
+
+    - Alternancia: cuando un escritor espera, no entran lectores nuevos (un
+      riego no queda postergado por consultas que se solapan), y cuando un
+      escritor termina, los lectores que esperaban entran antes que el
+      próximo escritor (riegos seguidos no dejan sin turno a las consultas).
+    - Reentrante: el escritor puede volver a tomar la escritura o tomar la
+      lectura (un servicio que ya tiene la plantación bloqueada llama a
+      métodos que también la bloquean), y un lector puede volver a leer.
+    - Pasar de lectura a escritura en el mismo hilo no está permitido: dos
+      lectores que lo intentaran a la vez se esperarían mutuamente.
+
+    Uso:
+        with lock.lectura():
+            ...
+        with lock.escritura():
+            ...
+    """
+
+    def __init__(self):
+        self._condicion = threading.Condition(threading.Lock())
+        self._lectores = 0
+        self._escritor = None
+        self._profundidad_escritura = 0
+        self._escritores_esperando = 0
+        self._lectores_esperando = 0
+        # Tras una escritura, los lectores que esperaban pasan primero
+        self._turno_lectores = False
+        # Lecturas tomadas por cada hilo (para la reentrada de lectores)
+        self._local = threading.local()
+        self._contexto_lectura = _Contexto(self.adquirir_lectura, self.liberar_lectura)
+        self._contexto_escritura = _Contexto(self.adquirir_escritura, self.liberar_escritura)
+
+    def lectura(self) -> _Contexto:
+        return self._contexto_lectura
+
+    def escritura(self) -> _Contexto:
+        return self._contexto_escritura
+
+    # Reentrada del escritor sin tomar la condición: sólo el hilo dueño puede
+    # hacer que _escritor sea su propio ident, así que compararlo es seguro.
+
+    def adquirir_lectura(self) -> None:
+        ident = threading.get_ident()
+        if self._escritor == ident:
+            # El escritor lee lo que ya tiene bloqueado
+            self._profundidad_escritura += 1
+            return
+        with self._condicion:
+            propias = getattr(self._local, 'lecturas', 0)
+            if not propias:
+                self._lectores_esperando += 1
+                try:
+                    self._condicion.wait_for(
+                        lambda: self._escritor is None
+                        and (self._turno_lectores or not self._escritores_esperando)
+                    )
+                finally:
+                    self._lectores_esperando -= 1
+                    if not self._lectores_esperando:
+                        self._turno_lectores = False
+            self._local.lecturas = propias + 1
+            self._lectores += 1
+
+    def liberar_lectura(self) -> None:
+        if self._escritor == threading.get_ident():
+            self._liberar_escritura_propia()
+            return
+        with self._condicion:
+            propias = getattr(self._local, 'lecturas', 0)
+            if not propias:
+                raise RuntimeError("liberar_lectura sin una lectura tomada")
+            self._local.lecturas = propias - 1
+            self._lectores -= 1
+            if not self._lectores:
+                self._condicion.notify_all()
+
+    def adquirir_escritura(self) -> None:
+        """
+        Raises:
+            RuntimeError: Si el hilo tiene tomada una lectura
+        """
+        ident = threading.get_ident()
+        if self._escritor == ident:
+            self._profundidad_escritura += 1
+            return
+        with self._condicion:
+            if getattr(self._local, 'lecturas', 0):
+                raise RuntimeError("No se puede pasar de lectura a escritura en el mismo hilo")
+            self._escritores_esperando += 1
+            try:
+                self._condicion.wait_for(
+                    lambda: self._escritor is None and not self._lectores
+                    and not self._turno_lectores
+                )
+            finally:
+                self._escritores_esperando -= 1
+            self._escritor = ident
+            self._profundidad_escritura = 1
+
+    def liberar_escritura(self) -> None:
+        if self._escritor != threading.get_ident():
+            raise RuntimeError("liberar_escritura desde un hilo que no escribe")
+        self._liberar_escritura_propia()
+
+    def _liberar_escritura_propia(self) -> None:
+        if self._profundidad_escritura > 1:
+            self._profundidad_escritura -= 1
+            return
+        with self._condicion:
+            self._profundidad_escritura = 0
+            self._escritor = None
+            self._turno_lectores = self._lectores_esperando > 0
+            self._condicion.notify_all()
+
+
+class LockNulo:
+    """Misma interfaz que LockLecturaEscritura, sin bloquear (plantaciones de un solo hilo)."""
+
+    _CONTEXTO = _Contexto(lambda: None, lambda: None)
+
+    def lectura(self) -> _Contexto:
+        return self._CONTEXTO
+
+    def escritura(self) -> _Contexto:
+        return self._CONTEXTO
+
+
+LOCK_NULO = LockNulo()
@@ -3,7 +3,21 @@
 Entidad Plantacion - Conjunto de cultivos.
 """
 
-from typing import List, TYPE_CHECKING
+import math
+from itertools import islice
+from typing import Dict, List, Mapping, Type, TYPE_CHECKING
+
+from python_forestacion.entidades.cultivos.arbol import Arbol
+from python_forestacion.entidades.cultivos.especie_cultivo import EspecieCultivo
+from python_forestacion.entidades.terrenos.almacen_columnar import AlmacenColumnar
+from python_forestacion.entidades.terrenos.indice_alturas import IndiceAlturas
+from python_forestacion.entidades.terrenos.lock_lectura_escritura import (
+    LOCK_NULO,
+    LockLecturaEscritura
+)
+from python_forestacion.excepciones.forestacion_exception import ForestacionException
+from python_forestacion.excepciones.mensajes_exception import MensajesException
+from python_forestacion.constantes import VERIFICAR_SUPERFICIE_OCUPADA
 
 if TYPE_CHECKING:
     from python_forestacion.entidades.cultivos.cultivo import Cultivo
@@ -11,14 +25,109 @@ if TYPE_CHECKING:
 
 
 class Plantacion:
-    """Representa una plantación agrícola."""
+    """
+    Representa una plantación agrícola.
+
+    Con `columnar=True` los cultivos se guardan en un AlmacenColumnar
+    (arrays tipados) en lugar de una lista de objetos; get_cultivos()
+    sigue devolviendo una secuencia de cultivos (vistas por fila).
+
+    La superficie ocupada se mantiene como un contador incremental
+    (alta, baja y set_superficie de cada cultivo), de modo que
+    calcular_superficie_disponible() es O(1).
+
+    Además mantiene un índice por especie, de modo que las consultas por
+    tipo (cosecha, conteo, superficie) recorren sólo los cultivos que
+    coinciden y no toda la plantación.
+    
+    Las alturas de los árboles pueden consultarse por rango y percentil
+    con get_indice_alturas: el índice de cada especie se arma la primera
+    vez que se pide y desde entonces se actualiza con cada alta, baja,
+    set_altura y crecimiento por lote.
     
-    def __init__(self, nombre: str, superficie: float):
+    Con `concurrente=True` (o set_concurrente) la plantación puede
+    compartirse entre hilos: cada alta, baja, cambio de agua, superficie o
+    altura toma la escritura de un LockLecturaEscritura, y las consultas
+    que recorren los cultivos toman la lectura. Las operaciones compuestas
+    (p. ej. leer el agua disponible, regar y descontarla) se encierran en
+    modificando(); quien recorra get_cultivos() o un índice de alturas
+    mientras otros hilos modifican la plantación debe hacerlo dentro de
+    leyendo(). Sin concurrencia el lock es un LockNulo y no cuesta nada.
+    """
+    
+    def __init__(self, nombre: str, superficie: float, columnar: bool = False,
+                 concurrente: bool = False):
         self._nombre = nombre
         self._superficie_total = superficie
-        self._cultivos: List['Cultivo'] = []
+        self._cultivos: List['Cultivo'] = AlmacenColumnar(self) if columnar else []
         self._trabajadores: List['Trabajador'] = []
         self._agua_disponible = 0
+        self._superficie_ocupada = 0.0
+        self._verificar_superficie = VERIFICAR_SUPERFICIE_OCUPADA
+        # Índice tipo exacto -> cultivos, en orden de plantación (modo objetos)
+        self._indice_especies: Dict[type, List['Cultivo']] = {}
+        # Índices de alturas por especie de árbol, sólo de las especies consultadas
+        self._indices_altura: Dict[EspecieCultivo, IndiceAlturas] = {}
+        self._lock = LockLecturaEscritura() if concurrente else LOCK_NULO
+    
+    def __getstate__(self) -> dict:
+        # El índice es derivable: no se persiste y se reconstruye al leer.
+        # El lock tampoco: compartir entre hilos se decide en ejecución.
+        estado = self.__dict__.copy()
+        estado.pop('_indice_especies', None)
+        estado.pop('_indices_altura', None)
+        estado.pop('_lock', None)
+        return estado
+    
+    def __setstate__(self, estado: dict) -> None:
+        """
+        Restaura desde pickle, completando el contador en registros antiguos.
+        
+        Los cultivos se serializan sin su plantación, así que aquí se vuelven
+        a vincular y se reconstruye el índice por especie.
+        """
+        self.__dict__.update(estado)
+        if '_superficie_ocupada' not in estado:
+            self._verificar_superficie = VERIFICAR_SUPERFICIE_OCUPADA
+            self._superficie_ocupada = self._sumar_superficies()
+        self._indice_especies = {}
+        self._indices_altura = {}
+        self._lock = LOCK_NULO
+        if not self.es_columnar():
+            for cultivo in self._cultivos:
+                cultivo._plantacion = self
+            self._indexar(self._cultivos)
+    
+    def es_concurrente(self) -> bool:
+        return self._lock is not LOCK_NULO
+    
+    def set_concurrente(self, concurrente: bool) -> None:
+        """
+        Activa o desactiva el bloqueo entre hilos.
+        
+        Debe llamarse antes de compartir la plantación (o después de que
+        los demás hilos dejaron de usarla), no mientras otro hilo la usa.
+        """
+        if concurrente != self.es_concurrente():
+            self._lock = LockLecturaEscritura() if concurrente else LOCK_NULO
+    
+    def leyendo(self):
+        """
+        Contexto de lectura: ningún hilo modifica la plantación mientras dura.
+        
+        Uso:
+            with plantacion.leyendo():
+                total = sum(c.get_agua() for c in plantacion.get_cultivos())
+        """
+        return self._lock.lectura()
+    
+    def modificando(self):
+        """
+        Contexto de escritura exclusiva, para operaciones compuestas.
+        
+        Es reentrante: dentro pueden llamarse los métodos de la plantación.
+        """
+        return self._lock.escritura()
     
     def get_nombre(self) -> str:
         return self._nombre
@@ -30,22 +139,311 @@ class Plantacion:
         return self._cultivos
     
     def add_cultivo(self, cultivo: 'Cultivo') -> None:
-        self._cultivos.append(cultivo)
+        with self._lock.escritura():
+            self._cultivos.append(cultivo)
+            if not self.es_columnar():
+                cultivo._plantacion = self
+                self._indice_especies.setdefault(type(cultivo), []).append(cultivo)
+            self._superficie_ocupada += cultivo.get_superficie()
+            if self._indices_altura:
+                self._indexar_alturas([cultivo])
+    
+    def add_cultivos(self, cultivos: List['Cultivo']) -> None:
+        """Agrega varios cultivos en una sola operación."""
+        with self._lock.escritura():
+            self._cultivos.extend(cultivos)
+            if not self.es_columnar():
+                for cultivo in cultivos:
+                    cultivo._plantacion = self
+                self._indexar(cultivos)
+            self._superficie_ocupada += sum(c.get_superficie() for c in cultivos)
+            if self._indices_altura:
+                self._indexar_alturas(cultivos)
+    
+    def add_cultivo_repetido(self, modelo: 'Cultivo', cantidad: int) -> None:
+        """
+        Agrega `cantidad` filas con el estado de `modelo` (sólo modo columnar).
+        
+        Raises:
+            ValueError: Si la plantación no es columnar
+        """
+        if not self.es_columnar():
+            raise ValueError("add_cultivo_repetido requiere una plantación columnar")
+        with self._lock.escritura():
+            self._cultivos.extend_repetido(modelo, cantidad)
+            self._superficie_ocupada += modelo.get_superficie() * cantidad
+            indice = self._indices_altura.get(EspecieCultivo.de_cultivo(modelo))
+            if indice is not None:
+                indice.agregar_varios([modelo.get_altura()] * cantidad)
+    
+    def add_columnas(self, columnas: tuple, atributos: List[tuple]) -> None:
+        """
+        Agrega filas exportadas con AlmacenColumnar.exportar_columnas (sólo modo columnar).
+        
+        Raises:
+            ValueError: Si la plantación no es columnar
+        """
+        if not self.es_columnar():
+            raise ValueError("add_columnas requiere una plantación columnar")
+        with self._lock.escritura():
+            self._cultivos.importar_columnas(columnas, atributos)
+            self._superficie_ocupada += sum(columnas[2])
+            # Lote arbitrario de filas: los índices de alturas se rearman al consultarlos
+            self._indices_altura.clear()
+    
+    def remove_cultivo(self, cultivo: 'Cultivo') -> None:
+        """
+        Quita un cultivo de la plantación.
+
+        Raises:
+            ValueError: Si el cultivo no pertenece a la plantación
+        """
+        with self._lock.escritura():
+            superficie = cultivo.get_superficie()
+            altura = cultivo.get_altura() if self._indices_altura and isinstance(cultivo, Arbol) else None
+            self._cultivos.remove(cultivo)
+            if not self.es_columnar():
+                cultivo._plantacion = None
+                grupo = self._indice_especies[type(cultivo)]
+                grupo.remove(cultivo)
+                if not grupo:
+                    del self._indice_especies[type(cultivo)]
+            self._superficie_ocupada -= superficie
+            if altura is not None:
+                self._quitar_alturas(EspecieCultivo.de_cultivo(cultivo), [altura])
+    
+    def retirar_cultivos(self, tipo: Type['Cultivo'], cantidad: int) -> List['Cultivo']:
+        """
+        Quita los primeros `cantidad` cultivos de la especie `tipo` (en orden de plantación).
+        
+        Hace una sola pasada, sin importar cuántos se quiten. En modo objetos
+        la pasada llega sólo hasta el último retirado: como son los primeros
+        de su especie, el resto de la lista se desplaza sin recorrerse. En
+        modo columnar devuelve copias independientes de las filas.
+        
+        Returns:
+            Cultivos retirados (menos de `cantidad` si no hay suficientes)
+        """
+        with self._lock.escritura():
+            if self.es_columnar():
+                especie = EspecieCultivo.de_clase(tipo)
+                filas = self._cultivos.filas_de_especie(especie)[:cantidad]
+                retirados = [self._cultivos[fila].clonar() for fila in filas]
+                self._cultivos.quitar_filas(filas)
+            else:
+                grupo = self._indice_especies.get(tipo, [])
+                retirados = grupo[:cantidad]
+                if not retirados:
+                    return []
+                ids = {id(cultivo) for cultivo in retirados}
+                fin = self._fin_de_retirados(ids)
+                self._cultivos[:fin] = [c for c in islice(self._cultivos, fin) if id(c) not in ids]
+                del grupo[:len(retirados)]
+                if not grupo:
+                    del self._indice_especies[tipo]
+                for cultivo in retirados:
+                    cultivo._plantacion = None
+            self._superficie_ocupada -= sum(c.get_superficie() for c in retirados)
+            if retirados and issubclass(tipo, Arbol):
+                self._quitar_alturas(EspecieCultivo.de_clase(tipo), [c.get_altura() for c in retirados])
+            return retirados
+    
+    def _fin_de_retirados(self, ids: set) -> int:
+        """Posición siguiente al último cultivo de `ids` en la lista (modo objetos)."""
+        pendientes = len(ids)
+        for posicion, cultivo in enumerate(self._cultivos, 1):
+            if id(cultivo) in ids:
+                pendientes -= 1
+                if not pendientes:
+                    return posicion
+        return len(self._cultivos)
+    
+    def _indexar(self, cultivos: List['Cultivo']) -> None:
+        indice = self._indice_especies
+        for cultivo in cultivos:
+            tipo = type(cultivo)
+            grupo = indice.get(tipo)
+            if grupo is None:
+                grupo = indice[tipo] = []
+            grupo.append(cultivo)
+    
+    def crecer_arboles(self, crecimiento: Mapping[EspecieCultivo, float]) -> None:
+        """
+        Suma a cada árbol el crecimiento de su especie (crecimiento por lote).
+        
+        Equivale a set_altura(get_altura() + crecimiento) árbol por árbol,
+        pero los índices de alturas se desplazan una vez por especie en
+        lugar de actualizarse por cada árbol.
+        
+        Args:
+            crecimiento: Metros por árbol, por especie (las ausentes no crecen)
+        """
+        with self._lock.escritura():
+            if self.es_columnar():
+                self._cultivos.sumar_por_especie('_altura', crecimiento)
+            else:
+                for especie, metros in crecimiento.items():
+                    if metros:
+                        for cultivo in self._indice_especies.get(especie.get_clase(), ()):
+                            cultivo._altura = cultivo._altura + metros
+            for especie, metros in crecimiento.items():
+                indice = self._indices_altura.get(especie)
+                if indice is not None:
+                    indice.desplazar(metros)
+    
+    def get_indice_alturas(self, tipo: Type['Arbol']) -> IndiceAlturas:
+        """
+        Índice ordenado de alturas de una especie de árbol (Pino, Olivo).
+        
+        Se arma en la primera consulta y la plantación lo mantiene al día;
+        no debe modificarse desde afuera.
+        
+        Raises:
+            ValueError: Si `tipo` no es una especie de árbol
+        """
+        especie = EspecieCultivo.de_clase(tipo)
+        if not issubclass(especie.get_clase(), Arbol):
+            raise ValueError(f"{tipo.__name__} no es una especie de árbol")
+        with self._lock.lectura():
+            indice = self._indices_altura.get(especie)
+            if indice is None:
+                if self.es_columnar():
+                    alturas = self._cultivos.get_alturas()
+                    indice = IndiceAlturas(map(alturas.__getitem__, self._cultivos.filas_de_especie(especie)))
+                else:
+                    indice = IndiceAlturas(c.get_altura() for c in
+                                           self._indice_especies.get(especie.get_clase(), ()))
+                # Dos lectores pueden armarlo a la vez: queda uno solo
+                indice = self._indices_altura.setdefault(especie, indice)
+            return indice
+    
+    def _indexar_alturas(self, cultivos: List['Cultivo']) -> None:
+        por_especie: Dict[EspecieCultivo, List[float]] = {}
+        for cultivo in cultivos:
+            if isinstance(cultivo, Arbol):
+                por_especie.setdefault(EspecieCultivo.de_cultivo(cultivo), []).append(cultivo.get_altura())
+        for especie, alturas in por_especie.items():
+            indice = self._indices_altura.get(especie)
+            if indice is not None:
+                indice.agregar_varios(alturas)
+    
+    def _quitar_alturas(self, especie: EspecieCultivo, alturas: List[float]) -> None:
+        indice = self._indices_altura.get(especie)
+        if indice is not None:
+            for altura in alturas:
+                indice.quitar(altura)
+    
+    def _altura_modificada(self, cultivo: 'Arbol', anterior: float, nueva: float) -> None:
+        """Notificación de un árbol propio que cambió su altura."""
+        with self._lock.escritura():
+            if self._indices_altura:
+                indice = self._indices_altura.get(EspecieCultivo.de_cultivo(cultivo))
+                if indice is not None:
+                    indice.reemplazar(anterior, nueva)
+    
+    def agrupar_por_tipo(self) -> Dict[type, List['Cultivo']]:
+        """
+        Cultivos agrupados por tipo exacto, sin recorrer la plantación.
+        
+        Las listas devueltas no deben modificarse.
+        """
+        with self._lock.lectura():
+            if self.es_columnar():
+                return {especie.get_clase(): self._cultivos.cultivos_de_especie(especie)
+                        for especie in self._cultivos.especies_presentes()}
+            return dict(self._indice_especies)
+    
+    def get_cultivos_por_tipo(self, tipo: Type['Cultivo']) -> List['Cultivo']:
+        """
+        Cultivos que son instancia de `tipo` (acepta clases base, p. ej. Arbol).
+        
+        El costo es proporcional a los cultivos que coinciden. Dentro de cada
+        especie se respeta el orden de plantación.
+        """
+        with self._lock.lectura():
+            if self.es_columnar():
+                resultado = []
+                for especie in self._cultivos.especies_presentes():
+                    if issubclass(especie.get_clase(), tipo):
+                        resultado.extend(self._cultivos.cultivos_de_especie(especie))
+                return resultado
+            resultado = []
+            for tipo_exacto, grupo in self._indice_especies.items():
+                if issubclass(tipo_exacto, tipo):
+                    resultado.extend(grupo)
+            return resultado
+    
+    def contar_por_tipo(self, tipo: Type['Cultivo']) -> int:
+        """Cantidad de cultivos que son instancia de `tipo`, sin recorrerlos."""
+        with self._lock.lectura():
+            if self.es_columnar():
+                return sum(len(self._cultivos.filas_de_especie(especie))
+                           for especie in self._cultivos.especies_presentes()
+                           if issubclass(especie.get_clase(), tipo))
+            return sum(len(grupo) for tipo_exacto, grupo in self._indice_especies.items()
+                       if issubclass(tipo_exacto, tipo))
+    
+    def calcular_superficie_por_tipo(self, tipo: Type['Cultivo']) -> float:
+        """Superficie ocupada por los cultivos que son instancia de `tipo`."""
+        with self._lock.lectura():
+            if self.es_columnar():
+                superficies = self._cultivos.get_superficies()
+                return sum(superficies[fila]
+                           for especie in self._cultivos.especies_presentes()
+                           if issubclass(especie.get_clase(), tipo)
+                           for fila in self._cultivos.filas_de_especie(especie))
+            return sum(c.get_superficie() for c in self.get_cultivos_por_tipo(tipo))
+    
+    def es_columnar(self) -> bool:
+        return isinstance(self._cultivos, AlmacenColumnar)
     
     def get_trabajadores(self) -> List['Trabajador']:
         return self._trabajadores
     
     def add_trabajador(self, trabajador: 'Trabajador') -> None:
-        if trabajador not in self._trabajadores:
-            self._trabajadores.append(trabajador)
+        with self._lock.escritura():
+            if trabajador not in self._trabajadores:
+                self._trabajadores.append(trabajador)
     
     def get_agua_disponible(self) -> int:
         return self._agua_disponible
     
     def set_agua_disponible(self, agua: int) -> None:
-        self._agua_disponible = agua
+        with self._lock.escritura():
+            self._agua_disponible = agua
+    
+    def get_superficie_ocupada(self) -> float:
+        return self._superficie_ocupada
+    
+    def set_verificar_superficie(self, verificar: bool) -> None:
+        """Activa el modo depuración que contrasta el contador con la suma completa."""
+        self._verificar_superficie = verificar
+    
+    def _superficie_modificada(self, anterior: float, nueva: float) -> None:
+        """Notificación de un cultivo propio que cambió su superficie."""
+        with self._lock.escritura():
+            self._superficie_ocupada += nueva - anterior
+    
+    def _sumar_superficies(self) -> float:
+        if self.es_columnar():
+            return self._cultivos.calcular_superficie_ocupada()
+        return sum(c.get_superficie() for c in self._cultivos)
     
     def calcular_superficie_disponible(self) -> float:
-        """Calcula superficie no ocupada por cultivos."""
-        superficie_ocupada = sum(c.get_superficie() for c in self._cultivos)
-        return self._superficie_total - superficie_ocupada
\ No newline at end of file
+        """
+        Calcula superficie no ocupada por cultivos.
+
+        Raises:
+            ForestacionException: En modo verificación, si el contador
+                incremental no coincide con la suma completa
+        """
+        with self._lock.lectura():
+            if self._verificar_superficie:
+                suma = self._sumar_superficies()
+                if not math.isclose(suma, self._superficie_ocupada, abs_tol=1e-6):
+                    raise ForestacionException(
+                        MensajesException.ERROR_DESCONOCIDO_USUARIO,
+                        f"{MensajesException.SUPERFICIE_INCONSISTENTE_TECNICO}: "
+                        f"contador={self._superficie_ocupada}m², suma={suma}m²"
+                    )
+            return self._superficie_total - self._superficie_ocupada
@@ -0,0 +1,220 @@
+# python_forestacion/entidades/terrenos/plantacion_stats.py
+"""
+Estadísticas agregadas de una plantación, calculadas en una sola pasada.
+"""
+
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from python_forestacion.entidades.cultivos.arbol import Arbol
+from python_forestacion.entidades.cultivos.especie_cultivo import EspecieCultivo
+from python_forestacion.constantes import INTERVALO_HISTOGRAMA_ALTURA
+
+if TYPE_CHECKING:
+    from python_forestacion.entidades.terrenos.indice_alturas import IndiceAlturas
+    from python_forestacion.entidades.terrenos.plantacion import Plantacion
+
+
+class DistribucionAlturas:
+    """
+    Distribución de alturas de los árboles de una especie.
+
+    Guarda mínimo, máximo, suma y un histograma de intervalos de ancho
+    fijo, de modo que agregar una altura es O(1) y no se conservan las
+    alturas individuales.
+    """
+
+    def __init__(self, intervalo: float = INTERVALO_HISTOGRAMA_ALTURA):
+        self._intervalo = intervalo
+        self._cantidad = 0
+        self._suma = 0.0
+        self._minimo = float('inf')
+        self._maximo = float('-inf')
+        self._histograma: Dict[int, int] = {}
+
+    def agregar(self, altura: float) -> None:
+        self._cantidad += 1
+        self._suma += altura
+        if altura < self._minimo:
+            self._minimo = altura
+        if altura > self._maximo:
+            self._maximo = altura
+        clase = int(altura // self._intervalo)
+        self._histograma[clase] = self._histograma.get(clase, 0) + 1
+
+    @staticmethod
+    def desde_indice(indice: 'IndiceAlturas',
+                     intervalo: float = INTERVALO_HISTOGRAMA_ALTURA) -> 'DistribucionAlturas':
+        """
+        Distribución de las alturas de un índice ordenado, sin recorrerlas una por una.
+
+        Mínimo y máximo son los extremos del índice y cada intervalo no
+        vacío del histograma sale de una búsqueda binaria, así que el costo
+        depende de la cantidad de intervalos y no de la de árboles.
+        """
+        distribucion = DistribucionAlturas(intervalo)
+        cantidad = len(indice)
+        if not cantidad:
+            return distribucion
+        distribucion._cantidad = cantidad
+        distribucion._suma = indice.sumar()
+        distribucion._minimo = indice.get_minimo()
+        distribucion._maximo = indice.get_maximo()
+        posicion = 0
+        while posicion < cantidad:
+            clase = int(indice.seleccionar(posicion) // intervalo)
+            fin = max(indice.contar_menores((clase + 1) * intervalo), posicion + 1)
+            # En el borde, el redondeo de (clase + 1) * intervalo puede no coincidir
+            # con la división entera de agregar: se corrige de a un valor repetido
+            while fin < cantidad and int(indice.seleccionar(fin) // intervalo) == clase:
+                fin = cantidad - indice.contar_mayores(indice.seleccionar(fin))
+            while fin - 1 > posicion and int(indice.seleccionar(fin - 1) // intervalo) > clase:
+                fin = indice.contar_menores(indice.seleccionar(fin - 1))
+            distribucion._histograma[clase] = fin - posicion
+            posicion = fin
+        return distribucion
+
+    def get_cantidad(self) -> int:
+        return self._cantidad
+
+    def get_minimo(self) -> Optional[float]:
+        return self._minimo if self._cantidad else None
+
+    def get_maximo(self) -> Optional[float]:
+        return self._maximo if self._cantidad else None
+
+    def get_media(self) -> Optional[float]:
+        return self._suma / self._cantidad if self._cantidad else None
+
+    def get_histograma(self) -> List[Tuple[float, float, int]]:
+        """Intervalos no vacíos como (desde, hasta, cantidad), ordenados por altura."""
+        return [(clase * self._intervalo, (clase + 1) * self._intervalo, cantidad)
+                for clase, cantidad in sorted(self._histograma.items())]
+
+    def __repr__(self) -> str:
+        return (f"DistribucionAlturas(cantidad={self._cantidad}, "
+                f"minimo={self.get_minimo()}, maximo={self.get_maximo()})")
+
+
+class PlantacionStats:
+    """
+    Resumen de una plantación: cultivos, agua y superficie por especie, y
+    distribución de alturas de los árboles.
+
+    Se obtiene con PlantacionStats.calcular, que recorre los cultivos una
+    sola vez (en modo columnar, sólo las columnas necesarias). Las
+    distribuciones de alturas salen de los índices de alturas de la
+    plantación (Plantacion.get_indice_alturas), que ya están ordenados. Es
+    una foto: no se actualiza si la plantación cambia después.
+    """
+
+    def __init__(self, plantacion: 'Plantacion'):
+        # Usar PlantacionStats.calcular: el constructor sólo copia los datos generales
+        self._nombre = plantacion.get_nombre()
+        self._superficie_total = plantacion.get_superficie_total()
+        self._agua_disponible = plantacion.get_agua_disponible()
+        self._cantidad_trabajadores = len(plantacion.get_trabajadores())
+        self._cantidad: Dict[EspecieCultivo, int] = {}
+        self._agua: Dict[EspecieCultivo, int] = {}
+        self._superficie: Dict[EspecieCultivo, float] = {}
+        self._alturas: Dict[EspecieCultivo, DistribucionAlturas] = {}
+
+    @staticmethod
+    def calcular(plantacion: 'Plantacion') -> 'PlantacionStats':
+        """
+        Calcula las estadísticas de `plantacion` en una pasada.
+
+        En una plantación concurrente la pasada se hace con la lectura
+        tomada, así la foto es consistente aunque otro hilo esté regando.
+        La primera vez arma los índices de alturas de la plantación; desde
+        ahí la plantación los mantiene y las siguientes fotos los reutilizan.
+        """
+        with plantacion.leyendo():
+            stats = PlantacionStats(plantacion)
+            if plantacion.es_columnar():
+                stats._acumular_columnas(plantacion.get_cultivos())
+            else:
+                for tipo, grupo in plantacion.agrupar_por_tipo().items():
+                    stats._acumular_grupo(EspecieCultivo.de_clase(tipo), grupo)
+            for especie in stats._cantidad:
+                if issubclass(especie.get_clase(), Arbol):
+                    stats._alturas[especie] = DistribucionAlturas.desde_indice(
+                        plantacion.get_indice_alturas(especie.get_clase())
+                    )
+        return stats
+
+    def _acumular_grupo(self, especie: EspecieCultivo, cultivos: list) -> None:
+        agua = 0
+        superficie = 0.0
+        for cultivo in cultivos:
+            agua += cultivo.get_agua()
+            superficie += cultivo.get_superficie()
+        self._registrar(especie, len(cultivos), agua, superficie)
+
+    def _acumular_columnas(self, almacen) -> None:
+        aguas = almacen.get_aguas()
+        superficies = almacen.get_superficies()
+        for especie in almacen.especies_presentes():
+            filas = almacen.filas_de_especie(especie)
+            self._registrar(especie, len(filas),
+                            sum(map(aguas.__getitem__, filas)),
+                            sum(map(superficies.__getitem__, filas)))
+
+    def _registrar(self, especie: EspecieCultivo, cantidad: int, agua: int,
+                   superficie: float) -> None:
+        if not cantidad:
+            return
+        self._cantidad[especie] = cantidad
+        self._agua[especie] = agua
+        self._superficie[especie] = superficie
+
+    def get_nombre(self) -> str:
+        return self._nombre
+
+    def get_superficie_total(self) -> float:
+        return self._superficie_total
+
+    def get_agua_disponible(self) -> int:
+        return self._agua_disponible
+
+    def get_cantidad_trabajadores(self) -> int:
+        return self._cantidad_trabajadores
+
+    def get_cantidad_cultivos(self) -> int:
+        return sum(self._cantidad.values())
+
+    def get_cantidad_por_especie(self) -> Dict[EspecieCultivo, int]:
+        """Cultivos por especie (sólo especies presentes, en orden de EspecieCultivo)."""
+        return {especie: self._cantidad[especie] for especie in EspecieCultivo
+                if especie in self._cantidad}
+
+    def get_agua_total(self) -> int:
+        """Litros absorbidos por todos los cultivos."""
+        return sum(self._agua.values())
+
+    def get_agua_media(self) -> float:
+        """Litros promedio por cultivo (0 si la plantación está vacía)."""
+        cantidad = self.get_cantidad_cultivos()
+        return self.get_agua_total() / cantidad if cantidad else 0.0
+
+    def get_agua_por_especie(self) -> Dict[EspecieCultivo, int]:
+        return dict(self._agua)
+
+    def get_superficie_ocupada(self) -> float:
+        return sum(self._superficie.values())
+
+    def get_superficie_disponible(self) -> float:
+        return self._superficie_total - self.get_superficie_ocupada()
+
+    def get_superficie_por_especie(self) -> Dict[EspecieCultivo, float]:
+        return dict(self._superficie)
+
+    def get_distribucion_alturas(self, especie: EspecieCultivo) -> Optional[DistribucionAlturas]:
+        """Distribución de alturas de una especie de árbol (None si no hay ninguno)."""
+        return self._alturas.get(especie)
+
+    def get_distribuciones_alturas(self) -> Dict[EspecieCultivo, DistribucionAlturas]:
+        return dict(self._alturas)
+
+    def __repr__(self) -> str:
+        return (f"PlantacionStats(nombre='{self._nombre}', "
+                f"cultivos={self.get_cantidad_cultivos()}, agua={self.get_agua_total()}L)")
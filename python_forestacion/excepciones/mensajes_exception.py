@@ -15,6 +15,9 @@ class MensajesException:
     SUPERFICIE_INSUFICIENTE_TECNICO = (
         "La superficie requerida excede la disponible en el sistema."
     )
+    SUPERFICIE_INCONSISTENTE_TECNICO = (
+        "El contador de superficie ocupada no coincide con la suma de los cultivos."
+    )
 
     # ==========================================================
     # 💧 Agua
@@ -25,6 +25,10 @@ class PersistenciaException(ForestacionException):
         """Operación de persistencia que produjo el error (ej. 'insertar', 'actualizar', 'eliminar')."""
         return self._operacion
 
+    def __reduce__(self):
+        # Permite reconstruirla al volver de un proceso hijo (pool de persistencia)
+        return (self.__class__, (self._operacion, self._causa))
+
     def __str__(self) -> str:
         """Devuelve una descripción técnica legible del error."""
         return f"PersistenciaException(operacion='{self._operacion}') → {self.mensaje_tecnico}"
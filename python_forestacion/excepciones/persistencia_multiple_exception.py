@@ -0,0 +1,38 @@
+from typing import Dict
+
+from python_forestacion.excepciones.persistencia_exception import PersistenciaException
+
+
+class PersistenciaMultipleException(PersistenciaException):
+    """
+    Excepción que agrupa los errores de una operación sobre varios registros.
+
+    Se lanza una vez procesados todos los archivos, de modo que un archivo
+    dañado no interrumpe la carga o el guardado del resto.
+    """
+
+    def __init__(self, operacion: str, errores: Dict[str, Exception], total: int) -> None:
+        self._errores = errores
+        self._total = total
+        super().__init__(f"{operacion} ({len(errores)} de {total} registros fallaron)")
+        self._operacion = operacion
+
+    def __reduce__(self):
+        return (self.__class__, (self._operacion, self._errores, self._total))
+
+    @property
+    def errores(self) -> Dict[str, Exception]:
+        """Errores por propietario, en el orden en que se produjeron."""
+        return self._errores
+
+    @property
+    def total(self) -> int:
+        """Cantidad de registros procesados en la operación."""
+        return self._total
+
+    def get_full_message(self) -> str:
+        """Mensaje combinado con el detalle de cada registro fallido."""
+        partes = [super().get_full_message()]
+        for propietario, error in self._errores.items():
+            partes.append(f"  {propietario}: {error}")
+        return "\n".join(partes)
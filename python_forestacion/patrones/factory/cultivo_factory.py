@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import Dict, List, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from python_forestacion.entidades.cultivos.cultivo import Cultivo
@@ -7,11 +7,19 @@ if TYPE_CHECKING:
 class CultivoFactory:
     """Factory para crear instancias de cultivos."""
     
+    # Se construyen una sola vez, en el primer uso
+    _factories: Dict[str, callable] = {}
+    _prototipos: Dict[str, 'Cultivo'] = {}
+    
     @staticmethod
     def crear_cultivo(especie: str) -> 'Cultivo':
         """
         Crea un cultivo según la especie.
         
+        Clona el prototipo cacheado de la especie (como crear_cultivos): el
+        resultado es igual al del constructor, sin volver a buscar su
+        descriptor compartido.
+        
         Args:
             especie: Tipo de cultivo ("Pino", "Olivo", "Lechuga", "Zanahoria")
             
@@ -21,17 +29,59 @@ class CultivoFactory:
         Raises:
             ValueError: Si la especie es desconocida
         """
-        factories = {
-            "Pino": CultivoFactory._crear_pino,
-            "Olivo": CultivoFactory._crear_olivo,
-            "Lechuga": CultivoFactory._crear_lechuga,
-            "Zanahoria": CultivoFactory._crear_zanahoria
-        }
+        return CultivoFactory.get_prototipo(especie).clonar()
+    
+    @staticmethod
+    def crear_cultivos(especie: str, cantidad: int) -> List['Cultivo']:
+        """
+        Crea `cantidad` cultivos de una especie clonando un prototipo cacheado.
+        
+        Los clones se obtienen con Cultivo.clonar (patrón Prototype), sin
+        pasar por los constructores; todos sus atributos iniciales son
+        inmutables, por lo que la copia superficial es suficiente.
         
-        if especie not in factories:
-            raise ValueError(f"Especie desconocida: {especie}")
+        Args:
+            especie: Tipo de cultivo ("Pino", "Olivo", "Lechuga", "Zanahoria")
+            cantidad: Cantidad de cultivos a crear
+        
+        Returns:
+            Lista de cultivos nuevos e independientes
+        
+        Raises:
+            ValueError: Si la especie es desconocida
+        """
+        clonar = CultivoFactory.get_prototipo(especie).clonar
+        return [clonar() for _ in range(cantidad)]
+    
+    @staticmethod
+    def get_prototipo(especie: str) -> 'Cultivo':
+        """
+        Devuelve el prototipo cacheado de la especie (no debe modificarse).
         
-        return factories[especie]()
+        Raises:
+            ValueError: Si la especie es desconocida
+        """
+        prototipo = CultivoFactory._prototipos.get(especie)
+        if prototipo is None:
+            factories = CultivoFactory._obtener_factories()
+            
+            if especie not in factories:
+                raise ValueError(f"Especie desconocida: {especie}")
+            
+            prototipo = factories[especie]()
+            CultivoFactory._prototipos[especie] = prototipo
+        return prototipo
+    
+    @staticmethod
+    def _obtener_factories() -> Dict[str, callable]:
+        if not CultivoFactory._factories:
+            CultivoFactory._factories.update({
+                "Pino": CultivoFactory._crear_pino,
+                "Olivo": CultivoFactory._crear_olivo,
+                "Lechuga": CultivoFactory._crear_lechuga,
+                "Zanahoria": CultivoFactory._crear_zanahoria
+            })
+        return CultivoFactory._factories
     
     @staticmethod
     def _crear_pino() -> 'Cultivo':
@@ -0,0 +1,45 @@
+import time
+from typing import Optional
+
+from python_forestacion.patrones.observer.eventos.tipo_sensor import TipoSensor
+
+
+class EventoSensor:
+    """
+    Lectura de un sensor, tal como la notifica a sus observadores.
+
+    Lleva quién la midió, qué magnitud es y cuándo se tomó, de modo que el
+    observador no tiene que adivinar el origen por el rango del valor. El
+    instante es de time.monotonic(): sirve para medir antigüedades, no
+    como fecha.
+    """
+
+    __slots__ = ('_sensor_id', '_tipo', '_valor', '_timestamp')
+
+    def __init__(self, sensor_id: str, tipo: TipoSensor, valor: float,
+                 timestamp: Optional[float] = None):
+        self._sensor_id = sensor_id
+        self._tipo = tipo
+        self._valor = valor
+        self._timestamp = time.monotonic() if timestamp is None else timestamp
+
+    def get_sensor_id(self) -> str:
+        return self._sensor_id
+
+    def get_tipo(self) -> TipoSensor:
+        return self._tipo
+
+    def get_valor(self) -> float:
+        return self._valor
+
+    def get_timestamp(self) -> float:
+        """Instante de la lectura (time.monotonic())."""
+        return self._timestamp
+
+    def get_antiguedad(self, ahora: Optional[float] = None) -> float:
+        """Segundos transcurridos desde la lectura."""
+        return (time.monotonic() if ahora is None else ahora) - self._timestamp
+
+    def __repr__(self) -> str:
+        return (f"EventoSensor(sensor_id='{self._sensor_id}', tipo={self._tipo.name}, "
+                f"valor={self._valor}, timestamp={self._timestamp:.3f})")
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class TipoSensor(Enum):
+    """Magnitud que mide un sensor."""
+    TEMPERATURA = "Temperatura"
+    HUMEDAD = "Humedad"
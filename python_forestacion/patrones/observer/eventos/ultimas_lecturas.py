@@ -0,0 +1,67 @@
+import time
+from typing import Dict, Optional, Tuple
+
+from python_forestacion.patrones.observer.eventos.tipo_sensor import TipoSensor
+from python_forestacion.patrones.observer.eventos.evento_sensor import EventoSensor
+from python_forestacion.constantes import (
+    ANTIGUEDAD_MAXIMA_LECTURA,
+    TEMP_MIN,
+    TEMP_MAX,
+    HUMEDAD_MIN,
+    HUMEDAD_MAX
+)
+
+
+class UltimasLecturas:
+    """
+    Última lectura válida de cada tipo de sensor, con política de vigencia.
+
+    registrar despacha por el tipo del evento (búsqueda en un dict, O(1)):
+    valida el valor contra el rango de su magnitud y reemplaza la lectura
+    anterior de ese tipo si la nueva no es más vieja. Una lectura deja de
+    estar vigente pasados `antiguedad_maxima` segundos, así que un sensor
+    caído no sigue habilitando riegos con su último valor.
+    """
+
+    # Rango físico aceptado por tipo de sensor
+    RANGOS: Dict[TipoSensor, Tuple[float, float]] = {
+        TipoSensor.TEMPERATURA: (TEMP_MIN, TEMP_MAX),
+        TipoSensor.HUMEDAD: (HUMEDAD_MIN, HUMEDAD_MAX),
+    }
+
+    def __init__(self, antiguedad_maxima: float = ANTIGUEDAD_MAXIMA_LECTURA):
+        self._antiguedad_maxima = antiguedad_maxima
+        self._lecturas: Dict[TipoSensor, EventoSensor] = {}
+
+    def registrar(self, evento: EventoSensor) -> bool:
+        """
+        Guarda el evento como última lectura de su tipo.
+
+        Returns:
+            bool: False si se descartó (tipo desconocido, valor fuera de
+            rango o más viejo que la lectura guardada).
+        """
+        rango = self.RANGOS.get(evento.get_tipo())
+        if rango is None or not rango[0] <= evento.get_valor() <= rango[1]:
+            return False
+        anterior = self._lecturas.get(evento.get_tipo())
+        if anterior is not None and anterior.get_timestamp() > evento.get_timestamp():
+            return False
+        self._lecturas[evento.get_tipo()] = evento
+        return True
+
+    def get_lectura(self, tipo: TipoSensor) -> Optional[EventoSensor]:
+        """Última lectura de `tipo`, vigente o no."""
+        return self._lecturas.get(tipo)
+
+    def get_valor_vigente(self, tipo: TipoSensor, ahora: Optional[float] = None) -> Optional[float]:
+        """Valor de la última lectura de `tipo`, o None si no hay o está vencida."""
+        evento = self._lecturas.get(tipo)
+        if evento is None:
+            return None
+        if evento.get_antiguedad(time.monotonic() if ahora is None else ahora) > self._antiguedad_maxima:
+            return None
+        return evento.get_valor()
+
+    def get_antiguedad_maxima(self) -> float:
+        return self._antiguedad_maxima
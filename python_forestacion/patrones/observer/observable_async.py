@@ -0,0 +1,41 @@
+from abc import ABC
+from typing import Generic, TypeVar, List
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from python_forestacion.patrones.observer.observer_async import ObserverAsync
+
+T = TypeVar("T")
+
+
+class ObservableAsync(Generic[T], ABC):
+    """
+    Equivalente asincrónico de Observable.
+
+    Pensado para usarse desde un único event loop: la lista de observadores
+    sólo se modifica entre awaits, así que no necesita lock. Los
+    observadores se notifican en orden de registro, esperando a cada uno.
+    """
+
+    def __init__(self) -> None:
+        self._observadores: List["ObserverAsync[T]"] = []
+
+    def agregar_observador(self, observador: "ObserverAsync[T]") -> None:
+        """Agrega un observador, evitando duplicados."""
+        if observador not in self._observadores:
+            self._observadores.append(observador)
+
+    def remover_observador(self, observador: "ObserverAsync[T]") -> None:
+        """Remueve un observador si está registrado."""
+        if observador in self._observadores:
+            self._observadores.remove(observador)
+
+    async def notificar_observadores(self, evento: T) -> None:
+        """Notifica a todos los observadores con el evento generado."""
+        # Copia local: un observador puede removerse durante la notificación
+        for observador in list(self._observadores):
+            try:
+                await observador.actualizar(evento)
+            except Exception as e:
+                # Evita que un error en un observador rompa la notificación global
+                print(f"[ERROR] Falló notificación a {observador.__class__.__name__}: {e}")
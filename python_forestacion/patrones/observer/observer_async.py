@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class ObserverAsync(Generic[T], ABC):
+    """
+    Equivalente asincrónico de Observer.
+
+    `actualizar` es una corrutina que el ObservableAsync espera dentro del
+    mismo event loop, de modo que un observador puede esperar E/S sin
+    ocupar un hilo propio.
+    """
+
+    @abstractmethod
+    async def actualizar(self, evento: T) -> None:
+        """
+        Corrutina llamada por el ObservableAsync cuando se produce un evento.
+
+        Args:
+            evento: Dato o información del evento (tipo genérico T).
+        """
+        raise NotImplementedError("El observador debe implementar el método 'actualizar'.")
+
+    def __repr__(self) -> str:
+        """Representación útil para debugging."""
+        return f"{self.__class__.__name__}()"
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
+from array import array
 from datetime import date
-from typing import TYPE_CHECKING
+from typing import Hashable, Optional, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from python_forestacion.entidades.cultivos.cultivo import Cultivo
@@ -37,6 +38,82 @@ class AbsorcionAguaStrategy(ABC):
         """
         raise NotImplementedError("La estrategia debe implementar 'calcular_absorcion'.")
 
+    def clave_cache(
+        self,
+        fecha: date,
+        temperatura: float,
+        humedad: float,
+        cultivo: "Cultivo",
+    ) -> Optional[Hashable]:
+        """
+        Declara de qué datos depende el resultado de calcular_absorcion.
+
+        Dos llamadas con la misma clave deben devolver los mismos litros,
+        así que CultivoService puede reutilizar el resultado en lugar de
+        volver a evaluar la estrategia (p. ej. una vez por mes y no una vez
+        por planta). La clave no debe depender del estado propio de cada
+        cultivo (agua, altura): el riego por lote reutiliza el resultado para
+        toda la especie. Por defecto devuelve None: la estrategia no declara
+        sus dependencias y se evalúa siempre, planta por planta.
+
+        Returns:
+            Clave hasheable con los datos relevantes, o None para no memorizar.
+        """
+        return None
+
+    def calcular_absorcion_lote(
+        self,
+        fechas: Sequence[date],
+        temperaturas: Sequence[float],
+        humedades: Sequence[float],
+        cultivos: Sequence["Cultivo"],
+    ) -> array:
+        """
+        Calcula la absorción de muchos casos en una sola llamada.
+
+        El caso i es (fechas[i], temperaturas[i], humedades[i], cultivos[i]).
+        Una secuencia de largo 1 se repite para todos los casos, de modo que
+        se puede evaluar una plantación entera en una fecha, o un cultivo a
+        lo largo de una serie de fechas.
+
+        La implementación por defecto llama a calcular_absorcion caso por
+        caso; las estrategias concretas pueden reemplazarla por una que
+        aproveche de qué datos dependen.
+
+        Args:
+            fechas: Fechas de cada caso.
+            temperaturas: Temperaturas ambiente (°C).
+            humedades: Humedades relativas (%).
+            cultivos: Cultivos (o vistas columnares) de cada caso.
+
+        Returns:
+            array('i'): Litros absorbidos en cada caso.
+
+        Raises:
+            ValueError: Si los largos no coinciden (salvo las de largo 1).
+        """
+        cantidad = self._cantidad_casos(fechas, temperaturas, humedades, cultivos)
+        fechas, temperaturas, humedades, cultivos = (
+            self._repetir(valores, cantidad)
+            for valores in (fechas, temperaturas, humedades, cultivos)
+        )
+        return array("i", map(self.calcular_absorcion, fechas, temperaturas, humedades, cultivos))
+
+    @staticmethod
+    def _cantidad_casos(*secuencias: Sequence) -> int:
+        """Cantidad de casos de un lote; las secuencias de largo 1 se repiten."""
+        largos = {len(secuencia) for secuencia in secuencias if len(secuencia) != 1}
+        if len(largos) > 1:
+            raise ValueError(f"Largos de lote incompatibles: {sorted(largos)}")
+        return largos.pop() if largos else 1
+
+    @staticmethod
+    def _repetir(valores: Sequence, cantidad: int) -> Sequence:
+        """`valores` extendido a `cantidad` casos si tiene largo 1."""
+        if len(valores) == 1 and cantidad != 1:
+            return list(valores) * cantidad
+        return valores
+
     def __repr__(self) -> str:
         """Representación útil para depuración."""
         return f"{self.__class__.__name__}()"
@@ -1,4 +1,7 @@
+from array import array
 from datetime import date
+from typing import Hashable, Optional, Sequence
+
 from python_forestacion.patrones.strategy.absorcion_agua_strategy import AbsorcionAguaStrategy
 
 
@@ -10,4 +13,19 @@ class AbsorcionConstanteStrategy(AbsorcionAguaStrategy):
     
     def calcular_absorcion(self, fecha: date, temperatura: float,
                           humedad: float, cultivo) -> int:
-        return self._cantidad
\ No newline at end of file
+        return self._cantidad
+    
+    def clave_cache(self, fecha: date, temperatura: float,
+                    humedad: float, cultivo) -> Optional[Hashable]:
+        if type(self).calcular_absorcion is not AbsorcionConstanteStrategy.calcular_absorcion:
+            return None
+        # No depende de ningún dato: una sola entrada
+        return ()
+    
+    def calcular_absorcion_lote(self, fechas: Sequence[date], temperaturas: Sequence[float],
+                                humedades: Sequence[float], cultivos: Sequence) -> array:
+        """La misma cantidad para todos los casos, sin evaluarlos uno por uno."""
+        if type(self).calcular_absorcion is not AbsorcionConstanteStrategy.calcular_absorcion:
+            return super().calcular_absorcion_lote(fechas, temperaturas, humedades, cultivos)
+        cantidad = self._cantidad_casos(fechas, temperaturas, humedades, cultivos)
+        return array('i', [self._cantidad]) * cantidad
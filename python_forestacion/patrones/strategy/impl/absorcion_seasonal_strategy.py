@@ -1,4 +1,7 @@
+from array import array
 from datetime import date
+from typing import Hashable, Optional, Sequence
+
 from python_forestacion.patrones.strategy.absorcion_agua_strategy import AbsorcionAguaStrategy
 from python_forestacion.constantes import (
     MES_INICIO_VERANO,
@@ -19,4 +22,31 @@ class AbsorcionSeasonalStrategy(AbsorcionAguaStrategy):
         if mes >= MES_INICIO_VERANO or mes <= MES_FIN_VERANO:
             return ABSORCION_SEASONAL_VERANO
         else:
-            return ABSORCION_SEASONAL_INVIERNO
\ No newline at end of file
+            return ABSORCION_SEASONAL_INVIERNO
+    
+    def clave_cache(self, fecha: date, temperatura: float,
+                    humedad: float, cultivo) -> Optional[Hashable]:
+        if type(self).calcular_absorcion is not AbsorcionSeasonalStrategy.calcular_absorcion:
+            # Una subclase con otra regla debe declarar su propia clave
+            return None
+        # Sólo importa el mes
+        return fecha.month
+    
+    def calcular_absorcion_lote(self, fechas: Sequence[date], temperaturas: Sequence[float],
+                                humedades: Sequence[float], cultivos: Sequence) -> array:
+        """
+        Absorción por fecha usando una tabla mes -> litros.
+        
+        Sólo importa el mes de cada fecha: la regla de calcular_absorcion se
+        aplica una vez por mes y cada caso es una búsqueda en la tabla. Si
+        una subclase redefine calcular_absorcion, se la evalúa caso por caso.
+        """
+        if type(self).calcular_absorcion is not AbsorcionSeasonalStrategy.calcular_absorcion:
+            # Una subclase con otra regla puede depender de más que el mes
+            return super().calcular_absorcion_lote(fechas, temperaturas, humedades, cultivos)
+        cantidad = self._cantidad_casos(fechas, temperaturas, humedades, cultivos)
+        por_mes = [0] + [self.calcular_absorcion(date(2000, mes, 1), 0.0, 0.0, None)
+                         for mes in range(1, 13)]
+        if len(fechas) == 1:
+            return array('i', [por_mes[fechas[0].month]]) * cantidad
+        return array('i', [por_mes[fecha.month] for fecha in fechas])
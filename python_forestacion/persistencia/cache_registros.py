@@ -0,0 +1,134 @@
+# python_forestacion/persistencia/cache_registros.py
+"""
+Cache en proceso de registros ya leídos, con desalojo LRU.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class CacheRegistros:
+    """
+    Cache de objetos cargados desde archivos, invalidada por el propio archivo.
+    
+    Cada entrada se identifica por la ruta y se valida con la firma del
+    archivo (mtime en nanosegundos, tamaño e inodo) y de sus dependencias:
+    si alguno se reescribió (incluido un os.replace atómico) la firma
+    cambia y la entrada se vuelve a cargar.
+    
+    El presupuesto se mide en bytes en disco de los archivos cacheados,
+    como aproximación del costo en memoria. Al superarlo se desalojan las
+    entradas menos usadas recientemente.
+    
+    Los objetos devueltos son compartidos entre todos los que los piden:
+    no deben modificarse sin volver a persistirlos.
+    """
+    
+    def __init__(self, presupuesto_bytes: int):
+        self._presupuesto = presupuesto_bytes
+        self._entradas: "OrderedDict[str, Tuple[tuple, object, int]]" = OrderedDict()
+        self._bytes_usados = 0
+        self._aciertos = 0
+        self._fallos = 0
+        self._desalojos = 0
+        self._lock = threading.Lock()
+    
+    def obtener(self, ruta: str, cargar: Callable[[], T],
+                dependencias: Iterable[str] = ()) -> T:
+        """
+        Devuelve el objeto cacheado para `ruta` o lo carga con `cargar`.
+        
+        Args:
+            ruta: Archivo del que proviene el objeto
+            cargar: Función que lee y devuelve el objeto desde disco
+            dependencias: Otros archivos que intervienen en la carga (pueden
+                no existir); un cambio en cualquiera invalida la entrada
+        
+        Raises:
+            OSError: Si no se puede consultar el archivo
+        """
+        ruta = os.path.abspath(ruta)
+        # La firma se toma antes de cargar: si el archivo cambia durante la
+        # lectura, la próxima consulta no coincide y se vuelve a leer
+        estado = os.stat(ruta)
+        firma = (CacheRegistros._firma(estado),) + tuple(
+            CacheRegistros._firma_opcional(dependencia) for dependencia in dependencias
+        )
+        
+        with self._lock:
+            entrada = self._entradas.get(ruta)
+            if entrada is not None and entrada[0] == firma:
+                self._entradas.move_to_end(ruta)
+                self._aciertos += 1
+                return entrada[1]
+            self._fallos += 1
+        
+        objeto = cargar()
+        
+        with self._lock:
+            self._quitar(ruta)
+            if 0 < estado.st_size <= self._presupuesto:
+                self._entradas[ruta] = (firma, objeto, estado.st_size)
+                self._bytes_usados += estado.st_size
+                self._desalojar()
+        return objeto
+    
+    def invalidar(self, ruta: str) -> None:
+        """Descarta la entrada de `ruta`, si existe."""
+        with self._lock:
+            self._quitar(os.path.abspath(ruta))
+    
+    def limpiar(self) -> None:
+        """Vacía la cache (los contadores se conservan)."""
+        with self._lock:
+            self._entradas.clear()
+            self._bytes_usados = 0
+    
+    def set_presupuesto(self, presupuesto_bytes: int) -> None:
+        """Cambia el presupuesto, desalojando lo necesario."""
+        with self._lock:
+            self._presupuesto = presupuesto_bytes
+            self._desalojar()
+    
+    def get_presupuesto(self) -> int:
+        return self._presupuesto
+    
+    def get_estadisticas(self) -> Dict[str, int]:
+        """Aciertos, fallos, desalojos, entradas y bytes en uso."""
+        with self._lock:
+            return {
+                'aciertos': self._aciertos,
+                'fallos': self._fallos,
+                'desalojos': self._desalojos,
+                'entradas': len(self._entradas),
+                'bytes': self._bytes_usados
+            }
+    
+    def __len__(self) -> int:
+        return len(self._entradas)
+    
+    @staticmethod
+    def _firma(estado: os.stat_result) -> tuple:
+        return estado.st_mtime_ns, estado.st_size, estado.st_ino
+    
+    @staticmethod
+    def _firma_opcional(ruta: str) -> Optional[tuple]:
+        try:
+            return CacheRegistros._firma(os.stat(ruta))
+        except FileNotFoundError:
+            return None
+    
+    def _quitar(self, ruta: str) -> None:
+        entrada = self._entradas.pop(ruta, None)
+        if entrada is not None:
+            self._bytes_usados -= entrada[2]
+    
+    def _desalojar(self) -> None:
+        while self._bytes_usados > self._presupuesto and self._entradas:
+            _, (_, _, tamanio) = self._entradas.popitem(last=False)
+            self._bytes_usados -= tamanio
+            self._desalojos += 1
@@ -0,0 +1,169 @@
+# python_forestacion/persistencia/compresion_registro.py
+"""
+Compresión transparente de archivos de registro.
+
+Un archivo comprimido empieza con MAGIA + código de codec (1 byte) y sigue
+con el contenido de cualquier serializador comprimido como un único flujo.
+Al leer, la firma permite detectar la compresión sin configuración.
+"""
+
+import bz2
+import io
+import lzma
+import zlib
+from typing import BinaryIO, Optional
+
+from python_forestacion.entidades.cultivos.tipo_aceituna import TipoAceituna
+
+
+def _diccionario_zlib() -> bytes:
+    """
+    Diccionario inicial para zlib con el vocabulario que se repite en todo registro.
+
+    Con él, incluso los registros chicos (donde la ventana de zlib todavía
+    no vio cada nombre) codifican módulos, especies y variedades como
+    referencias. No debe modificarse: los archivos existentes dependen de él
+    (un diccionario nuevo requiere un código de codec nuevo).
+    """
+    palabras = [
+        "python_forestacion.entidades.cultivos.", "python_forestacion.entidades.terrenos.",
+        "python_forestacion.entidades.personal.", "python_forestacion.persistencia.",
+        "pino", "Pino", "olivo", "Olivo", "lechuga", "Lechuga", "zanahoria", "Zanahoria",
+        "tipo_aceituna", "TipoAceituna", "tarea", "Tarea", "EstadoTarea", "trabajador",
+        "Trabajador", "apto_medico", "AptoMedico", "plantacion", "Plantacion", "tierra",
+        "Tierra", "registro_forestal", "RegistroForestal", "encabezado_registro",
+        "EncabezadoRegistro", "_agua", "_superficie", "_altura", "_variedad",
+        "_invernadero", "_es_baby", "_tipo_aceituna", "_plantacion", "_cultivos",
+        "Paraná", "Crespa", "Elliotis", "Romana", "Mantecosa", "Criolla",
+        "especie", "agua", "superficie", "altura", "variedad", "invernadero", "es_baby",
+        "propietario", "avaluo", "domicilio", "cantidad_cultivos", "agua_disponible",
+        "trabajadores", "tareas", "descripcion", "fecha_programada", "estado",
+    ]
+    palabras.extend(tipo.value for tipo in TipoAceituna)
+    return "".join(palabras).encode('utf-8')
+
+
+class CompresionRegistro:
+    """
+    Codec de compresión para archivos de registro ("zlib", "lzma" o "bz2").
+    
+    Uso:
+        compresion = CompresionRegistro("lzma", nivel=6)
+        with compresion.abrir_escritura(archivo) as comprimido:
+            serializador.escribir(registro, comprimido)
+    """
+    
+    MAGIA = b"PFCZ"
+    
+    _CODIGOS = {"zlib": b"z", "lzma": b"x", "bz2": b"b"}
+    _NIVEL_POR_DEFECTO = {"zlib": 6, "lzma": 6, "bz2": 9}
+    _DICCIONARIO_ZLIB = _diccionario_zlib()
+    
+    def __init__(self, codec: str = "zlib", nivel: Optional[int] = None):
+        """
+        Args:
+            codec: "zlib", "lzma" o "bz2"
+            nivel: Nivel de compresión del codec (None: valor por defecto)
+        
+        Raises:
+            ValueError: Si el codec es desconocido
+        """
+        if codec not in self._CODIGOS:
+            raise ValueError(f"Codec de compresión desconocido: {codec}")
+        self._codec = codec
+        self._nivel = self._NIVEL_POR_DEFECTO[codec] if nivel is None else nivel
+    
+    def get_codec(self) -> str:
+        return self._codec
+    
+    def get_nivel(self) -> int:
+        return self._nivel
+    
+    def abrir_escritura(self, archivo: BinaryIO) -> BinaryIO:
+        """
+        Escribe la firma y devuelve un archivo que comprime hacia `archivo`.
+        
+        Cerrar el archivo devuelto termina el flujo comprimido sin cerrar
+        `archivo`.
+        """
+        archivo.write(self.MAGIA + self._CODIGOS[self._codec])
+        if self._codec == "lzma":
+            return lzma.LZMAFile(archivo, 'wb', preset=self._nivel)
+        if self._codec == "bz2":
+            return bz2.BZ2File(archivo, 'wb', compresslevel=self._nivel)
+        return _EscritorZlib(archivo, self._nivel, self._DICCIONARIO_ZLIB)
+    
+    @staticmethod
+    def es_comprimido(archivo: BinaryIO) -> bool:
+        """Indica si el archivo empieza con la firma de compresión (no avanza la posición)."""
+        posicion = archivo.tell()
+        firma = archivo.read(len(CompresionRegistro.MAGIA))
+        archivo.seek(posicion)
+        return firma == CompresionRegistro.MAGIA
+    
+    @staticmethod
+    def abrir_lectura(archivo: BinaryIO) -> BinaryIO:
+        """
+        Devuelve un archivo que descomprime `archivo`, o `archivo` mismo si no está comprimido.
+        
+        Raises:
+            ValueError: Si el codec de la firma es desconocido
+        """
+        if not CompresionRegistro.es_comprimido(archivo):
+            return archivo
+        codigo = archivo.read(len(CompresionRegistro.MAGIA) + 1)[-1:]
+        if codigo == CompresionRegistro._CODIGOS["lzma"]:
+            return lzma.LZMAFile(archivo, 'rb')
+        if codigo == CompresionRegistro._CODIGOS["bz2"]:
+            return bz2.BZ2File(archivo, 'rb')
+        if codigo == CompresionRegistro._CODIGOS["zlib"]:
+            return io.BufferedReader(_LectorZlib(archivo, CompresionRegistro._DICCIONARIO_ZLIB))
+        raise ValueError(f"Codec de compresión desconocido: {codigo!r}")
+    
+    def __repr__(self) -> str:
+        return f"CompresionRegistro(codec='{self._codec}', nivel={self._nivel})"
+
+
+class _EscritorZlib(io.RawIOBase):
+    """Flujo zlib con diccionario inicial; al cerrarse no cierra el destino."""
+    
+    def __init__(self, destino: BinaryIO, nivel: int, diccionario: bytes):
+        self._destino = destino
+        self._compresor = zlib.compressobj(nivel, zdict=diccionario)
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, datos) -> int:
+        self._destino.write(self._compresor.compress(datos))
+        return len(datos)
+    
+    def close(self) -> None:
+        if not self.closed:
+            self._destino.write(self._compresor.flush())
+        super().close()
+
+
+class _LectorZlib(io.RawIOBase):
+    """Lectura incremental de un flujo escrito por _EscritorZlib."""
+    
+    _TAMANIO_LECTURA = 64 * 1024
+    
+    def __init__(self, origen: BinaryIO, diccionario: bytes):
+        self._origen = origen
+        self._descompresor = zlib.decompressobj(zdict=diccionario)
+        self._pendiente = b""
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, destino) -> int:
+        while not self._pendiente and not self._descompresor.eof:
+            comprimido = self._descompresor.unconsumed_tail or self._origen.read(self._TAMANIO_LECTURA)
+            if not comprimido:
+                raise EOFError("Flujo zlib truncado")
+            self._pendiente = self._descompresor.decompress(comprimido, len(destino))
+        cantidad = min(len(destino), len(self._pendiente))
+        destino[:cantidad] = self._pendiente[:cantidad]
+        self._pendiente = self._pendiente[cantidad:]
+        return cantidad
@@ -0,0 +1,441 @@
+# python_forestacion/persistencia/diario_registro.py
+"""
+Diario de operaciones (append-only) sobre la plantación de un registro.
+
+Permite anotar cambios chicos (plantar, regar, cosechar) sin reescribir
+el registro completo. El registro guardado hace de snapshot
+base y el diario se reproduce sobre él al leerlo.
+
+Estructura:
+    MAGIA (4 bytes) + VERSION (1 byte) + firma del snapshot base
+    (tamaño, mtime en ns e inodo, 24 bytes; la versión 1 no tenía inodo)
+    operaciones: tipo (1 byte) + longitud (4 bytes) + CRC32 (4 bytes) + payload
+
+El diario sólo vale para el snapshot cuya firma guarda: al reescribir el
+registro (persistir o compactar) el diario anterior queda obsoleto y se
+ignora al leer. Así, una caída entre escribir el snapshot nuevo y vaciar
+el diario no reaplica operaciones ya incluidas en el snapshot.
+
+Una operación incompleta o con CRC inválido al final del archivo (escritura
+interrumpida) se descarta, junto con todo lo que la sigue.
+
+Anotar, vaciar y compactar toman un bloqueo exclusivo del diario: un lock
+por archivo dentro del proceso y, donde existe fcntl, un flock entre
+procesos. Así una compactación no pierde operaciones que otro diario
+abierto sobre el mismo archivo anote mientras se reescribe el registro.
+"""
+
+import os
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from contextlib import contextmanager
+from typing import (BinaryIO, Callable, Dict, Iterator, Mapping, Optional, Sequence, Tuple,
+                    Union, TYPE_CHECKING)
+
+try:
+    import fcntl
+except ImportError:  # Windows: el bloqueo sólo vale dentro del proceso
+    fcntl = None
+
+from python_forestacion.entidades.cultivos.especie_cultivo import EspecieCultivo
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+from python_forestacion.constantes import SINCRONIZAR_ESCRITURAS
+
+if TYPE_CHECKING:
+    from python_forestacion.entidades.terrenos.plantacion import Plantacion
+
+
+class DiarioRegistro:
+    """
+    Diario append-only de un registro, abierto para anotar operaciones.
+    
+    Uso:
+        with DiarioRegistro(ruta_diario, ruta_registro) as diario:
+            plantacion_service.regar_por_lote(plantacion, diario=diario)
+    
+    Cada operación se escribe con una sola llamada a write y, si
+    `sincronizar` es True, se fuerza a disco antes de volver.
+    """
+    
+    MAGIA = b"PFDJ"
+    VERSION = 2
+    
+    PLANTAR = b"P"
+    COSECHAR = b"C"
+    REGAR = b"R"
+    REGAR_CULTIVOS = b"A"
+    
+    # Cabecera: MAGIA y versión, seguidas de la firma del snapshot base
+    _MAGIA_VERSION = struct.Struct("<4sB")
+    _FIRMA = struct.Struct("<QqQ")
+    _FIRMA_V1 = struct.Struct("<Qq")  # Sin inodo
+    TAMANIO_CABECERA = _MAGIA_VERSION.size + _FIRMA.size
+    _CABECERA_OPERACION = struct.Struct("<cII")
+    
+    # Payloads por tipo de operación
+    _ESPECIE_CANTIDAD = struct.Struct("<BQ")
+    _RIEGO = struct.Struct("<q" + "qd" * len(EspecieCultivo))
+    # Riego por cultivo: agua disponible y crecimiento por especie, y por
+    # cada especie regada (especie, litros comunes, cantidad de litros propios)
+    # seguido de los litros propios de sus cultivos (int32, en orden de plantación)
+    _RIEGO_CULTIVOS = struct.Struct("<q" + "d" * len(EspecieCultivo))
+    _LITROS_ESPECIE = struct.Struct("<BqQ")
+    
+    # Un lock por archivo de diario, compartido por todas las instancias del proceso
+    _locks: Dict[str, threading.Lock] = {}
+    _lock_locks = threading.Lock()
+    
+    def __init__(self, ruta: str, ruta_base: str, sincronizar: bool = SINCRONIZAR_ESCRITURAS):
+        """
+        Abre (o crea) el diario de `ruta_base`.
+        
+        Si el diario existente corresponde a otro snapshot se vacía; si
+        termina en una operación incompleta, se trunca en la última válida.
+        
+        Args:
+            ruta: Archivo del diario
+            ruta_base: Archivo del registro (snapshot) al que se aplica
+            sincronizar: Forzar a disco (fsync) cada operación
+        
+        Raises:
+            OSError: Si el registro base no existe
+        """
+        self._ruta = ruta
+        self._ruta_base = ruta_base
+        self._sincronizar = sincronizar
+        self._base = DiarioRegistro.firma_base(ruta_base)
+        self._operaciones = 0
+        self._lock = DiarioRegistro._lock_de(ruta)
+        self._archivo: BinaryIO = open(ruta, 'a+b')
+        
+        with self._bloqueado():
+            # Una compactación pudo reescribir el registro mientras se esperaba el bloqueo
+            self._base = DiarioRegistro.firma_base(ruta_base)
+            self._archivo.seek(0)
+            if not DiarioRegistro._corresponde(DiarioRegistro._leer_cabecera(self._archivo), self._base):
+                self._reiniciar()
+            else:
+                fin_valido = self._archivo.tell()
+                for fin_valido, _, _ in DiarioRegistro._recorrer(self._archivo):
+                    self._operaciones += 1
+                if fin_valido < os.fstat(self._archivo.fileno()).st_size:
+                    self._archivo.truncate(fin_valido)
+    
+    def __enter__(self) -> 'DiarioRegistro':
+        return self
+    
+    def __exit__(self, *excepcion) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        self._archivo.close()
+    
+    def get_ruta(self) -> str:
+        return self._ruta
+    
+    def get_cantidad_operaciones(self) -> int:
+        """Operaciones anotadas desde el último snapshot."""
+        return self._operaciones
+    
+    def get_tamanio(self) -> int:
+        """Bytes del diario en disco."""
+        return os.fstat(self._archivo.fileno()).st_size
+    
+    def reiniciar(self) -> None:
+        """Vacía el diario y lo asocia al snapshot actual del registro."""
+        with self._bloqueado():
+            self._reiniciar()
+    
+    def compactar(self, volcar: Callable[[], None]) -> None:
+        """
+        Reescribe el registro base con `volcar` y vacía el diario, sin
+        dejar anotar operaciones en el medio.
+        
+        Mientras dura, los demás diarios abiertos sobre el mismo archivo
+        (en este proceso o, con fcntl, en otros) esperan para anotar: lo
+        que anoten después se asocia al registro nuevo.
+        
+        Args:
+            volcar: Guarda el registro con las operaciones del diario ya
+                aplicadas (leer_registro + persistir)
+        """
+        with self._bloqueado():
+            volcar()
+            self._reiniciar()
+    
+    @staticmethod
+    def _lock_de(ruta: str) -> threading.Lock:
+        clave = os.path.realpath(ruta)
+        with DiarioRegistro._lock_locks:
+            return DiarioRegistro._locks.setdefault(clave, threading.Lock())
+    
+    @contextmanager
+    def _bloqueado(self) -> Iterator[None]:
+        """Bloqueo exclusivo del diario: entre hilos (lock) y entre procesos (flock)."""
+        with self._lock:
+            if fcntl is not None:
+                fcntl.flock(self._archivo.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._archivo.fileno(), fcntl.LOCK_UN)
+    
+    def _reiniciar(self) -> None:
+        self._base = DiarioRegistro.firma_base(self._ruta_base)
+        self._archivo.truncate(0)
+        self._archivo.write(DiarioRegistro._MAGIA_VERSION.pack(self.MAGIA, self.VERSION) +
+                            DiarioRegistro._FIRMA.pack(*self._base))
+        self._archivo.flush()
+        if self._sincronizar:
+            os.fsync(self._archivo.fileno())
+        self._operaciones = 0
+    
+    # ------------------------------------------------------------------
+    # Operaciones
+    # ------------------------------------------------------------------
+    def plantar(self, especie: EspecieCultivo, cantidad: int) -> None:
+        """Se plantaron `cantidad` cultivos de `especie` con el estado de su prototipo."""
+        self._anotar(self.PLANTAR, self._ESPECIE_CANTIDAD.pack(especie, cantidad))
+    
+    def cosechar(self, especie: EspecieCultivo, cantidad: int) -> None:
+        """Se retiraron los primeros `cantidad` cultivos de `especie`."""
+        self._anotar(self.COSECHAR, self._ESPECIE_CANTIDAD.pack(especie, cantidad))
+    
+    def regar(self, litros: Mapping[EspecieCultivo, Union[int, Sequence[int]]],
+              crecimiento: Mapping[EspecieCultivo, float], agua_disponible: int) -> None:
+        """
+        Riego: cada cultivo sumó sus litros y cada árbol el crecimiento de su especie.
+        
+        Si todos los cultivos de cada especie absorbieron lo mismo, el riego
+        ocupa unos pocos bytes; si no, se anotan los litros de cada cultivo.
+        
+        Args:
+            litros: Agua absorbida por cultivo, por especie: un valor para
+                toda la especie o uno por cultivo (en orden de plantación)
+            crecimiento: Altura ganada por árbol, por especie
+            agua_disponible: Agua de la plantación después del riego
+        """
+        comunes = {}
+        propios = {}
+        for especie, valores in litros.items():
+            if isinstance(valores, int):
+                comunes[especie] = valores
+            elif valores and valores.count(valores[0]) == len(valores):
+                comunes[especie] = valores[0]
+            elif valores:
+                propios[especie] = array('i', valores)
+        
+        if not propios:
+            valores = [agua_disponible]
+            for especie in EspecieCultivo:
+                valores.extend((comunes.get(especie, 0), crecimiento.get(especie, 0.0)))
+            self._anotar(self.REGAR, self._RIEGO.pack(*valores))
+            return
+        
+        partes = [self._RIEGO_CULTIVOS.pack(
+            agua_disponible, *(crecimiento.get(especie, 0.0) for especie in EspecieCultivo)
+        )]
+        for especie, valor in comunes.items():
+            partes.append(self._LITROS_ESPECIE.pack(especie, valor, 0))
+        for especie, valores in propios.items():
+            partes.append(self._LITROS_ESPECIE.pack(especie, 0, len(valores)))
+            if sys.byteorder != 'little':
+                valores.byteswap()
+            partes.append(valores.tobytes())
+        self._anotar(self.REGAR_CULTIVOS, b"".join(partes))
+    
+    def _anotar(self, tipo: bytes, payload: bytes) -> None:
+        with self._bloqueado():
+            base = DiarioRegistro.firma_base(self._ruta_base)
+            if base != self._base:
+                # El registro se reescribió desde la apertura. Si otro diario ya
+                # se asoció al registro nuevo, sus operaciones se conservan
+                self._archivo.seek(0)
+                if DiarioRegistro._corresponde(DiarioRegistro._leer_cabecera(self._archivo), base):
+                    self._base = base
+                    self._operaciones = 0
+                else:
+                    self._reiniciar()
+            self._archivo.write(
+                self._CABECERA_OPERACION.pack(tipo, len(payload), zlib.crc32(tipo + payload)) + payload
+            )
+            self._archivo.flush()
+            if self._sincronizar:
+                os.fsync(self._archivo.fileno())
+            self._operaciones += 1
+    
+    # ------------------------------------------------------------------
+    # Lectura y reproducción
+    # ------------------------------------------------------------------
+    @staticmethod
+    def firma_base(ruta_base: str) -> Tuple[int, int, int]:
+        """
+        Firma (tamaño, mtime en ns, inodo) del snapshot al que se asocia un diario.
+        
+        El inodo distingue un snapshot reescrito (EscrituraAtomica siempre
+        reemplaza el archivo) con el mismo tamaño dentro del mismo tick de mtime.
+        """
+        estado = os.stat(ruta_base)
+        return estado.st_size, estado.st_mtime_ns, estado.st_ino
+    
+    @staticmethod
+    def reproducir(ruta: str, ruta_base: str, plantacion: 'Plantacion') -> int:
+        """
+        Aplica sobre `plantacion` (leída de `ruta_base`) las operaciones del diario.
+        
+        Un diario inexistente u obsoleto no aplica nada.
+        
+        Returns:
+            Cantidad de operaciones aplicadas
+        """
+        try:
+            archivo = open(ruta, 'rb')
+        except FileNotFoundError:
+            return 0
+        with archivo:
+            if not DiarioRegistro._corresponde(DiarioRegistro._leer_cabecera(archivo),
+                                               DiarioRegistro.firma_base(ruta_base)):
+                return 0
+            aplicadas = 0
+            for _, tipo, payload in DiarioRegistro._recorrer(archivo):
+                DiarioRegistro._aplicar(plantacion, tipo, payload)
+                aplicadas += 1
+            return aplicadas
+    
+    @staticmethod
+    def tiene_operaciones(ruta: str, ruta_base: str) -> bool:
+        """Si el diario tiene operaciones pendientes de compactar sobre `ruta_base`."""
+        try:
+            with open(ruta, 'rb') as archivo:
+                if not DiarioRegistro._corresponde(DiarioRegistro._leer_cabecera(archivo),
+                                                   DiarioRegistro.firma_base(ruta_base)):
+                    return False
+                return next(DiarioRegistro._recorrer(archivo), None) is not None
+        except FileNotFoundError:
+            return False
+    
+    @staticmethod
+    def _leer_cabecera(archivo: BinaryIO) -> Optional[Tuple[int, ...]]:
+        """Firma guardada en la cabecera (sin inodo en la versión 1), o None si está incompleta."""
+        cabecera = archivo.read(DiarioRegistro._MAGIA_VERSION.size)
+        if len(cabecera) < DiarioRegistro._MAGIA_VERSION.size:
+            return None
+        magia, version = DiarioRegistro._MAGIA_VERSION.unpack(cabecera)
+        if magia != DiarioRegistro.MAGIA:
+            raise ValueError("El archivo no es un diario de registro")
+        if version > DiarioRegistro.VERSION:
+            raise ValueError(f"Versión de diario no soportada: {version}")
+        formato = DiarioRegistro._FIRMA_V1 if version == 1 else DiarioRegistro._FIRMA
+        firma = archivo.read(formato.size)
+        if len(firma) < formato.size:
+            return None
+        return formato.unpack(firma)
+    
+    @staticmethod
+    def _corresponde(firma: Optional[Tuple[int, ...]], base: Tuple[int, int, int]) -> bool:
+        """Si la firma de una cabecera es la del snapshot `base` (las de versión 1 no comparan el inodo)."""
+        return firma is not None and firma == base[:len(firma)]
+    
+    @staticmethod
+    def _recorrer(archivo: BinaryIO) -> Iterator[Tuple[int, bytes, bytes]]:
+        """Operaciones válidas como (posición de fin, tipo, payload), hasta la primera dañada."""
+        cabecera_operacion = DiarioRegistro._CABECERA_OPERACION
+        while True:
+            cabecera = archivo.read(cabecera_operacion.size)
+            if len(cabecera) < cabecera_operacion.size:
+                return
+            tipo, longitud, crc = cabecera_operacion.unpack(cabecera)
+            payload = archivo.read(longitud)
+            if len(payload) < longitud or zlib.crc32(tipo + payload) != crc:
+                return
+            yield archivo.tell(), tipo, payload
+    
+    @staticmethod
+    def _aplicar(plantacion: 'Plantacion', tipo: bytes, payload: bytes) -> None:
+        if tipo in (DiarioRegistro.PLANTAR, DiarioRegistro.COSECHAR):
+            codigo, cantidad = DiarioRegistro._ESPECIE_CANTIDAD.unpack(payload)
+            especie = EspecieCultivo(codigo)
+            if tipo == DiarioRegistro.COSECHAR:
+                plantacion.retirar_cultivos(especie.get_clase(), cantidad)
+            elif plantacion.es_columnar():
+                plantacion.add_cultivo_repetido(CultivoFactory.get_prototipo(especie.get_nombre()),
+                                                cantidad)
+            else:
+                plantacion.add_cultivos(CultivoFactory.crear_cultivos(especie.get_nombre(), cantidad))
+        elif tipo == DiarioRegistro.REGAR:
+            valores = DiarioRegistro._RIEGO.unpack(payload)
+            litros = dict(zip(EspecieCultivo, valores[1::2]))
+            crecimiento = dict(zip(EspecieCultivo, valores[2::2]))
+            DiarioRegistro._aplicar_riego(plantacion, litros, crecimiento)
+            plantacion.set_agua_disponible(valores[0])
+        elif tipo == DiarioRegistro.REGAR_CULTIVOS:
+            agua_disponible, litros, crecimiento = DiarioRegistro._leer_riego_cultivos(payload)
+            DiarioRegistro._aplicar_riego(plantacion, litros, crecimiento)
+            plantacion.set_agua_disponible(agua_disponible)
+        else:
+            raise ValueError(f"Operación de diario desconocida: {tipo!r}")
+    
+    @staticmethod
+    def _leer_riego_cultivos(payload: bytes) -> Tuple[int, Dict[EspecieCultivo, Union[int, array]],
+                                                      Dict[EspecieCultivo, float]]:
+        valores = DiarioRegistro._RIEGO_CULTIVOS.unpack_from(payload)
+        crecimiento = dict(zip(EspecieCultivo, valores[1:]))
+        litros = {}
+        posicion = DiarioRegistro._RIEGO_CULTIVOS.size
+        while posicion < len(payload):
+            codigo, comunes, cantidad = DiarioRegistro._LITROS_ESPECIE.unpack_from(payload, posicion)
+            posicion += DiarioRegistro._LITROS_ESPECIE.size
+            if cantidad:
+                propios = array('i')
+                propios.frombytes(payload[posicion:posicion + cantidad * propios.itemsize])
+                if sys.byteorder != 'little':
+                    propios.byteswap()
+                posicion += cantidad * propios.itemsize
+                litros[EspecieCultivo(codigo)] = propios
+            else:
+                litros[EspecieCultivo(codigo)] = comunes
+        return valores[0], litros, crecimiento
+    
+    @staticmethod
+    def _aplicar_riego(plantacion: 'Plantacion', litros: Dict[EspecieCultivo, Union[int, array]],
+                       crecimiento: Dict[EspecieCultivo, float]) -> None:
+        """
+        Mismas sumas que PlantacionService.regar y regar_por_lote.
+        
+        Raises:
+            ValueError: Si los litros por cultivo de una especie no son
+                tantos como sus cultivos (el diario no es de esta plantación)
+        """
+        comunes = {especie: valor for especie, valor in litros.items() if isinstance(valor, int)}
+        propios = {especie: valor for especie, valor in litros.items() if not isinstance(valor, int)}
+        if plantacion.es_columnar():
+            almacen = plantacion.get_cultivos()
+            almacen.sumar_por_especie('_agua', comunes)
+            for especie, valores in propios.items():
+                filas = almacen.filas_de_especie(especie)
+                DiarioRegistro._verificar_cantidad(especie, valores, len(filas))
+                almacen.sumar_en_filas('_agua', filas, valores)
+        else:
+            for tipo, grupo in plantacion.agrupar_por_tipo().items():
+                especie = EspecieCultivo.de_clase(tipo)
+                if especie in propios:
+                    valores = propios[especie]
+                    DiarioRegistro._verificar_cantidad(especie, valores, len(grupo))
+                else:
+                    valores = [comunes.get(especie, 0)] * len(grupo)
+                for cultivo, valor in zip(grupo, valores):
+                    cultivo.set_agua(cultivo.get_agua() + valor)
+        plantacion.crecer_arboles(crecimiento)
+    
+    @staticmethod
+    def _verificar_cantidad(especie: EspecieCultivo, valores: array, cantidad: int) -> None:
+        if len(valores) != cantidad:
+            raise ValueError(f"El riego anotado tiene {len(valores)} cultivos de "
+                             f"{especie.get_nombre()} y la plantación {cantidad}")
+    
+    def __repr__(self) -> str:
+        return f"DiarioRegistro(ruta='{self._ruta}', operaciones={self._operaciones})"
@@ -0,0 +1,41 @@
+# python_forestacion/persistencia/encabezado_registro.py
+"""
+Encabezado de un registro persistido por bloques.
+"""
+
+from typing import List, Tuple
+
+from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+
+
+class EncabezadoRegistro:
+    """
+    Datos de un registro forestal sin sus cultivos.
+    
+    Contiene el registro completo (tierra, propietario, avalúo, trabajadores,
+    agua) con una plantación vacía, más la cantidad de cultivos que siguen
+    en el archivo. Leerlo no requiere deserializar ningún cultivo.
+    """
+    
+    def __init__(self, registro: RegistroForestal, cantidad_cultivos: int,
+                 atributos: List[Tuple] = None):
+        self._registro = registro
+        self._cantidad_cultivos = cantidad_cultivos
+        self._atributos = atributos or []
+    
+    def get_registro(self) -> RegistroForestal:
+        """Registro con la plantación todavía sin cultivos."""
+        return self._registro
+    
+    def get_propietario(self) -> str:
+        return self._registro.get_propietario()
+    
+    def get_avaluo(self) -> float:
+        return self._registro.get_avaluo()
+    
+    def get_cantidad_cultivos(self) -> int:
+        return self._cantidad_cultivos
+    
+    def get_atributos(self) -> List[Tuple]:
+        """Tabla de atributos de los bloques columnares (vacía en modo objetos)."""
+        return self._atributos
@@ -0,0 +1,102 @@
+# python_forestacion/persistencia/escritura_atomica.py
+"""
+Escritura atómica de archivos con respaldos rotativos.
+"""
+
+import os
+import shutil
+import tempfile
+from typing import BinaryIO, Callable
+
+
+class EscrituraAtomica:
+    """
+    Reemplaza un archivo sin dejar nunca una versión a medio escribir.
+    
+    El contenido se escribe en un temporal del mismo directorio, se fuerza
+    a disco con fsync y recién entonces se renombra sobre el destino con
+    os.replace (atómico en POSIX y Windows). Si el proceso se interrumpe,
+    el destino conserva la versión anterior completa.
+    """
+    
+    SUFIJO_TEMPORAL = ".tmp"
+    
+    @staticmethod
+    def escribir(ruta: str, escribir_contenido: Callable[[BinaryIO], None],
+                 generaciones_respaldo: int = 0, sincronizar: bool = True) -> None:
+        """
+        Escribe `ruta` de forma atómica.
+        
+        Args:
+            ruta: Archivo destino
+            escribir_contenido: Función que recibe el archivo temporal abierto
+                en modo binario y escribe el contenido completo
+            generaciones_respaldo: Versiones anteriores a conservar como
+                <ruta>.1 (la más reciente) ... <ruta>.N
+            sincronizar: Si es False se omiten los fsync (más rápido, pero
+                una caída del sistema puede perder la escritura)
+        """
+        directorio = os.path.dirname(os.path.abspath(ruta))
+        descriptor, temporal = tempfile.mkstemp(
+            prefix=f".{os.path.basename(ruta)}.",
+            suffix=EscrituraAtomica.SUFIJO_TEMPORAL,
+            dir=directorio
+        )
+        try:
+            with os.fdopen(descriptor, 'wb') as archivo:
+                escribir_contenido(archivo)
+                archivo.flush()
+                if sincronizar:
+                    os.fsync(archivo.fileno())
+            
+            if generaciones_respaldo > 0 and os.path.exists(ruta):
+                EscrituraAtomica._rotar_respaldos(ruta, generaciones_respaldo)
+            
+            os.replace(temporal, ruta)
+        except BaseException:
+            try:
+                os.remove(temporal)
+            except FileNotFoundError:
+                pass
+            raise
+        
+        if sincronizar:
+            EscrituraAtomica._sincronizar_directorio(directorio)
+    
+    @staticmethod
+    def ruta_respaldo(ruta: str, generacion: int) -> str:
+        """Ruta del respaldo `generacion` (1 = el más reciente)."""
+        return f"{ruta}.{generacion}"
+    
+    @staticmethod
+    def _rotar_respaldos(ruta: str, generaciones: int) -> None:
+        """
+        Desplaza <ruta>.k a <ruta>.k+1 y deja la versión actual en <ruta>.1.
+        
+        La versión actual se enlaza (o copia) en lugar de moverse, así el
+        destino sigue existiendo hasta el os.replace final.
+        """
+        for generacion in range(generaciones - 1, 0, -1):
+            origen = EscrituraAtomica.ruta_respaldo(ruta, generacion)
+            if os.path.exists(origen):
+                os.replace(origen, EscrituraAtomica.ruta_respaldo(ruta, generacion + 1))
+        
+        respaldo = EscrituraAtomica.ruta_respaldo(ruta, 1)
+        if os.path.exists(respaldo):
+            os.remove(respaldo)
+        try:
+            os.link(ruta, respaldo)
+        except OSError:
+            # Sistemas de archivos sin enlaces duros
+            shutil.copy2(ruta, respaldo)
+    
+    @staticmethod
+    def _sincronizar_directorio(directorio: str) -> None:
+        """Persiste la entrada de directorio del rename (sólo POSIX)."""
+        if os.name != 'posix':
+            return
+        descriptor = os.open(directorio, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
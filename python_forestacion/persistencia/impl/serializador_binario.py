@@ -0,0 +1,166 @@
+# python_forestacion/persistencia/impl/serializador_binario.py
+"""
+Formato binario compacto basado en struct, sin pickle.
+
+Estructura (enteros little endian):
+    MAGIA (4 bytes) + VERSION (1 byte)
+    encabezado: longitud (uint32) + JSON UTF-8 con el registro sin cultivos
+    bloques:    filas (uint32, 0 marca el fin)
+                longitud (uint32) + JSON con la tabla de atributos del bloque
+                columnas: especie (uint8), agua (int64), superficie (float64),
+                          altura (float64), código de atributo (uint32)
+
+Al no ejecutar código al leer, es seguro para archivos de origen no
+confiable; además sólo usa tipos simples, así que no depende de los
+nombres de clase del paquete.
+"""
+
+import json
+import struct
+import sys
+from array import array
+from enum import Enum
+from typing import BinaryIO, Iterator, List, Tuple
+
+from python_forestacion.entidades.cultivos.tipo_aceituna import TipoAceituna
+from python_forestacion.entidades.cultivos.especie_cultivo import EspecieCultivo
+from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.entidades.terrenos.almacen_columnar import AlmacenColumnar
+from python_forestacion.persistencia.encabezado_registro import EncabezadoRegistro
+from python_forestacion.persistencia.serializador_registro import SerializadorRegistro, Lote
+from python_forestacion.constantes import TAMANIO_BLOQUE_CULTIVOS
+
+
+class SerializadorBinario(SerializadorRegistro):
+    """Registro como encabezado JSON más bloques de columnas de ancho fijo."""
+    
+    MAGIA = b"PFBN"
+    VERSION = 1
+    
+    # Typecodes de AlmacenColumnar.exportar_columnas, en orden
+    _TIPOS_COLUMNA = ('B', 'q', 'd', 'd', 'I')
+    _LONGITUD = struct.Struct("<I")
+    
+    # Enums permitidos dentro de las tuplas de atributos
+    _ENUMS = {TipoAceituna.__name__: TipoAceituna}
+    
+    def get_nombre(self) -> str:
+        return "binario"
+    
+    def reconoce(self, archivo: BinaryIO) -> bool:
+        return self._espiar(archivo, len(self.MAGIA)) == self.MAGIA
+    
+    # ------------------------------------------------------------------
+    # Escritura
+    # ------------------------------------------------------------------
+    def escribir(self, registro: RegistroForestal, archivo: BinaryIO,
+                 tamanio_bloque: int = TAMANIO_BLOQUE_CULTIVOS) -> None:
+        plantacion = registro.get_plantacion()
+        cultivos = plantacion.get_cultivos()
+        
+        archivo.write(self.MAGIA + bytes([self.VERSION]))
+        self._escribir_json(archivo, self.registro_a_dict(registro))
+        
+        for inicio in range(0, len(cultivos), tamanio_bloque):
+            fin = min(inicio + tamanio_bloque, len(cultivos))
+            if plantacion.es_columnar():
+                columnas = cultivos.exportar_columnas(inicio, fin)
+                columnas, atributos = self._compactar_atributos(columnas, cultivos.get_atributos())
+            else:
+                # Los objetos se pasan a columnas con un almacén temporal
+                almacen = AlmacenColumnar()
+                almacen.extend(cultivos[inicio:fin])
+                columnas = almacen.exportar_columnas(0, len(almacen))
+                atributos = almacen.get_atributos()
+            self._escribir_bloque(archivo, columnas, atributos)
+        
+        archivo.write(self._LONGITUD.pack(0))
+    
+    def _escribir_bloque(self, archivo: BinaryIO, columnas: Tuple[array, ...],
+                         atributos: List[Tuple]) -> None:
+        archivo.write(self._LONGITUD.pack(len(columnas[0])))
+        self._escribir_json(archivo, [[self._codificar_valor(valor) for valor in tupla]
+                                      for tupla in atributos])
+        for columna in columnas:
+            if sys.byteorder != 'little':
+                columna = array(columna.typecode, columna)
+                columna.byteswap()
+            archivo.write(columna.tobytes())
+    
+    @staticmethod
+    def _compactar_atributos(columnas: Tuple[array, ...],
+                             atributos: List[Tuple]) -> Tuple[Tuple[array, ...], List[Tuple]]:
+        """Reduce la tabla global de atributos a los códigos usados en el bloque."""
+        codigos = {}
+        remapeados = array('I', [codigos.setdefault(codigo, len(codigos))
+                                 for codigo in columnas[4]])
+        usados = [atributos[codigo] for codigo in codigos]
+        return columnas[:4] + (remapeados,), usados
+    
+    def _escribir_json(self, archivo: BinaryIO, datos) -> None:
+        contenido = json.dumps(datos, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        archivo.write(self._LONGITUD.pack(len(contenido)))
+        archivo.write(contenido)
+    
+    def _codificar_valor(self, valor):
+        if isinstance(valor, Enum):
+            return {type(valor).__name__: valor.value}
+        return valor
+    
+    # ------------------------------------------------------------------
+    # Lectura
+    # ------------------------------------------------------------------
+    def leer_encabezado(self, archivo: BinaryIO) -> EncabezadoRegistro:
+        """
+        Raises:
+            ValueError: Si el archivo no está en este formato
+        """
+        firma = archivo.read(len(self.MAGIA) + 1)
+        if firma[:-1] != self.MAGIA:
+            raise ValueError("El archivo no está en el formato binario")
+        if firma[-1] > self.VERSION:
+            raise ValueError(f"Versión de formato no soportada: {firma[-1]}")
+        
+        datos = self._leer_json(archivo)
+        return EncabezadoRegistro(self.registro_desde_dict(datos),
+                                  datos['plantacion']['cantidad_cultivos'])
+    
+    def iterar_lotes(self, archivo: BinaryIO, encabezado: EncabezadoRegistro) -> Iterator[Lote]:
+        while True:
+            filas = self._leer_entero(archivo)
+            if filas == 0:
+                return
+            atributos = [tuple(self._decodificar_valor(valor) for valor in tupla)
+                         for tupla in self._leer_json(archivo)]
+            columnas = []
+            for tipo in self._TIPOS_COLUMNA:
+                columna = array(tipo)
+                columna.frombytes(self._leer_exacto(archivo, filas * columna.itemsize))
+                if sys.byteorder != 'little':
+                    columna.byteswap()
+                columnas.append(columna)
+            if max(columnas[0]) >= len(EspecieCultivo) or max(columnas[4]) >= len(atributos):
+                raise ValueError("Bloque binario con códigos fuera de rango")
+            yield tuple(columnas), atributos
+    
+    def _decodificar_valor(self, valor):
+        if isinstance(valor, dict):
+            (nombre, contenido), = valor.items()
+            if nombre not in self._ENUMS:
+                raise ValueError(f"Tipo de atributo desconocido: {nombre}")
+            return self._ENUMS[nombre](contenido)
+        return valor
+    
+    def _leer_json(self, archivo: BinaryIO):
+        longitud = self._leer_entero(archivo)
+        return json.loads(self._leer_exacto(archivo, longitud).decode('utf-8'))
+    
+    def _leer_entero(self, archivo: BinaryIO) -> int:
+        return self._LONGITUD.unpack(self._leer_exacto(archivo, self._LONGITUD.size))[0]
+    
+    @staticmethod
+    def _leer_exacto(archivo: BinaryIO, cantidad: int) -> bytes:
+        datos = archivo.read(cantidad)
+        if len(datos) < cantidad:
+            raise EOFError("Archivo binario truncado")
+        return datos
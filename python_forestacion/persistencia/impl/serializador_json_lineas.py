@@ -0,0 +1,143 @@
+# python_forestacion/persistencia/impl/serializador_json_lineas.py
+"""
+Formato JSON-lines para exportar registros.
+
+La primera línea es el registro sin cultivos; cada línea siguiente es un
+cultivo, por ejemplo:
+
+    {"formato":"forestacion-jsonl","version":1,"registro":{...}}
+    {"especie":"Pino","agua":2,"superficie":2.0,"altura":1.0,"variedad":"Paraná"}
+
+Es legible por herramientas externas (jq, pandas, ...) y puede procesarse
+línea por línea. También se puede volver a leer como registro.
+"""
+
+import json
+from enum import Enum
+from typing import BinaryIO, Dict, Iterator, TYPE_CHECKING
+
+from python_forestacion.entidades.cultivos.arbol import Arbol
+from python_forestacion.entidades.cultivos.especie_cultivo import EspecieCultivo
+from python_forestacion.entidades.cultivos.tipo_aceituna import TipoAceituna
+from python_forestacion.entidades.cultivos.vista_columnar import CAMPOS_ATRIBUTO_POR_ESPECIE
+from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+from python_forestacion.persistencia.encabezado_registro import EncabezadoRegistro
+from python_forestacion.persistencia.serializador_registro import SerializadorRegistro, Lote
+from python_forestacion.constantes import TAMANIO_BLOQUE_CULTIVOS
+
+if TYPE_CHECKING:
+    from python_forestacion.entidades.cultivos.cultivo import Cultivo
+
+
+class SerializadorJsonLineas(SerializadorRegistro):
+    """Registro como una línea JSON de encabezado más una línea por cultivo."""
+    
+    FORMATO = "forestacion-jsonl"
+    VERSION = 1
+    
+    # Campos de atributo que se guardan por valor de enum
+    _ENUMS_POR_CAMPO = {'_tipo_aceituna': TipoAceituna}
+    
+    def __init__(self):
+        self._firma = json.dumps({'formato': self.FORMATO}, separators=(',', ':'))[:-1].encode('utf-8')
+    
+    def get_nombre(self) -> str:
+        return "jsonl"
+    
+    def reconoce(self, archivo: BinaryIO) -> bool:
+        return self._espiar(archivo, len(self._firma)) == self._firma
+    
+    # ------------------------------------------------------------------
+    # Escritura
+    # ------------------------------------------------------------------
+    def escribir(self, registro: RegistroForestal, archivo: BinaryIO,
+                 tamanio_bloque: int = TAMANIO_BLOQUE_CULTIVOS) -> None:
+        self._escribir_linea(archivo, {
+            'formato': self.FORMATO,
+            'version': self.VERSION,
+            'registro': self.registro_a_dict(registro)
+        })
+        
+        cultivos = registro.get_plantacion().get_cultivos()
+        for inicio in range(0, len(cultivos), tamanio_bloque):
+            lineas = [self._a_json(self.cultivo_a_dict(cultivo))
+                      for cultivo in cultivos[inicio:inicio + tamanio_bloque]]
+            archivo.write("".join(lineas).encode('utf-8'))
+    
+    def _escribir_linea(self, archivo: BinaryIO, datos: dict) -> None:
+        archivo.write(self._a_json(datos).encode('utf-8'))
+    
+    @staticmethod
+    def _a_json(datos: dict) -> str:
+        return json.dumps(datos, ensure_ascii=False, separators=(',', ':')) + "\n"
+    
+    def cultivo_a_dict(self, cultivo: 'Cultivo') -> Dict[str, object]:
+        """Cultivo como dict plano: especie, agua, superficie, [altura] y atributos."""
+        especie = EspecieCultivo.de_cultivo(cultivo)
+        datos = {
+            'especie': especie.get_nombre(),
+            'agua': cultivo.get_agua(),
+            'superficie': cultivo.get_superficie()
+        }
+        if isinstance(cultivo, Arbol):
+            datos['altura'] = cultivo.get_altura()
+        for campo in CAMPOS_ATRIBUTO_POR_ESPECIE[especie]:
+            valor = getattr(cultivo, campo)
+            datos[campo.lstrip('_')] = valor.value if isinstance(valor, Enum) else valor
+        return datos
+    
+    # ------------------------------------------------------------------
+    # Lectura
+    # ------------------------------------------------------------------
+    def leer_encabezado(self, archivo: BinaryIO) -> EncabezadoRegistro:
+        """
+        Raises:
+            ValueError: Si el archivo no está en este formato
+        """
+        if not self.reconoce(archivo):
+            raise ValueError("El archivo no está en el formato JSON-lines")
+        datos = json.loads(archivo.readline())
+        if datos['version'] > self.VERSION:
+            raise ValueError(f"Versión de formato no soportada: {datos['version']}")
+        
+        registro = datos['registro']
+        return EncabezadoRegistro(self.registro_desde_dict(registro),
+                                  registro['plantacion']['cantidad_cultivos'])
+    
+    def iterar_lotes(self, archivo: BinaryIO, encabezado: EncabezadoRegistro,
+                     tamanio_bloque: int = TAMANIO_BLOQUE_CULTIVOS) -> Iterator[Lote]:
+        lote = []
+        for linea in archivo:
+            if not linea.strip():
+                continue
+            lote.append(self.cultivo_desde_dict(json.loads(linea)))
+            if len(lote) == tamanio_bloque:
+                yield lote
+                lote = []
+        if lote:
+            yield lote
+    
+    def cultivo_desde_dict(self, datos: Dict[str, object]) -> 'Cultivo':
+        """
+        Arma un cultivo a partir de cultivo_a_dict.
+        
+        Raises:
+            ValueError: Si la especie es desconocida
+        """
+        especie = EspecieCultivo.desde_nombre(datos['especie'])
+        cultivo = CultivoFactory.get_prototipo(especie.get_nombre()).clonar()
+        cultivo.set_agua(datos['agua'])
+        if isinstance(cultivo, Arbol):
+            cultivo.set_altura(datos['altura'])
+        # Los datos compartidos se asignan sólo si difieren del prototipo:
+        # así el clon conserva su descriptor sin volver a internarlo
+        if cultivo.get_superficie() != datos['superficie']:
+            cultivo.set_superficie(datos['superficie'])
+        for campo in CAMPOS_ATRIBUTO_POR_ESPECIE[especie]:
+            valor = datos[campo.lstrip('_')]
+            if campo in self._ENUMS_POR_CAMPO:
+                valor = self._ENUMS_POR_CAMPO[campo](valor)
+            if getattr(cultivo, campo) != valor:
+                setattr(cultivo, campo, valor)
+        return cultivo
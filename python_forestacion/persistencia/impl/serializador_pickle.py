@@ -0,0 +1,152 @@
+# python_forestacion/persistencia/impl/serializador_pickle.py
+"""
+Formato por bloques basado en pickle (formato por defecto).
+
+Estructura:
+    MAGIA (4 bytes) + VERSION (1 byte)
+    marco ENCABEZADO: registro sin cultivos + cantidad de cultivos
+    marcos BLOQUE:    lotes de hasta TAMANIO_BLOQUE_CULTIVOS cultivos
+    marco FIN
+
+Cada marco es: tipo (1 byte) + longitud (8 bytes, little endian) + payload
+serializado con pickle (protocolo 5). Guardar y leer sólo mantiene en
+memoria un bloque a la vez, y el encabezado puede leerse sin tocar los
+cultivos.
+
+Como todo pickle, sólo debe leerse desde fuentes confiables.
+"""
+
+import pickle
+import struct
+from typing import BinaryIO, Iterator, Tuple
+
+from python_forestacion.entidades.terrenos.tierra import Tierra
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.persistencia.encabezado_registro import EncabezadoRegistro
+from python_forestacion.persistencia.serializador_registro import SerializadorRegistro, Lote
+from python_forestacion.constantes import TAMANIO_BLOQUE_CULTIVOS
+
+
+class SerializadorPickle(SerializadorRegistro):
+    """Registro en marcos pickle: cultivos como objetos o como columnas."""
+    
+    MAGIA = b"PFRB"
+    VERSION = 1
+    PROTOCOLO = 5
+    
+    MARCO_ENCABEZADO = b"E"
+    MARCO_OBJETOS = b"O"
+    MARCO_COLUMNAS = b"C"
+    MARCO_FIN = b"F"
+    
+    _CABECERA_MARCO = struct.Struct("<cQ")
+    
+    def get_nombre(self) -> str:
+        return "pickle"
+    
+    def reconoce(self, archivo: BinaryIO) -> bool:
+        return self._espiar(archivo, len(self.MAGIA)) == self.MAGIA
+    
+    # ------------------------------------------------------------------
+    # Escritura
+    # ------------------------------------------------------------------
+    def escribir(self, registro: RegistroForestal, archivo: BinaryIO,
+                 tamanio_bloque: int = TAMANIO_BLOQUE_CULTIVOS) -> None:
+        """
+        Escribe el registro en `archivo` bloque por bloque.
+        
+        Args:
+            registro: Registro a guardar
+            archivo: Archivo binario abierto para escritura
+            tamanio_bloque: Cultivos por bloque
+        """
+        plantacion = registro.get_plantacion()
+        cultivos = plantacion.get_cultivos()
+        columnar = plantacion.es_columnar()
+        
+        archivo.write(self.MAGIA + bytes([self.VERSION]))
+        
+        encabezado = EncabezadoRegistro(
+            SerializadorPickle._copiar_sin_cultivos(registro),
+            len(cultivos),
+            cultivos.get_atributos() if columnar else None
+        )
+        self._escribir_marco(archivo, self.MARCO_ENCABEZADO, encabezado)
+        
+        for inicio in range(0, len(cultivos), tamanio_bloque):
+            fin = min(inicio + tamanio_bloque, len(cultivos))
+            if columnar:
+                self._escribir_marco(archivo, self.MARCO_COLUMNAS,
+                                     cultivos.exportar_columnas(inicio, fin))
+            else:
+                self._escribir_marco(archivo, self.MARCO_OBJETOS, cultivos[inicio:fin])
+        
+        self._escribir_marco(archivo, self.MARCO_FIN, None)
+    
+    def _escribir_marco(self, archivo: BinaryIO, tipo: bytes, contenido) -> None:
+        payload = pickle.dumps(contenido, protocol=self.PROTOCOLO)
+        archivo.write(self._CABECERA_MARCO.pack(tipo, len(payload)))
+        archivo.write(payload)
+    
+    @staticmethod
+    def _copiar_sin_cultivos(registro: RegistroForestal) -> RegistroForestal:
+        """Copia del registro cuya plantación no tiene cultivos."""
+        tierra = registro.get_tierra()
+        plantacion = registro.get_plantacion()
+        
+        plantacion_vacia = Plantacion(plantacion.get_nombre(),
+                                      plantacion.get_superficie_total(),
+                                      plantacion.es_columnar())
+        plantacion_vacia.set_agua_disponible(plantacion.get_agua_disponible())
+        for trabajador in plantacion.get_trabajadores():
+            plantacion_vacia.add_trabajador(trabajador)
+        
+        tierra_copia = Tierra(tierra.get_id_padron(), tierra.get_superficie(),
+                              tierra.get_domicilio())
+        tierra_copia.set_finca(plantacion_vacia)
+        
+        return RegistroForestal(registro.get_id_padron(), tierra_copia,
+                                plantacion_vacia, registro.get_propietario(),
+                                registro.get_avaluo())
+    
+    # ------------------------------------------------------------------
+    # Lectura
+    # ------------------------------------------------------------------
+    def leer_encabezado(self, archivo: BinaryIO) -> EncabezadoRegistro:
+        """
+        Lee sólo el encabezado (deja el archivo posicionado en el primer bloque).
+        
+        Raises:
+            ValueError: Si el archivo no está en este formato
+        """
+        firma = archivo.read(len(self.MAGIA) + 1)
+        if firma[:-1] != self.MAGIA:
+            raise ValueError("El archivo no está en el formato por bloques")
+        if firma[-1] > self.VERSION:
+            raise ValueError(f"Versión de formato no soportada: {firma[-1]}")
+        
+        tipo, encabezado = self._leer_marco(archivo)
+        if tipo != self.MARCO_ENCABEZADO:
+            raise ValueError("Falta el encabezado del registro")
+        return encabezado
+    
+    def iterar_lotes(self, archivo: BinaryIO, encabezado: EncabezadoRegistro) -> Iterator[Lote]:
+        while True:
+            tipo, contenido = self._leer_marco(archivo)
+            if tipo == self.MARCO_FIN:
+                return
+            if tipo == self.MARCO_COLUMNAS:
+                yield contenido, encabezado.get_atributos()
+            else:
+                yield contenido
+    
+    def _leer_marco(self, archivo: BinaryIO) -> Tuple[bytes, object]:
+        cabecera = archivo.read(self._CABECERA_MARCO.size)
+        if len(cabecera) < self._CABECERA_MARCO.size:
+            raise EOFError("Archivo por bloques truncado")
+        tipo, longitud = self._CABECERA_MARCO.unpack(cabecera)
+        payload = archivo.read(longitud)
+        if len(payload) < longitud:
+            raise EOFError("Archivo por bloques truncado")
+        return tipo, pickle.loads(payload)
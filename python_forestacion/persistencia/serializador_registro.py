@@ -0,0 +1,263 @@
+# python_forestacion/persistencia/serializador_registro.py
+"""
+Interfaz común de los formatos de archivo de registros forestales.
+"""
+
+from abc import ABC, abstractmethod
+from array import array
+from datetime import date
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
+
+from python_forestacion.entidades.cultivos.arbol import Arbol
+from python_forestacion.entidades.cultivos.especie_cultivo import EspecieCultivo
+from python_forestacion.entidades.cultivos.vista_columnar import CAMPOS_ATRIBUTO_POR_ESPECIE
+from python_forestacion.entidades.terrenos.tierra import Tierra
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.entidades.terrenos.almacen_columnar import AlmacenColumnar
+from python_forestacion.entidades.personal.trabajador import Trabajador
+from python_forestacion.entidades.personal.tarea import Tarea, EstadoTarea
+from python_forestacion.entidades.personal.apto_medico import AptoMedico
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+from python_forestacion.persistencia.encabezado_registro import EncabezadoRegistro
+from python_forestacion.constantes import TAMANIO_BLOQUE_CULTIVOS
+
+if TYPE_CHECKING:
+    from python_forestacion.entidades.cultivos.cultivo import Cultivo
+
+# Un lote es una lista de cultivos o columnas exportadas con su tabla de atributos
+Lote = Union[List['Cultivo'], Tuple[Tuple[array, ...], List[Tuple]]]
+
+
+class SerializadorRegistro(ABC):
+    """
+    Formato de archivo para persistir un RegistroForestal.
+    
+    Cada implementación escribe el registro en bloques y sabe reconocer sus
+    propios archivos por la firma inicial, de modo que leer_registro puede
+    abrir cualquier archivo sin saber con qué serializador se guardó.
+    
+    Las subclases implementan la escritura, el encabezado y el recorrido de
+    lotes; leer() e iterar_cultivos() se arman sobre eso.
+    """
+    
+    @abstractmethod
+    def get_nombre(self) -> str:
+        """Nombre corto del formato ("pickle", "binario", "jsonl")."""
+        raise NotImplementedError("El serializador debe implementar 'get_nombre'.")
+    
+    @abstractmethod
+    def reconoce(self, archivo: BinaryIO) -> bool:
+        """Indica si el archivo está en este formato (no avanza la posición)."""
+        raise NotImplementedError("El serializador debe implementar 'reconoce'.")
+    
+    @abstractmethod
+    def escribir(self, registro: RegistroForestal, archivo: BinaryIO,
+                 tamanio_bloque: int = TAMANIO_BLOQUE_CULTIVOS) -> None:
+        """Escribe el registro en `archivo`, de a `tamanio_bloque` cultivos."""
+        raise NotImplementedError("El serializador debe implementar 'escribir'.")
+    
+    @abstractmethod
+    def leer_encabezado(self, archivo: BinaryIO) -> EncabezadoRegistro:
+        """Lee el encabezado y deja el archivo posicionado en el primer lote."""
+        raise NotImplementedError("El serializador debe implementar 'leer_encabezado'.")
+    
+    @abstractmethod
+    def iterar_lotes(self, archivo: BinaryIO, encabezado: EncabezadoRegistro) -> Iterator[Lote]:
+        """Recorre los lotes de cultivos que siguen al encabezado."""
+        raise NotImplementedError("El serializador debe implementar 'iterar_lotes'.")
+    
+    def leer(self, archivo: BinaryIO) -> RegistroForestal:
+        """Lee el registro completo, cargando la plantación lote por lote."""
+        encabezado = self.leer_encabezado(archivo)
+        plantacion = encabezado.get_registro().get_plantacion()
+        
+        for lote in self.iterar_lotes(archivo, encabezado):
+            if isinstance(lote, list):
+                plantacion.add_cultivos(lote)
+            elif plantacion.es_columnar():
+                plantacion.add_columnas(*lote)
+            else:
+                plantacion.add_cultivos(SerializadorRegistro._objetos_de(lote))
+        return encabezado.get_registro()
+    
+    def iterar_cultivos(self, archivo: BinaryIO) -> Iterator[List['Cultivo']]:
+        """
+        Lee el registro como flujo de lotes de cultivos, sin armar la plantación.
+        
+        Yields:
+            Listas de cultivos (vistas columnares si el lote viene en columnas)
+        """
+        encabezado = self.leer_encabezado(archivo)
+        for lote in self.iterar_lotes(archivo, encabezado):
+            if isinstance(lote, list):
+                yield lote
+            else:
+                yield SerializadorRegistro._vistas_de(lote)
+    
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+    
+    @staticmethod
+    def por_nombre(nombre: str) -> 'SerializadorRegistro':
+        """
+        Serializador registrado con `nombre` ("pickle", "binario", "jsonl").
+        
+        Raises:
+            ValueError: Si el nombre es desconocido
+        """
+        for serializador in _serializadores():
+            if serializador.get_nombre() == nombre:
+                return serializador
+        raise ValueError(f"Serializador desconocido: {nombre}")
+    
+    @staticmethod
+    def detectar(archivo: BinaryIO) -> Optional['SerializadorRegistro']:
+        """Serializador que reconoce el archivo, o None (p. ej. pickle sin formato)."""
+        for serializador in _serializadores():
+            if serializador.reconoce(archivo):
+                return serializador
+        return None
+    
+    @staticmethod
+    def _espiar(archivo: BinaryIO, cantidad: int) -> bytes:
+        """Primeros `cantidad` bytes pendientes de `archivo`, sin consumirlos."""
+        if hasattr(archivo, 'peek'):
+            # Vale también para flujos descomprimidos, que no admiten seek
+            datos = archivo.peek(cantidad)[:cantidad]
+            if len(datos) == cantidad or not archivo.seekable():
+                return datos
+        posicion = archivo.tell()
+        datos = archivo.read(cantidad)
+        archivo.seek(posicion)
+        return datos
+    
+    @staticmethod
+    def _vistas_de(lote: Lote) -> List['Cultivo']:
+        columnas, atributos = lote
+        almacen = AlmacenColumnar()
+        almacen.importar_columnas(columnas, atributos)
+        return list(almacen)
+    
+    @staticmethod
+    def _objetos_de(lote: Lote) -> List['Cultivo']:
+        """
+        Convierte un lote en columnas a cultivos independientes.
+        
+        Se arma un modelo por combinación (especie, atributos, superficie) y
+        cada fila es un clon del modelo con su agua y altura; así no se pasa
+        por las vistas ni por los constructores, y las filas iguales
+        comparten el descriptor del modelo.
+        """
+        (especies, aguas, superficies, alturas, codigos), atributos = lote
+        modelos = {}
+        cultivos = []
+        for especie, agua, superficie, altura, codigo in zip(especies, aguas, superficies,
+                                                             alturas, codigos):
+            modelo = modelos.get((especie, codigo, superficie))
+            if modelo is None:
+                modelo = SerializadorRegistro._crear_modelo(EspecieCultivo(especie),
+                                                            atributos[codigo])
+                modelo._superficie = superficie
+                modelos[(especie, codigo, superficie)] = modelo
+            clon = modelo.clonar()
+            clon._agua = agua
+            if isinstance(clon, Arbol):
+                clon._altura = altura
+            cultivos.append(clon)
+        return cultivos
+    
+    @staticmethod
+    def _crear_modelo(especie: EspecieCultivo, atributos: Tuple) -> 'Cultivo':
+        modelo = CultivoFactory.get_prototipo(especie.get_nombre()).clonar()
+        for campo, valor in zip(CAMPOS_ATRIBUTO_POR_ESPECIE[especie], atributos):
+            setattr(modelo, campo, valor)
+        return modelo
+    
+    # ------------------------------------------------------------------
+    # Conversión del registro (sin cultivos) a tipos simples
+    # ------------------------------------------------------------------
+    @staticmethod
+    def registro_a_dict(registro: RegistroForestal) -> dict:
+        """Datos del registro y su plantación, sin cultivos, como dict serializable en JSON."""
+        tierra = registro.get_tierra()
+        plantacion = registro.get_plantacion()
+        return {
+            'id_padron': registro.get_id_padron(),
+            'propietario': registro.get_propietario(),
+            'avaluo': registro.get_avaluo(),
+            'tierra': {
+                'id_padron': tierra.get_id_padron(),
+                'superficie': tierra.get_superficie(),
+                'domicilio': tierra.get_domicilio()
+            },
+            'plantacion': {
+                'nombre': plantacion.get_nombre(),
+                'superficie': plantacion.get_superficie_total(),
+                'columnar': plantacion.es_columnar(),
+                'agua_disponible': plantacion.get_agua_disponible(),
+                'cantidad_cultivos': len(plantacion.get_cultivos())
+            },
+            'trabajadores': [SerializadorRegistro._trabajador_a_dict(t)
+                             for t in plantacion.get_trabajadores()]
+        }
+    
+    @staticmethod
+    def registro_desde_dict(datos: dict) -> RegistroForestal:
+        """Arma el registro (con la plantación vacía) a partir de registro_a_dict."""
+        datos_plantacion = datos['plantacion']
+        plantacion = Plantacion(datos_plantacion['nombre'], datos_plantacion['superficie'],
+                                datos_plantacion['columnar'])
+        plantacion.set_agua_disponible(datos_plantacion['agua_disponible'])
+        for datos_trabajador in datos['trabajadores']:
+            plantacion.add_trabajador(SerializadorRegistro._trabajador_desde_dict(datos_trabajador))
+        
+        datos_tierra = datos['tierra']
+        tierra = Tierra(datos_tierra['id_padron'], datos_tierra['superficie'],
+                        datos_tierra['domicilio'])
+        tierra.set_finca(plantacion)
+        
+        return RegistroForestal(datos['id_padron'], tierra, plantacion,
+                                datos['propietario'], datos['avaluo'])
+    
+    @staticmethod
+    def _trabajador_a_dict(trabajador: Trabajador) -> dict:
+        apto = trabajador.get_apto_medico()
+        return {
+            'dni': trabajador.get_dni(),
+            'nombre': trabajador.get_nombre(),
+            'apto_medico': None if apto is None else {
+                'fecha_emision': apto.get_fecha_emision().isoformat(),
+                'observaciones': apto.get_observaciones()
+            },
+            'tareas': [{
+                'id': tarea.get_id(),
+                'descripcion': tarea.get_descripcion(),
+                'fecha_programada': tarea.get_fecha_programada().isoformat(),
+                'estado': tarea.get_estado().value
+            } for tarea in trabajador.get_tareas()]
+        }
+    
+    @staticmethod
+    def _trabajador_desde_dict(datos: dict) -> Trabajador:
+        tareas = []
+        for datos_tarea in datos['tareas']:
+            tarea = Tarea(datos_tarea['id'], datos_tarea['descripcion'],
+                          date.fromisoformat(datos_tarea['fecha_programada']))
+            if EstadoTarea(datos_tarea['estado']) == EstadoTarea.COMPLETADA:
+                tarea.marcar_completada()
+            tareas.append(tarea)
+        
+        apto = None
+        if datos['apto_medico'] is not None:
+            apto = AptoMedico(date.fromisoformat(datos['apto_medico']['fecha_emision']),
+                              datos['apto_medico']['observaciones'])
+        return Trabajador(datos['dni'], datos['nombre'], tareas, apto)
+
+
+def _serializadores() -> List[SerializadorRegistro]:
+    """Instancias de los serializadores disponibles (import diferido para evitar ciclos)."""
+    from python_forestacion.persistencia.impl.serializador_pickle import SerializadorPickle
+    from python_forestacion.persistencia.impl.serializador_binario import SerializadorBinario
+    from python_forestacion.persistencia.impl.serializador_json_lineas import SerializadorJsonLineas
+    return [SerializadorPickle(), SerializadorBinario(), SerializadorJsonLineas()]
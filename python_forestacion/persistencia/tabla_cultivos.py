@@ -0,0 +1,245 @@
+# python_forestacion/persistencia/tabla_cultivos.py
+"""
+Tabla binaria de ancho fijo con los cultivos de un registro.
+
+Se guarda junto al registro (<propietario>.tabla) y se abre con mmap: los
+conteos, agregados por especie y el acceso a la fila i se resuelven
+leyendo directamente las columnas del archivo, sin deserializar cultivos.
+
+Estructura:
+    encabezado fijo: MAGIA, versión, orden de bytes, cantidad de filas,
+                     agua disponible, superficie total, firma del registro
+                     (tamaño, mtime en ns e inodo), cantidad por especie
+    columnas contiguas de `cantidad` elementos cada una:
+        especie (B), [relleno a 8 bytes], agua (q), superficie (d), altura (d)
+
+La tabla y el registro se escriben por separado: la firma del registro del
+que salió la tabla permite detectar una tabla que no le corresponde (p. ej.
+una caída entre escribir uno y otro) y regenerarla.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Dict, Optional, Tuple, TYPE_CHECKING
+
+from python_forestacion.entidades.cultivos.arbol import Arbol
+from python_forestacion.entidades.cultivos.especie_cultivo import EspecieCultivo
+
+if TYPE_CHECKING:
+    from python_forestacion.entidades.terrenos.plantacion import Plantacion
+
+
+class TablaCultivos:
+    """
+    Lectura de una tabla de cultivos mapeada en memoria.
+    
+    Uso:
+        with TablaCultivos(ruta) as tabla:
+            tabla.contar_por_especie()
+    """
+    
+    MAGIA = b"PFCT"
+    VERSION = 3
+    
+    _MAGIA_VERSION = struct.Struct("<4sB")
+    _ENCABEZADO = struct.Struct("<4sBcQqdQqQ" + "Q" * len(EspecieCultivo))
+    _ALINEACION = 8
+    
+    # (nombre, typecode) en el orden en que se escriben las columnas
+    _COLUMNAS = (('especie', 'B'), ('agua', 'q'), ('superficie', 'd'), ('altura', 'd'))
+    
+    def __init__(self, ruta: str):
+        """
+        Abre la tabla en modo sólo lectura.
+        
+        Raises:
+            ValueError: Si el archivo no es una tabla de cultivos válida
+        """
+        self._archivo = open(ruta, 'rb')
+        try:
+            self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._archivo.close()
+            raise
+        self._vistas = []
+        try:
+            self._leer_encabezado()
+            self._mapear_columnas()
+        except Exception:
+            self.cerrar()
+            raise
+    
+    def _leer_encabezado(self) -> None:
+        if len(self._mapa) < self._MAGIA_VERSION.size:
+            raise ValueError("Tabla de cultivos truncada")
+        magia, version = self._MAGIA_VERSION.unpack_from(self._mapa, 0)
+        if magia != self.MAGIA:
+            raise ValueError("El archivo no es una tabla de cultivos")
+        if version != self.VERSION:
+            # Las tablas de versiones anteriores (sin firma completa) se regeneran
+            raise ValueError(f"Versión de tabla no soportada: {version}")
+        if len(self._mapa) < self._ENCABEZADO.size:
+            raise ValueError("Tabla de cultivos truncada")
+        campos = self._ENCABEZADO.unpack_from(self._mapa, 0)
+        orden, cantidad, agua, superficie = campos[2:6]
+        self._cantidad = cantidad
+        self._agua_disponible = agua
+        self._superficie_total = superficie
+        self._firma_registro = campos[6:9]
+        self._conteos = {especie: campos[9 + especie] for especie in EspecieCultivo}
+        # Columnas escritas en una máquina con otro orden de bytes: se copian
+        self._orden_nativo = orden == TablaCultivos._marca_orden()
+    
+    def _mapear_columnas(self) -> None:
+        desplazamiento = self._ENCABEZADO.size
+        for nombre, codigo in self._COLUMNAS:
+            desplazamiento = TablaCultivos._alinear(desplazamiento)
+            largo = self._cantidad * array(codigo).itemsize
+            if desplazamiento + largo > len(self._mapa):
+                raise ValueError("Tabla de cultivos truncada")
+            vista = memoryview(self._mapa)[desplazamiento:desplazamiento + largo]
+            self._vistas.append(vista)
+            if self._orden_nativo:
+                columna = vista.cast(codigo)
+                self._vistas.append(columna)
+            else:
+                columna = array(codigo, vista)
+                columna.byteswap()
+            setattr(self, '_' + nombre, columna)
+            desplazamiento += largo
+    
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+    def cerrar(self) -> None:
+        """Libera el mapeo y el archivo (las columnas dejan de ser válidas)."""
+        for vista in reversed(self._vistas):
+            vista.release()
+        self._vistas = []
+        if not self._mapa.closed:
+            self._mapa.close()
+        self._archivo.close()
+    
+    def __enter__(self) -> 'TablaCultivos':
+        return self
+    
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+    
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return self._cantidad
+    
+    def __getitem__(self, indice: int) -> Tuple[EspecieCultivo, int, float, float]:
+        """Fila `indice` como (especie, agua, superficie, altura)."""
+        if indice < 0:
+            indice += self._cantidad
+        if not 0 <= indice < self._cantidad:
+            raise IndexError("índice de cultivo fuera de rango")
+        return (EspecieCultivo(self._especie[indice]), self._agua[indice],
+                self._superficie[indice], self._altura[indice])
+    
+    def get_agua_disponible(self) -> int:
+        return self._agua_disponible
+    
+    def get_superficie_total(self) -> float:
+        return self._superficie_total
+    
+    def get_firma_registro(self) -> Tuple[int, int, int]:
+        """Firma (tamaño, mtime en ns, inodo) del registro del que se escribió la tabla."""
+        return self._firma_registro
+    
+    def contar_por_especie(self) -> Dict[EspecieCultivo, int]:
+        """Cantidad de cultivos por especie (sólo lee el encabezado)."""
+        return {especie: cantidad for especie, cantidad in self._conteos.items() if cantidad}
+    
+    def calcular_superficie_ocupada(self) -> float:
+        return sum(self._superficie)
+    
+    def sumar_agua(self) -> int:
+        """Agua total absorbida por los cultivos."""
+        return sum(self._agua)
+    
+    def sumar_por_especie(self, columna: str) -> Dict[EspecieCultivo, float]:
+        """
+        Suma una columna ('agua', 'superficie' o 'altura') agrupada por especie.
+        
+        Raises:
+            ValueError: Si la columna es desconocida
+        """
+        if columna not in ('agua', 'superficie', 'altura'):
+            raise ValueError(f"Columna desconocida: {columna}")
+        valores = getattr(self, '_' + columna)
+        totales = [0] * len(EspecieCultivo)
+        for especie, valor in zip(self._especie, valores):
+            totales[especie] += valor
+        return {especie: totales[especie] for especie in EspecieCultivo
+                if self._conteos[especie]}
+    
+    # ------------------------------------------------------------------
+    # Escritura
+    # ------------------------------------------------------------------
+    @staticmethod
+    def escribir(plantacion: 'Plantacion', archivo: BinaryIO,
+                 firma_registro: Optional[Tuple[int, int, int]] = None) -> None:
+        """
+        Escribe la tabla de cultivos de la plantación.
+        
+        En modo columnar las columnas se vuelcan tal cual; en modo objetos
+        se recorren los cultivos una vez para armarlas.
+        
+        Args:
+            plantacion: Plantación del registro
+            archivo: Destino de la tabla
+            firma_registro: Firma (DiarioRegistro.firma_base) del registro
+                ya guardado al que corresponde la tabla; None la deja en cero
+        """
+        firma_registro = firma_registro or (0, 0, 0)
+        columnas = TablaCultivos._columnas_de(plantacion)
+        especies = columnas[0]
+        
+        conteos = [0] * len(EspecieCultivo)
+        for especie in especies:
+            conteos[especie] += 1
+        
+        archivo.write(TablaCultivos._ENCABEZADO.pack(
+            TablaCultivos.MAGIA, TablaCultivos.VERSION, TablaCultivos._marca_orden(),
+            len(especies), plantacion.get_agua_disponible(),
+            plantacion.get_superficie_total(), *firma_registro, *conteos
+        ))
+        
+        desplazamiento = TablaCultivos._ENCABEZADO.size
+        for columna in columnas:
+            relleno = TablaCultivos._alinear(desplazamiento) - desplazamiento
+            archivo.write(b"\0" * relleno)
+            datos = columna.tobytes()
+            archivo.write(datos)
+            desplazamiento += relleno + len(datos)
+    
+    @staticmethod
+    def _columnas_de(plantacion: 'Plantacion') -> Tuple[array, ...]:
+        cultivos = plantacion.get_cultivos()
+        if plantacion.es_columnar():
+            return (cultivos.get_especies(), cultivos.get_aguas(),
+                    cultivos.get_superficies(), cultivos.get_alturas())
+        
+        especie_de = EspecieCultivo.de_cultivo
+        especies = array('B', [especie_de(c) for c in cultivos])
+        aguas = array('q', [c.get_agua() for c in cultivos])
+        superficies = array('d', [c.get_superficie() for c in cultivos])
+        alturas = array('d', [c.get_altura() if isinstance(c, Arbol) else 0.0
+                              for c in cultivos])
+        return especies, aguas, superficies, alturas
+    
+    @staticmethod
+    def _alinear(desplazamiento: int) -> int:
+        resto = desplazamiento % TablaCultivos._ALINEACION
+        return desplazamiento + (TablaCultivos._ALINEACION - resto if resto else 0)
+    
+    @staticmethod
+    def _marca_orden() -> bytes:
+        return b"<" if sys.byteorder == 'little' else b">"
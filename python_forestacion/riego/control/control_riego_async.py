@@ -0,0 +1,112 @@
+import asyncio
+from typing import Optional, TYPE_CHECKING
+
+from python_forestacion.patrones.observer.observer_async import ObserverAsync
+from python_forestacion.patrones.observer.eventos.evento_sensor import EventoSensor
+from python_forestacion.patrones.observer.eventos.tipo_sensor import TipoSensor
+from python_forestacion.patrones.observer.eventos.ultimas_lecturas import UltimasLecturas
+from python_forestacion.riego.control.control_riego_task import ControlRiegoTask
+from python_forestacion.constantes import DEBOUNCE_CONTROL_RIEGO, ANTIGUEDAD_MAXIMA_LECTURA
+
+if TYPE_CHECKING:
+    from python_forestacion.entidades.terrenos.plantacion import Plantacion
+    from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
+    from python_forestacion.riego.sensores.sensores_async import SensorAsync
+    from python_forestacion.persistencia.diario_registro import DiarioRegistro
+
+
+class ControlRiegoAsync(ObserverAsync[EventoSensor]):
+    """
+    Controlador de riego como corrutina (equivalente a ControlRiegoTask).
+
+    Funciona igual que el control por eventos de ControlRiegoTask: cada
+    lectura despierta a la tarea, que espera `debounce` segundos para
+    agrupar la ráfaga y evalúa una vez con la misma regla
+    (ControlRiegoTask.condiciones_riego) y la misma política de vigencia
+    de las lecturas (UltimasLecturas).
+
+    El riego en sí es trabajo de CPU sincrónico, así que se corre con
+    asyncio.to_thread: el event loop sigue atendiendo al resto de los
+    sensores y plantaciones mientras tanto. Como la tarea espera a que
+    termine, una plantación nunca tiene dos riegos simultáneos.
+    """
+
+    def __init__(
+        self,
+        sensor_temperatura: "SensorAsync",
+        sensor_humedad: "SensorAsync",
+        plantacion: "Plantacion",
+        plantacion_service: "PlantacionService",
+        diario: Optional["DiarioRegistro"] = None,
+        debounce: float = DEBOUNCE_CONTROL_RIEGO,
+        antiguedad_maxima: float = ANTIGUEDAD_MAXIMA_LECTURA
+    ):
+        # El riego corre en un hilo del pool de asyncio.to_thread
+        plantacion.set_concurrente(True)
+        self._plantacion = plantacion
+        self._plantacion_service = plantacion_service
+        self._diario = diario
+        self._debounce = debounce
+
+        self._lecturas = UltimasLecturas(antiguedad_maxima)
+        self._lecturas_pendientes = asyncio.Event()
+        self._detenido = asyncio.Event()
+        self._riegos = 0
+
+        sensor_temperatura.agregar_observador(self)
+        sensor_humedad.agregar_observador(self)
+
+    async def actualizar(self, evento: EventoSensor) -> None:
+        """
+        Recibe eventos de sensores.
+
+        Args:
+            evento: Lectura de un sensor, con su tipo y su instante
+        """
+        if not self._lecturas.registrar(evento):
+            print(f"[WARN] Lectura descartada: {evento}")
+            return
+        self._lecturas_pendientes.set()
+
+    async def ejecutar(self) -> None:
+        """Bucle principal de control (corre hasta detener)."""
+        while not self._detenido.is_set():
+            await self._lecturas_pendientes.wait()
+            # Debounce: las lecturas que llegan durante la ventana se evalúan juntas
+            try:
+                await asyncio.wait_for(self._detenido.wait(), self._debounce)
+            except asyncio.TimeoutError:
+                pass
+            if self._detenido.is_set():
+                break
+            self._lecturas_pendientes.clear()
+            try:
+                if ControlRiegoTask.condiciones_riego(
+                        self._lecturas.get_valor_vigente(TipoSensor.TEMPERATURA),
+                        self._lecturas.get_valor_vigente(TipoSensor.HUMEDAD)):
+                    # Las lecturas y el contador sólo se tocan desde el event loop
+                    mensaje = ControlRiegoTask.mensaje_riego(self._lecturas)
+                    await asyncio.to_thread(self._ejecutar_riego, mensaje)
+                    self._riegos += 1
+            except Exception as e:
+                print(f"[ERROR] Fallo en ControlRiegoAsync: {e}")
+
+    def _ejecutar_riego(self, mensaje: str) -> None:
+        """Ejecuta la acción de riego sobre la plantación (en un hilo del pool)."""
+        print(mensaje)
+        if self._diario is None:
+            self._plantacion_service.regar(self._plantacion)
+        else:
+            self._plantacion_service.regar_por_lote(self._plantacion, diario=self._diario)
+
+    def get_riegos(self) -> int:
+        """Riegos ejecutados."""
+        return self._riegos
+
+    def get_plantacion(self) -> "Plantacion":
+        return self._plantacion
+
+    def detener(self) -> None:
+        """Detiene el control, despertándolo si está esperando lecturas."""
+        self._detenido.set()
+        self._lecturas_pendientes.set()
@@ -3,8 +3,14 @@ import time
 from typing import Optional, TYPE_CHECKING
 
 from python_forestacion.patrones.observer.observer import Observer
+from python_forestacion.patrones.observer.eventos.evento_sensor import EventoSensor
+from python_forestacion.patrones.observer.eventos.tipo_sensor import TipoSensor
+from python_forestacion.patrones.observer.eventos.ultimas_lecturas import UltimasLecturas
 from python_forestacion.constantes import (
     INTERVALO_CONTROL_RIEGO,
+    DEBOUNCE_CONTROL_RIEGO,
+    ANTIGUEDAD_MAXIMA_LECTURA,
+    CONTROL_RIEGO_POR_EVENTOS,
     TEMP_MIN_RIEGO,
     TEMP_MAX_RIEGO,
     HUMEDAD_MAX_RIEGO
@@ -15,14 +21,32 @@ if TYPE_CHECKING:
     from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
     from python_forestacion.riego.sensores.temperatura_reader_task import TemperaturaReaderTask
     from python_forestacion.riego.sensores.humedad_reader_task import HumedadReaderTask
+    from python_forestacion.persistencia.diario_registro import DiarioRegistro
 
 
-class ControlRiegoTask(threading.Thread, Observer[float]):
+class ControlRiegoTask(threading.Thread, Observer[EventoSensor]):
     """
     Controlador automático de riego basado en condiciones ambientales.
 
     Observa lecturas de sensores de temperatura y humedad,
     y activa el riego cuando las condiciones lo requieren.
+
+    Cada EventoSensor dice de qué magnitud es, así que la lectura se
+    guarda por su tipo. Sólo se riega con lecturas de menos de
+    `antiguedad_maxima` segundos: si un sensor deja de informar, el
+    control no sigue regando con su último valor.
+
+    Con un diario, cada riego se hace por lote y queda anotado en él, de
+    modo que el estado sobrevive a un reinicio sin reescribir el registro.
+    La plantación pasa a modo concurrente (Plantacion.set_concurrente):
+    el riego de este hilo no se mezcla con lo que otro hilo plante o coseche.
+
+    Por defecto el control es por eventos: cada lectura despierta al hilo,
+    que espera `debounce` segundos para agrupar una ráfaga de lecturas y
+    evalúa una sola vez con la última de cada sensor. Sin lecturas nuevas
+    el hilo queda bloqueado (sin consumir CPU), y detener lo despierta
+    de inmediato. Con `por_eventos=False` se conserva el control por
+    consulta periódica cada INTERVALO_CONTROL_RIEGO.
     """
 
     def __init__(
@@ -30,73 +54,146 @@ class ControlRiegoTask(threading.Thread, Observer[float]):
         sensor_temperatura: "TemperaturaReaderTask",
         sensor_humedad: "HumedadReaderTask",
         plantacion: "Plantacion",
-        plantacion_service: "PlantacionService"
+        plantacion_service: "PlantacionService",
+        diario: Optional["DiarioRegistro"] = None,
+        por_eventos: bool = CONTROL_RIEGO_POR_EVENTOS,
+        debounce: float = DEBOUNCE_CONTROL_RIEGO,
+        antiguedad_maxima: float = ANTIGUEDAD_MAXIMA_LECTURA
     ):
         super().__init__(daemon=True)
 
+        # Se riega desde este hilo mientras el principal puede plantar o cosechar
+        plantacion.set_concurrente(True)
         self._plantacion = plantacion
         self._plantacion_service = plantacion_service
+        self._diario = diario
+        self._por_eventos = por_eventos
+        self._debounce = debounce
 
-        self._ultima_temperatura: Optional[float] = None
-        self._ultima_humedad: Optional[float] = None
+        self._lecturas = UltimasLecturas(antiguedad_maxima)
         self._detenido = threading.Event()
+        # Señala lecturas nuevas todavía no evaluadas (modo por eventos)
+        self._condicion = threading.Condition()
+        self._lecturas_pendientes = False
+        self._evaluaciones = 0
 
         # Registro como observador (patrón Observer)
         sensor_temperatura.agregar_observador(self)
         sensor_humedad.agregar_observador(self)
 
-    def actualizar(self, evento: float) -> None:
+    def actualizar(self, evento: EventoSensor) -> None:
         """
         Recibe eventos de sensores.
 
         Args:
-            evento: Lectura del sensor (puede ser temperatura o humedad)
+            evento: Lectura de un sensor, con su tipo y su instante
         """
-        if -50 <= evento <= 70:  # Temperatura (más rango por seguridad)
-            self._ultima_temperatura = evento
-        elif 0 <= evento <= 100:  # Humedad
-            self._ultima_humedad = evento
-        else:
-            print(f"[WARN] Lectura fuera de rango ignorada: {evento}")
+        with self._condicion:
+            if not self._lecturas.registrar(evento):
+                print(f"[WARN] Lectura descartada: {evento}")
+                return
+            self._lecturas_pendientes = True
+            self._condicion.notify()
 
     def run(self) -> None:
         """Bucle principal de control automático."""
         print("[CONTROL] Riego automático iniciado ✅")
 
         while not self._detenido.is_set():
+            if self._por_eventos:
+                if not self._esperar_lecturas():
+                    break
             try:
-                if self._debe_regar():
-                    self._ejecutar_riego()
+                self._evaluaciones += 1
+                mensaje = self._evaluar_riego()
+                if mensaje is not None:
+                    self._ejecutar_riego(mensaje)
             except Exception as e:
                 print(f"[ERROR] Fallo en ControlRiegoTask: {e}")
 
-            time.sleep(INTERVALO_CONTROL_RIEGO)
+            if not self._por_eventos:
+                # wait en lugar de sleep: detener no espera el intervalo completo
+                self._detenido.wait(INTERVALO_CONTROL_RIEGO)
 
         print("[CONTROL] Riego automático detenido 📴")
 
-    def _debe_regar(self) -> bool:
+    def _esperar_lecturas(self) -> bool:
+        """
+        Bloquea hasta que llegan lecturas nuevas y se calma la ráfaga.
+
+        Returns:
+            bool: False si el control se detuvo mientras esperaba.
+        """
+        with self._condicion:
+            self._condicion.wait_for(
+                lambda: self._lecturas_pendientes or self._detenido.is_set()
+            )
+            # Debounce: las lecturas que llegan durante la ventana se evalúan juntas
+            limite = time.monotonic() + self._debounce
+            while not self._detenido.is_set():
+                restante = limite - time.monotonic()
+                if restante <= 0:
+                    break
+                self._condicion.wait(restante)
+            self._lecturas_pendientes = False
+        return not self._detenido.is_set()
+
+    def get_evaluaciones(self) -> int:
+        """Veces que se evaluaron las condiciones de riego."""
+        return self._evaluaciones
+
+    def _evaluar_riego(self) -> Optional[str]:
         """
         Evalúa si deben cumplirse las condiciones para regar.
 
+        El mensaje se arma en la misma sección crítica que la evaluación:
+        anuncia las lecturas que decidieron el riego, no otras que un
+        sensor haya registrado después.
+
         Returns:
-            bool: True si debe activarse el riego.
+            str: Mensaje del riego si debe activarse, o None.
         """
-        if self._ultima_temperatura is None or self._ultima_humedad is None:
+        with self._condicion:
+            temperatura = self._lecturas.get_valor_vigente(TipoSensor.TEMPERATURA)
+            humedad = self._lecturas.get_valor_vigente(TipoSensor.HUMEDAD)
+            if not ControlRiegoTask.condiciones_riego(temperatura, humedad):
+                return None
+            return ControlRiegoTask.mensaje_riego(self._lecturas)
+
+    @staticmethod
+    def condiciones_riego(temperatura: Optional[float], humedad: Optional[float]) -> bool:
+        """
+        Regla de riego: temperatura en rango y humedad baja.
+
+        Returns:
+            bool: True si con esas lecturas corresponde regar (False si falta
+            alguna o está vencida).
+        """
+        if temperatura is None or humedad is None:
             return False
 
-        temp_ok = TEMP_MIN_RIEGO <= self._ultima_temperatura <= TEMP_MAX_RIEGO
-        humedad_ok = self._ultima_humedad < HUMEDAD_MAX_RIEGO
+        temp_ok = TEMP_MIN_RIEGO <= temperatura <= TEMP_MAX_RIEGO
+        humedad_ok = humedad < HUMEDAD_MAX_RIEGO
 
         return temp_ok and humedad_ok
 
-    def _ejecutar_riego(self) -> None:
+    @staticmethod
+    def mensaje_riego(lecturas: UltimasLecturas) -> str:
+        """Línea que anuncia un riego con las lecturas que lo dispararon."""
+        temperatura = lecturas.get_lectura(TipoSensor.TEMPERATURA).get_valor()
+        humedad = lecturas.get_lectura(TipoSensor.HUMEDAD).get_valor()
+        return f"\n[RIEGO AUTO] T={temperatura:.1f}°C | H={humedad:.1f}% → REGANDO 💧"
+
+    def _ejecutar_riego(self, mensaje: str) -> None:
         """Ejecuta la acción de riego sobre la plantación."""
-        print(
-            f"\n[RIEGO AUTO] T={self._ultima_temperatura:.1f}°C | "
-            f"H={self._ultima_humedad:.1f}% → REGANDO 💧"
-        )
-        self._plantacion_service.regar(self._plantacion)
+        print(mensaje)
+        if self._diario is None:
+            self._plantacion_service.regar(self._plantacion)
+        else:
+            self._plantacion_service.regar_por_lote(self._plantacion, diario=self._diario)
 
     def detener(self) -> None:
-        """Detiene el hilo de forma controlada."""
+        """Detiene el hilo de forma controlada, despertándolo si está esperando."""
         self._detenido.set()
+        with self._condicion:
+            self._condicion.notify_all()
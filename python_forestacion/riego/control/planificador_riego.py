@@ -0,0 +1,221 @@
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, Iterable, List, Optional, TYPE_CHECKING
+
+from python_forestacion.patrones.observer.observer import Observer
+from python_forestacion.patrones.observer.eventos.evento_sensor import EventoSensor
+from python_forestacion.patrones.observer.eventos.tipo_sensor import TipoSensor
+from python_forestacion.patrones.observer.eventos.ultimas_lecturas import UltimasLecturas
+from python_forestacion.riego.control.control_riego_task import ControlRiegoTask
+from python_forestacion.constantes import MAX_HILOS_RIEGO, ANTIGUEDAD_MAXIMA_LECTURA
+
+if TYPE_CHECKING:
+    from python_forestacion.entidades.terrenos.plantacion import Plantacion
+    from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
+    from python_forestacion.patrones.observer.observable import Observable
+    from python_forestacion.persistencia.diario_registro import DiarioRegistro
+
+
+class _UnidadRiego(Observer[EventoSensor]):
+    """Una plantación del planificador: sus lecturas, su lock y su estado en la cola."""
+
+    def __init__(self, planificador: "PlanificadorRiego", plantacion: "Plantacion",
+                 diario: Optional["DiarioRegistro"], antiguedad_maxima: float):
+        self.planificador = planificador
+        self.plantacion = plantacion
+        self.diario = diario
+        self.lecturas = UltimasLecturas(antiguedad_maxima)
+        # Ningún riego de esta plantación corre sin tenerlo
+        self.lock = threading.Lock()
+        self.en_cola = False
+        self.en_curso = False
+        # Llegaron lecturas mientras se regaba: volver a evaluar al terminar
+        self.pendiente = False
+        self.riegos = 0
+
+    def actualizar(self, evento: EventoSensor) -> None:
+        self.planificador._recibir(self, evento)
+
+    def debe_regar(self) -> bool:
+        return ControlRiegoTask.condiciones_riego(
+            self.lecturas.get_valor_vigente(TipoSensor.TEMPERATURA),
+            self.lecturas.get_valor_vigente(TipoSensor.HUMEDAD)
+        )
+
+
+class PlanificadorRiego(threading.Thread):
+    """
+    Riego automático de muchas plantaciones con un pool de hilos compartido.
+
+    Aplica la misma regla que ControlRiegoTask (condiciones_riego, con
+    lecturas vigentes), pero en lugar de un hilo controlador por
+    plantación hay uno solo que decide y `max_hilos` hilos que riegan:
+    - Equidad: las plantaciones con lecturas nuevas esperan en una cola
+      FIFO, y una plantación que acaba de regarse vuelve al final. Ninguna
+      se riega dos veces mientras otra espera su turno.
+    - Contrapresión: sólo se despachan riegos cuando hay un hilo libre,
+      así que el pool nunca acumula trabajo. Una plantación está en la
+      cola a lo sumo una vez y sus lecturas se reemplazan por las más
+      nuevas, de modo que una ráfaga de lecturas no hace crecer la cola:
+      queda acotada por la cantidad de plantaciones.
+    - Exclusión: cada plantación tiene su lock (get_lock), y el
+      planificador no la despacha otra vez hasta que terminó su riego;
+      dos riegos nunca tocan la misma plantación a la vez.
+
+    La decisión se toma al llegar al frente de la cola, con las últimas
+    lecturas: si mientras esperaba dejaron de cumplir la regla, no ocupa
+    un hilo del pool.
+
+    Uso:
+        planificador = PlanificadorRiego(plantacion_service)
+        planificador.agregar_plantacion(plantacion, [sensor_temp, sensor_hum])
+        planificador.start()
+        ...
+        planificador.detener()
+    """
+
+    def __init__(self, plantacion_service: "PlantacionService",
+                 max_hilos: int = MAX_HILOS_RIEGO,
+                 antiguedad_maxima: float = ANTIGUEDAD_MAXIMA_LECTURA):
+        super().__init__(daemon=True)
+        if max_hilos <= 0:
+            raise ValueError(f"La cantidad de hilos de riego debe ser positiva: {max_hilos}")
+
+        self._plantacion_service = plantacion_service
+        self._max_hilos = max_hilos
+        self._antiguedad_maxima = antiguedad_maxima
+
+        self._unidades: Dict[int, _UnidadRiego] = {}
+        self._cola: Deque[_UnidadRiego] = deque()
+        self._en_vuelo = 0
+        self._evaluaciones = 0
+        self._condicion = threading.Condition()
+        self._detenido = threading.Event()
+
+    def agregar_plantacion(self, plantacion: "Plantacion",
+                           sensores: Iterable["Observable[EventoSensor]"],
+                           diario: Optional["DiarioRegistro"] = None) -> None:
+        """
+        Suma una plantación al riego automático y la pasa a modo concurrente.
+
+        Args:
+            plantacion: Plantación a regar
+            sensores: Sensores cuyas lecturas deciden el riego de esta plantación
+            diario: Si se indica, se riega por lote anotando en el diario
+
+        Raises:
+            ValueError: Si la plantación ya estaba agregada
+        """
+        with self._condicion:
+            if id(plantacion) in self._unidades:
+                raise ValueError(f"La plantación '{plantacion.get_nombre()}' ya está en el planificador")
+            # Los hilos del pool la riegan mientras otros pueden modificarla
+            plantacion.set_concurrente(True)
+            unidad = _UnidadRiego(self, plantacion, diario, self._antiguedad_maxima)
+            self._unidades[id(plantacion)] = unidad
+        for sensor in sensores:
+            sensor.agregar_observador(unidad)
+
+    def _recibir(self, unidad: _UnidadRiego, evento: EventoSensor) -> None:
+        """Registra una lectura y encola la plantación si no estaba esperando."""
+        with self._condicion:
+            if not unidad.lecturas.registrar(evento):
+                print(f"[WARN] Lectura descartada ({unidad.plantacion.get_nombre()}): {evento}")
+                return
+            if unidad.en_curso:
+                unidad.pendiente = True
+            elif not unidad.en_cola:
+                unidad.en_cola = True
+                self._cola.append(unidad)
+                self._condicion.notify()
+
+    def run(self) -> None:
+        """Bucle del planificador: toma plantaciones de la cola a medida que hay hilos libres."""
+        print(f"[CONTROL] Planificador de riego iniciado: {self._max_hilos} hilos ✅")
+        pool = ThreadPoolExecutor(max_workers=self._max_hilos,
+                                  thread_name_prefix="riego")
+        try:
+            while True:
+                with self._condicion:
+                    self._condicion.wait_for(
+                        lambda: self._detenido.is_set()
+                        or (self._cola and self._en_vuelo < self._max_hilos)
+                    )
+                    if self._detenido.is_set():
+                        break
+                    unidad = self._cola.popleft()
+                    unidad.en_cola = False
+                    self._evaluaciones += 1
+                    if not unidad.debe_regar():
+                        continue
+                    unidad.en_curso = True
+                    self._en_vuelo += 1
+                    mensaje = ControlRiegoTask.mensaje_riego(unidad.lecturas)
+                pool.submit(self._regar, unidad, mensaje)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+        print("[CONTROL] Planificador de riego detenido 📴")
+
+    def _regar(self, unidad: _UnidadRiego, mensaje: str) -> None:
+        """Riega una plantación (en un hilo del pool) y la libera para el próximo turno."""
+        try:
+            with unidad.lock:
+                print(f"{mensaje} [{unidad.plantacion.get_nombre()}]")
+                if unidad.diario is None:
+                    self._plantacion_service.regar(unidad.plantacion)
+                else:
+                    self._plantacion_service.regar_por_lote(unidad.plantacion, diario=unidad.diario)
+                unidad.riegos += 1
+        except Exception as e:
+            print(f"[ERROR] Fallo al regar '{unidad.plantacion.get_nombre()}': {e}")
+        finally:
+            with self._condicion:
+                self._en_vuelo -= 1
+                unidad.en_curso = False
+                if unidad.pendiente:
+                    # Lecturas recibidas durante el riego: turno al final de la cola
+                    unidad.pendiente = False
+                    unidad.en_cola = True
+                    self._cola.append(unidad)
+                self._condicion.notify()
+
+    def get_lock(self, plantacion: "Plantacion") -> threading.Lock:
+        """
+        Lock que toma el planificador para regar `plantacion`.
+
+        Quien modifique la plantación fuera del planificador puede tomarlo
+        para no solaparse con un riego.
+
+        Raises:
+            KeyError: Si la plantación no está en el planificador
+        """
+        return self._unidades[id(plantacion)].lock
+
+    def get_riegos(self, plantacion: Optional["Plantacion"] = None) -> int:
+        """Riegos ejecutados en `plantacion` (o en todas, si no se indica)."""
+        if plantacion is not None:
+            return self._unidades[id(plantacion)].riegos
+        return sum(unidad.riegos for unidad in self._unidades.values())
+
+    def get_evaluaciones(self) -> int:
+        """Veces que se evaluaron las condiciones de riego de alguna plantación."""
+        return self._evaluaciones
+
+    def get_plantaciones(self) -> List["Plantacion"]:
+        return [unidad.plantacion for unidad in self._unidades.values()]
+
+    def get_cantidad_en_cola(self) -> int:
+        """Plantaciones esperando turno."""
+        with self._condicion:
+            return len(self._cola)
+
+    def detener(self) -> None:
+        """
+        Detiene el planificador, despertándolo si está esperando.
+
+        Los riegos en curso terminan; los que estaban en la cola se descartan.
+        """
+        self._detenido.set()
+        with self._condicion:
+            self._condicion.notify_all()
@@ -0,0 +1,87 @@
+import asyncio
+from typing import List, Optional, Tuple, TYPE_CHECKING
+
+from python_forestacion.riego.sensores.sensores_async import (
+    TemperaturaReaderAsync,
+    HumedadReaderAsync
+)
+from python_forestacion.riego.control.control_riego_async import ControlRiegoAsync
+
+if TYPE_CHECKING:
+    from python_forestacion.entidades.terrenos.plantacion import Plantacion
+    from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
+    from python_forestacion.persistencia.diario_registro import DiarioRegistro
+
+
+class RuntimeRiegoAsync:
+    """
+    Riego automático de muchas plantaciones sobre un solo event loop.
+
+    Cada plantación tiene sus sensores de temperatura y humedad y su
+    controlador, igual que con TemperaturaReaderTask, HumedadReaderTask y
+    ControlRiegoTask, pero como corrutinas: en lugar de tres hilos por
+    plantación hay un hilo para todas, más el pool de asyncio.to_thread
+    (acotado) donde corren los riegos.
+
+    Uso:
+        runtime = RuntimeRiegoAsync(plantacion_service)
+        for plantacion in plantaciones:
+            runtime.agregar_plantacion(plantacion)
+        runtime.correr(duracion=15)
+    """
+
+    def __init__(self, plantacion_service: "PlantacionService",
+                 mostrar_lecturas: bool = False):
+        self._plantacion_service = plantacion_service
+        self._mostrar_lecturas = mostrar_lecturas
+        self._unidades: List[Tuple[TemperaturaReaderAsync, HumedadReaderAsync, ControlRiegoAsync]] = []
+
+    def agregar_plantacion(self, plantacion: "Plantacion",
+                           diario: Optional["DiarioRegistro"] = None) -> ControlRiegoAsync:
+        """
+        Crea los sensores y el controlador de una plantación.
+
+        Returns:
+            El controlador de la plantación
+        """
+        sensor_temperatura = TemperaturaReaderAsync(mostrar_lecturas=self._mostrar_lecturas)
+        sensor_humedad = HumedadReaderAsync(mostrar_lecturas=self._mostrar_lecturas)
+        controlador = ControlRiegoAsync(sensor_temperatura, sensor_humedad, plantacion,
+                                        self._plantacion_service, diario)
+        self._unidades.append((sensor_temperatura, sensor_humedad, controlador))
+        return controlador
+
+    def get_controladores(self) -> List[ControlRiegoAsync]:
+        return [controlador for _, _, controlador in self._unidades]
+
+    def get_cantidad_plantaciones(self) -> int:
+        return len(self._unidades)
+
+    async def ejecutar(self, duracion: Optional[float] = None) -> None:
+        """
+        Corre todos los sensores y controladores hasta detener (o `duracion` segundos).
+
+        Debe esperarse dentro de un event loop en marcha.
+        """
+        tareas = [asyncio.create_task(componente.ejecutar())
+                  for unidad in self._unidades for componente in unidad]
+        if duracion is not None:
+            asyncio.get_running_loop().call_later(duracion, self.detener)
+        print(f"[CONTROL] Riego asincrónico iniciado: {len(self._unidades)} plantaciones ✅")
+        await asyncio.gather(*tareas)
+        print("[CONTROL] Riego asincrónico detenido 📴")
+
+    def correr(self, duracion: Optional[float] = None) -> None:
+        """Crea un event loop y ejecuta el runtime en él (bloqueante)."""
+        asyncio.run(self.ejecutar(duracion))
+
+    def detener(self) -> None:
+        """
+        Detiene todos los sensores y controladores.
+
+        Debe llamarse desde el event loop; desde otro hilo, usar
+        loop.call_soon_threadsafe(runtime.detener).
+        """
+        for unidad in self._unidades:
+            for componente in unidad:
+                componente.detener()
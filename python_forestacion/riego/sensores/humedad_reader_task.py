@@ -2,6 +2,8 @@ import threading
 import time
 import random
 from python_forestacion.patrones.observer.observable import Observable
+from python_forestacion.patrones.observer.eventos.evento_sensor import EventoSensor
+from python_forestacion.patrones.observer.eventos.tipo_sensor import TipoSensor
 from python_forestacion.constantes import (
     INTERVALO_SENSOR_HUMEDAD,
     HUMEDAD_MIN,
@@ -9,12 +11,13 @@ from python_forestacion.constantes import (
 )
 
 
-class HumedadReaderTask(threading.Thread, Observable[float]):
+class HumedadReaderTask(threading.Thread, Observable[EventoSensor]):
     """Thread que simula lecturas de humedad y notifica a los observadores."""
 
-    def __init__(self):
+    def __init__(self, sensor_id: str = "humedad"):
         super().__init__(daemon=True)
         Observable.__init__(self)
+        self._sensor_id = sensor_id
         self._detenido = threading.Event()
 
     def run(self) -> None:
@@ -25,7 +28,7 @@ class HumedadReaderTask(threading.Thread, Observable[float]):
             while not self._detenido.is_set():
                 humedad = self._leer_humedad()
                 print(f"[SENSOR] Humedad actual: {humedad}%")
-                self.notificar_observadores(humedad)
+                self.notificar_observadores(EventoSensor(self._sensor_id, TipoSensor.HUMEDAD, humedad))
                 time.sleep(INTERVALO_SENSOR_HUMEDAD)
         except Exception as e:
             print(f"[ERROR] Fallo en HumedadReaderTask: {e}")
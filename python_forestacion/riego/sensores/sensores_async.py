@@ -0,0 +1,88 @@
+import asyncio
+import random
+from abc import abstractmethod
+
+from python_forestacion.patrones.observer.observable_async import ObservableAsync
+from python_forestacion.patrones.observer.eventos.evento_sensor import EventoSensor
+from python_forestacion.patrones.observer.eventos.tipo_sensor import TipoSensor
+from python_forestacion.constantes import (
+    INTERVALO_SENSOR_TEMPERATURA,
+    INTERVALO_SENSOR_HUMEDAD,
+    TEMP_MIN,
+    TEMP_MAX,
+    HUMEDAD_MIN,
+    HUMEDAD_MAX
+)
+
+
+class SensorAsync(ObservableAsync[EventoSensor]):
+    """
+    Sensor simulado como corrutina en lugar de hilo.
+
+    Cada sensor es una tarea del event loop que lee, notifica a sus
+    observadores y espera su intervalo; miles de sensores comparten un
+    solo hilo. detener lo despierta aunque esté esperando.
+    """
+
+    TIPO: TipoSensor = None
+    UNIDAD = ""
+
+    def __init__(self, sensor_id: str, intervalo: float, mostrar_lecturas: bool = True):
+        super().__init__()
+        self._sensor_id = sensor_id
+        self._intervalo = intervalo
+        self._mostrar_lecturas = mostrar_lecturas
+        self._detenido = asyncio.Event()
+
+    async def ejecutar(self) -> None:
+        """Bucle principal del sensor (corre hasta detener)."""
+        try:
+            while not self._detenido.is_set():
+                lectura = self._leer()
+                if self._mostrar_lecturas:
+                    print(f"[SENSOR] {self.TIPO.value} actual: {lectura}{self.UNIDAD}")
+                await self.notificar_observadores(EventoSensor(self._sensor_id, self.TIPO, lectura))
+                try:
+                    await asyncio.wait_for(self._detenido.wait(), self._intervalo)
+                except asyncio.TimeoutError:
+                    pass
+        except Exception as e:
+            print(f"[ERROR] Fallo en {self.__class__.__name__}: {e}")
+
+    @abstractmethod
+    def _leer(self) -> float:
+        """Simula la lectura del sensor."""
+
+    def detener(self) -> None:
+        """Detiene el sensor al terminar la espera en curso (de inmediato)."""
+        self._detenido.set()
+
+
+class TemperaturaReaderAsync(SensorAsync):
+    """Sensor asincrónico de temperatura (equivalente a TemperaturaReaderTask)."""
+
+    TIPO = TipoSensor.TEMPERATURA
+    UNIDAD = "°C"
+
+    def __init__(self, sensor_id: str = "temperatura",
+                 intervalo: float = INTERVALO_SENSOR_TEMPERATURA,
+                 mostrar_lecturas: bool = True):
+        super().__init__(sensor_id, intervalo, mostrar_lecturas)
+
+    def _leer(self) -> float:
+        return round(random.uniform(TEMP_MIN, TEMP_MAX), 1)
+
+
+class HumedadReaderAsync(SensorAsync):
+    """Sensor asincrónico de humedad (equivalente a HumedadReaderTask)."""
+
+    TIPO = TipoSensor.HUMEDAD
+    UNIDAD = "%"
+
+    def __init__(self, sensor_id: str = "humedad",
+                 intervalo: float = INTERVALO_SENSOR_HUMEDAD,
+                 mostrar_lecturas: bool = True):
+        super().__init__(sensor_id, intervalo, mostrar_lecturas)
+
+    def _leer(self) -> float:
+        return round(random.uniform(HUMEDAD_MIN, HUMEDAD_MAX), 1)
@@ -1,16 +1,72 @@
+import threading
+from array import array
 from datetime import date
-from typing import TYPE_CHECKING
+from typing import Dict, Hashable, Optional, Sequence, TYPE_CHECKING
 from python_forestacion.patrones.strategy.absorcion_agua_strategy import AbsorcionAguaStrategy
+from python_forestacion.constantes import TAMANIO_CACHE_ABSORCION
 
 if TYPE_CHECKING:
     from python_forestacion.entidades.cultivos.cultivo import Cultivo
 
 
 class CultivoService:
-    """Servicio base para operaciones sobre cultivos."""
+    """
+    Servicio base para operaciones sobre cultivos.
     
-    def __init__(self, estrategia_absorcion: AbsorcionAguaStrategy):
+    Los litros que devuelve la estrategia se memorizan por su clave_cache
+    (el mes para AbsorcionSeasonalStrategy, nada para la constante), de
+    modo que regar planta por planta evalúa la estrategia unas pocas veces
+    y no una vez por planta. La cache es de a lo sumo
+    TAMANIO_CACHE_ABSORCION entradas por servicio; al llenarse se descarta
+    la más antigua.
+    """
+    
+    def __init__(self, estrategia_absorcion: AbsorcionAguaStrategy,
+                 tamanio_cache: int = TAMANIO_CACHE_ABSORCION):
         self._estrategia_absorcion = estrategia_absorcion
+        self._tamanio_cache = tamanio_cache
+        self._cache_absorcion: Dict[Hashable, int] = {}
+        self._lock_cache = threading.Lock()
+        self._clave_cache = estrategia_absorcion.clave_cache
+        self._evaluaciones = 0
+    
+    def _evaluar_estrategia(self, fecha: date, temperatura: float,
+                            humedad: float, cultivo: 'Cultivo') -> int:
+        """Litros según la estrategia, reutilizando el resultado de una clave ya vista."""
+        clave = self._clave_cache(fecha, temperatura, humedad, cultivo)
+        litros = self._cache_absorcion.get(clave)
+        if litros is None:
+            litros = self._estrategia_absorcion.calcular_absorcion(fecha, temperatura, humedad, cultivo)
+            self._registrar_evaluacion(clave, litros)
+        return litros
+    
+    def _registrar_evaluacion(self, clave: Optional[Hashable], litros: int) -> None:
+        """Cuenta una evaluación de la estrategia y memoriza el resultado si la clave lo permite."""
+        with self._lock_cache:
+            self._evaluaciones += 1
+            if clave is None or not self._tamanio_cache:
+                return
+            if len(self._cache_absorcion) >= self._tamanio_cache:
+                del self._cache_absorcion[next(iter(self._cache_absorcion))]
+            self._cache_absorcion[clave] = litros
+    
+    def limpiar_cache_absorcion(self) -> None:
+        """Descarta los resultados memorizados (p. ej. tras cambiar constantes)."""
+        with self._lock_cache:
+            self._cache_absorcion.clear()
+    
+    def get_estadisticas_cache(self) -> Dict[str, int]:
+        """
+        Veces que se evaluó la estrategia y entradas en cache.
+        
+        'evaluaciones' cuenta toda llamada a calcular_absorcion que no salió
+        de la cache, incluidas las de estrategias sin clave_cache (que se
+        evalúan cultivo por cultivo) y las de un servicio sin cache.
+        """
+        return {
+            'evaluaciones': self._evaluaciones,
+            'entradas': len(self._cache_absorcion)
+        }
     
     def absorver_agua(self, cultivo: 'Cultivo', fecha: date = None,
                      temperatura: float = 20.0, humedad: float = 50.0) -> int:
@@ -23,15 +79,66 @@ class CultivoService:
         if fecha is None:
             fecha = date.today()
         
-        litros = self._estrategia_absorcion.calcular_absorcion(
-            fecha, temperatura, humedad, cultivo
-        )
+        litros = self._evaluar_estrategia(fecha, temperatura, humedad, cultivo)
         
         agua_actual = cultivo.get_agua()
         cultivo.set_agua(agua_actual + litros)
         
         return litros
     
+    def calcular_absorcion_grupo(self, representante: 'Cultivo', fecha: date,
+                                 temperatura: float = 20.0,
+                                 humedad: float = 50.0) -> Optional[int]:
+        """
+        Evalúa la estrategia una sola vez para un grupo de cultivos de la misma especie.
+        
+        Sólo vale para todo el grupo si la estrategia declara de qué depende
+        (clave_cache): las claves no incluyen el estado individual del
+        cultivo. Si no lo declara, puede depender de cada cultivo y hay que
+        evaluarlos por separado (calcular_absorcion_cultivos).
+        
+        Returns:
+            Litros que absorbe cada cultivo del grupo, o None si deben
+            evaluarse uno por uno
+        """
+        if self._clave_cache(fecha, temperatura, humedad, representante) is None:
+            return None
+        return self._evaluar_estrategia(fecha, temperatura, humedad, representante)
+    
+    def calcular_absorcion_cultivos(self, cultivos: Sequence['Cultivo'], fecha: date,
+                                    temperatura: float = 20.0,
+                                    humedad: float = 50.0) -> array:
+        """
+        Evalúa la estrategia para cada cultivo, como absorver_agua, sin regarlos.
+        
+        Returns:
+            array('i') con los litros de cada cultivo, en el orden de `cultivos`
+        """
+        return array('i', [self._evaluar_estrategia(fecha, temperatura, humedad, cultivo)
+                           for cultivo in cultivos])
+    
+    def calcular_absorcion_lote(self, cultivos: Sequence['Cultivo'], fechas: Sequence[date],
+                                temperaturas: Sequence[float] = (20.0,),
+                                humedades: Sequence[float] = (50.0,)) -> array:
+        """
+        Evalúa la estrategia para muchos casos en una sola llamada, sin regar.
+        
+        Las secuencias de largo 1 se repiten (ver
+        AbsorcionAguaStrategy.calcular_absorcion_lote): por ejemplo, todos
+        los cultivos de una plantación en una fecha, o un representante a lo
+        largo de una serie de fechas.
+        
+        Returns:
+            array('i') con los litros de cada caso
+        """
+        return self._estrategia_absorcion.calcular_absorcion_lote(
+            fechas, temperaturas, humedades, cultivos
+        )
+    
+    def get_crecimiento_por_riego(self) -> float:
+        """Metros que crece el cultivo por riego (0 si no crece)."""
+        return 0.0
+    
     def mostrar_datos(self, cultivo: 'Cultivo') -> None:
         """Muestra datos básicos del cultivo."""
         print(f"  Agua: {cultivo.get_agua()}L")
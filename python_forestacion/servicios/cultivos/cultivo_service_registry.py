@@ -1,3 +1,4 @@
+from datetime import date
 from threading import Lock
 from typing import TYPE_CHECKING
 
@@ -7,12 +8,16 @@ from python_forestacion.servicios.cultivos.lechuga_service import LechugaService
 from python_forestacion.servicios.cultivos.zanahoria_service import ZanahoriaService
 
 if TYPE_CHECKING:
+    from python_forestacion.servicios.cultivos.cultivo_service import CultivoService
     from python_forestacion.entidades.cultivos.cultivo import Cultivo
     from python_forestacion.entidades.cultivos.pino import Pino
     from python_forestacion.entidades.cultivos.olivo import Olivo
     from python_forestacion.entidades.cultivos.lechuga import Lechuga
     from python_forestacion.entidades.cultivos.zanahoria import Zanahoria
 
+# Valor de los dicts de handlers para un tipo todavía no buscado
+_NO_RESUELTO = object()
+
 
 class CultivoServiceRegistry:
     """
@@ -44,6 +49,7 @@ class CultivoServiceRegistry:
             self._absorber_agua_handlers = {}
             self._mostrar_datos_handlers = {}
             self._crecer_handlers = {}
+            self._servicios = {}
             
             self._registrar_handlers()
             self._initialized = True
@@ -70,19 +76,25 @@ class CultivoServiceRegistry:
         # Crecer (solo árboles)
         self._crecer_handlers[Pino] = self._crecer_pino
         self._crecer_handlers[Olivo] = self._crecer_olivo
+        
+        # Servicios por tipo (operaciones por lote)
+        self._servicios[Pino] = self._pino_service
+        self._servicios[Olivo] = self._olivo_service
+        self._servicios[Lechuga] = self._lechuga_service
+        self._servicios[Zanahoria] = self._zanahoria_service
     
     # Handlers específicos
-    def _absorber_agua_pino(self, cultivo):
-        return self._pino_service.absorver_agua(cultivo)
+    def _absorber_agua_pino(self, cultivo, fecha=None):
+        return self._pino_service.absorver_agua(cultivo, fecha)
     
-    def _absorber_agua_olivo(self, cultivo):
-        return self._olivo_service.absorver_agua(cultivo)
+    def _absorber_agua_olivo(self, cultivo, fecha=None):
+        return self._olivo_service.absorver_agua(cultivo, fecha)
     
-    def _absorber_agua_lechuga(self, cultivo):
-        return self._lechuga_service.absorver_agua(cultivo)
+    def _absorber_agua_lechuga(self, cultivo, fecha=None):
+        return self._lechuga_service.absorver_agua(cultivo, fecha)
     
-    def _absorber_agua_zanahoria(self, cultivo):
-        return self._zanahoria_service.absorver_agua(cultivo)
+    def _absorber_agua_zanahoria(self, cultivo, fecha=None):
+        return self._zanahoria_service.absorver_agua(cultivo, fecha)
     
     def _mostrar_datos_pino(self, cultivo):
         self._pino_service.mostrar_datos(cultivo)
@@ -103,25 +115,60 @@ class CultivoServiceRegistry:
         self._olivo_service.crecer(cultivo)
     
     # API Pública con dispatch polimórfico
-    def absorber_agua(self, cultivo: 'Cultivo') -> int:
-        """Dispatch polimórfico para absorber agua."""
+    def _resolver_handler(self, handlers: dict, tipo: type):
+        """
+        Busca el handler de un tipo recorriendo su MRO.
+
+        Permite despachar subclases de las especies registradas (por ejemplo
+        las vistas columnares); el resultado se guarda en el mismo dict para
+        que las siguientes búsquedas sean directas. Un tipo sin handler
+        también se guarda (con None), así que su MRO se recorre una sola vez.
+        """
+        handler = None
+        for base in tipo.__mro__[1:]:
+            if handlers.get(base) is not None:
+                handler = handlers[base]
+                break
+        handlers[tipo] = handler
+        return handler
+    
+    def absorber_agua(self, cultivo: 'Cultivo', fecha: date = None) -> int:
+        """Dispatch polimórfico para absorber agua en `fecha` (default: hoy)."""
         tipo = type(cultivo)
-        if tipo not in self._absorber_agua_handlers:
+        handler = self._absorber_agua_handlers.get(tipo, _NO_RESUELTO)
+        if handler is _NO_RESUELTO:
+            handler = self._resolver_handler(self._absorber_agua_handlers, tipo)
+        if handler is None:
             raise ValueError(f"Tipo de cultivo desconocido: {tipo.__name__}")
-        return self._absorber_agua_handlers[tipo](cultivo)
+        return handler(cultivo, fecha)
     
     def mostrar_datos(self, cultivo: 'Cultivo') -> None:
         """Dispatch polimórfico para mostrar datos."""
         tipo = type(cultivo)
-        if tipo not in self._mostrar_datos_handlers:
+        handler = self._mostrar_datos_handlers.get(tipo, _NO_RESUELTO)
+        if handler is _NO_RESUELTO:
+            handler = self._resolver_handler(self._mostrar_datos_handlers, tipo)
+        if handler is None:
+            raise ValueError(f"Tipo de cultivo desconocido: {tipo.__name__}")
+        handler(cultivo)
+    
+    def get_servicio(self, tipo: type) -> 'CultivoService':
+        """Servicio asociado a un tipo de cultivo (acepta subclases)."""
+        servicio = self._servicios.get(tipo, _NO_RESUELTO)
+        if servicio is _NO_RESUELTO:
+            servicio = self._resolver_handler(self._servicios, tipo)
+        if servicio is None:
             raise ValueError(f"Tipo de cultivo desconocido: {tipo.__name__}")
-        self._mostrar_datos_handlers[tipo](cultivo)
+        return servicio
     
     def crecer(self, cultivo: 'Cultivo') -> None:
         """Dispatch polimórfico para crecimiento (solo árboles)."""
         tipo = type(cultivo)
-        if tipo in self._crecer_handlers:
-            self._crecer_handlers[tipo](cultivo)
+        handler = self._crecer_handlers.get(tipo, _NO_RESUELTO)
+        if handler is _NO_RESUELTO:
+            handler = self._resolver_handler(self._crecer_handlers, tipo)
+        if handler is not None:
+            handler(cultivo)
     
     @classmethod
     def get_instance(cls):
@@ -18,6 +18,9 @@ class OlivoService(ArbolService):
         altura_actual = olivo.get_altura()
         olivo.set_altura(altura_actual + CRECIMIENTO_OLIVO_POR_RIEGO)
     
+    def get_crecimiento_por_riego(self) -> float:
+        return CRECIMIENTO_OLIVO_POR_RIEGO
+    
     def mostrar_datos(self, cultivo: 'Olivo') -> None:
         """Muestra datos específicos del olivo."""
         super().mostrar_datos(cultivo)
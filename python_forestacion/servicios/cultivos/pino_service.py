@@ -19,6 +19,9 @@ class PinoService(ArbolService):
         altura_actual = pino.get_altura()
         pino.set_altura(altura_actual + CRECIMIENTO_PINO_POR_RIEGO)
     
+    def get_crecimiento_por_riego(self) -> float:
+        return CRECIMIENTO_PINO_POR_RIEGO
+    
     def mostrar_datos(self, cultivo: 'Pino') -> None:
         """Muestra datos específicos del pino."""
         super().mostrar_datos(cultivo)
@@ -25,9 +25,9 @@ class FincasService:
         """
         paquete = Paquete[tipo_cultivo]()
         
-        for cultivo in plantacion.get_cultivos():
-            if isinstance(cultivo, tipo_cultivo):
-                paquete.agregar(cultivo)
+        # El índice por especie de la plantación evita recorrer todos los cultivos
+        for cultivo in plantacion.get_cultivos_por_tipo(tipo_cultivo):
+            paquete.agregar(cultivo)
         
         print(f"[COSECHA] Empaquetados {paquete.cantidad()} {tipo_cultivo.__name__}(s)")
         return paquete
@@ -1,6 +1,9 @@
-from typing import List, Type, TYPE_CHECKING
+from array import array
+from typing import Dict, List, Tuple, Type, Union, TYPE_CHECKING
 from datetime import date
 
+from python_forestacion.entidades.cultivos.especie_cultivo import EspecieCultivo
+from python_forestacion.entidades.terrenos.plantacion_stats import PlantacionStats
 from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
 from python_forestacion.servicios.cultivos.cultivo_service_registry import CultivoServiceRegistry
 from python_forestacion.excepciones.superficie_insuficiente_exception import SuperficieInsuficienteException
@@ -10,6 +13,12 @@ from python_forestacion.constantes import AGUA_MINIMA
 if TYPE_CHECKING:
     from python_forestacion.entidades.terrenos.plantacion import Plantacion
     from python_forestacion.entidades.cultivos.cultivo import Cultivo
+    from python_forestacion.entidades.terrenos.almacen_columnar import AlmacenColumnar
+    from python_forestacion.persistencia.diario_registro import DiarioRegistro
+
+# Litros absorbidos (uno por especie, o uno por cultivo en orden de plantación)
+# y crecimiento por especie en un riego por lote
+EfectoRiego = Tuple[Dict[EspecieCultivo, Union[int, array]], Dict[EspecieCultivo, float]]
 
 
 class PlantacionService:
@@ -30,31 +39,73 @@ class PlantacionService:
         Raises:
             SuperficieInsuficienteException: Si no hay espacio
         """
-        # Crear un cultivo de ejemplo para calcular superficie
-        cultivo_ejemplo = CultivoFactory.crear_cultivo(especie)
-        superficie_requerida = cultivo_ejemplo.get_superficie() * cantidad
-        superficie_disponible = plantacion.calcular_superficie_disponible()
-        
-        if superficie_requerida > superficie_disponible:
-            raise SuperficieInsuficienteException(
-                superficie_requerida,
-                superficie_disponible
-            )
-        
-        # Plantar todos los cultivos
-        for _ in range(cantidad):
-            cultivo = CultivoFactory.crear_cultivo(especie)
-            plantacion.add_cultivo(cultivo)
-        
-        print(f"[OK] Plantados {cantidad} {especie}(s) - Superficie usada: {superficie_requerida:.2f}m2")
+        with plantacion.modificando():
+            # Crear un cultivo de ejemplo para calcular superficie
+            cultivo_ejemplo = CultivoFactory.crear_cultivo(especie)
+            superficie_requerida = cultivo_ejemplo.get_superficie() * cantidad
+            superficie_disponible = plantacion.calcular_superficie_disponible()
+            
+            if superficie_requerida > superficie_disponible:
+                raise SuperficieInsuficienteException(
+                    superficie_requerida,
+                    superficie_disponible
+                )
+            
+            # Plantar todos los cultivos
+            for _ in range(cantidad):
+                cultivo = CultivoFactory.crear_cultivo(especie)
+                plantacion.add_cultivo(cultivo)
+            
+            print(f"[OK] Plantados {cantidad} {especie}(s) - Superficie usada: {superficie_requerida:.2f}m2")
+    
+    def plantar_lote(self, plantacion: 'Plantacion', especie: str, cantidad: int,
+                     diario: 'DiarioRegistro' = None) -> None:
+        """
+        Planta cultivos en bloque a partir del prototipo cacheado de la especie.
+        
+        A diferencia de `plantar`, no construye cada cultivo por separado:
+        los clona con CultivoFactory.crear_cultivos y los agrega a la
+        plantación en una sola operación (en modo columnar, extendiendo
+        directamente las columnas).
+        
+        Args:
+            plantacion: Plantación destino
+            especie: Tipo de cultivo
+            cantidad: Cantidad a plantar
+            diario: Diario del registro donde anotar la operación (opcional)
+            
+        Raises:
+            SuperficieInsuficienteException: Si no hay espacio
+        """
+        with plantacion.modificando():
+            prototipo = CultivoFactory.get_prototipo(especie)
+            superficie_requerida = prototipo.get_superficie() * cantidad
+            superficie_disponible = plantacion.calcular_superficie_disponible()
+            
+            if superficie_requerida > superficie_disponible:
+                raise SuperficieInsuficienteException(
+                    superficie_requerida,
+                    superficie_disponible
+                )
+            
+            if plantacion.es_columnar():
+                plantacion.add_cultivo_repetido(prototipo, cantidad)
+            else:
+                plantacion.add_cultivos(CultivoFactory.crear_cultivos(especie, cantidad))
+            if diario is not None:
+                diario.plantar(EspecieCultivo.desde_nombre(especie), cantidad)
+            
+            print(f"[OK] Plantados {cantidad} {especie}(s) - Superficie usada: {superficie_requerida:.2f}m2")
     
-    def regar(self, plantacion: 'Plantacion', fecha: date = None) -> int:
+    def regar(self, plantacion: 'Plantacion', fecha: date = None,
+              diario: 'DiarioRegistro' = None) -> int:
         """
         Riega todos los cultivos de la plantación.
         
         Args:
             plantacion: Plantación a regar
             fecha: Fecha del riego (default: hoy)
+            diario: Diario del registro donde anotar el riego (opcional)
             
         Returns:
             Total de litros consumidos
@@ -65,38 +116,157 @@ class PlantacionService:
         if fecha is None:
             fecha = date.today()
         
-        cultivos = plantacion.get_cultivos()
-        if not cultivos:
-            print("[INFO] No hay cultivos para regar")
-            return 0
+        with plantacion.modificando():
+            cultivos = plantacion.get_cultivos()
+            if not cultivos:
+                print("[INFO] No hay cultivos para regar")
+                return 0
+            
+            # Calcular agua total necesaria
+            agua_necesaria = 0
+            for cultivo in cultivos:
+                # Estimación basada en absorción promedio
+                agua_necesaria += 3  # Promedio aproximado
+            
+            agua_disponible = plantacion.get_agua_disponible()
+            
+            if agua_disponible < agua_necesaria:
+                raise AguaAgotadaException(agua_disponible, agua_necesaria)
+            
+            # Regar cada cultivo
+            total_absorbido = 0
+            litros_por_especie: Dict[EspecieCultivo, array] = {}
+            for cultivo in cultivos:
+                litros = self._registry.absorber_agua(cultivo, fecha)
+                total_absorbido += litros
+                if diario is not None:
+                    especie = EspecieCultivo.de_cultivo(cultivo)
+                    litros_por_especie.setdefault(especie, array('i')).append(litros)
+                
+                # Hacer crecer si es árbol
+                self._registry.crecer(cultivo)
+            
+            # Descontar agua
+            nueva_agua = agua_disponible - total_absorbido
+            plantacion.set_agua_disponible(max(nueva_agua, 0))
+            if diario is not None:
+                crecimiento = {especie: self._registry.get_servicio(especie.get_clase())
+                               .get_crecimiento_por_riego() for especie in litros_por_especie}
+                diario.regar(litros_por_especie, crecimiento, plantacion.get_agua_disponible())
+            
+            print(f"[RIEGO] Consumidos {total_absorbido}L - Disponible: {plantacion.get_agua_disponible()}L")
+            
+            return total_absorbido
+    
+    def regar_por_lote(self, plantacion: 'Plantacion', fecha: date = None,
+                       diario: 'DiarioRegistro' = None) -> int:
+        """
+        Riega la plantación agrupando los cultivos por especie.
         
-        # Calcular agua total necesaria
-        agua_necesaria = 0
-        for cultivo in cultivos:
-            # Estimación basada en absorción promedio
-            agua_necesaria += 3  # Promedio aproximado
+        La estrategia de absorción de cada especie se evalúa una sola vez por
+        grupo y el agua y el crecimiento se aplican en bloque. Si la
+        estrategia no declara de qué depende (clave_cache None), se la evalúa
+        planta por planta. Produce el mismo estado final que `regar` con la
+        misma fecha.
         
-        agua_disponible = plantacion.get_agua_disponible()
+        Como el efecto se resume en litros y crecimiento por especie, el
+        riego puede anotarse en el diario del registro en pocos bytes.
         
-        if agua_disponible < agua_necesaria:
-            raise AguaAgotadaException(agua_disponible, agua_necesaria)
+        Args:
+            plantacion: Plantación a regar
+            fecha: Fecha del riego (default: hoy)
+            diario: Diario del registro donde anotar el riego (opcional)
+            
+        Returns:
+            Total de litros consumidos
+            
+        Raises:
+            AguaAgotadaException: Si no hay agua suficiente
+        """
+        if fecha is None:
+            fecha = date.today()
         
-        # Regar cada cultivo
+        with plantacion.modificando():
+            cultivos = plantacion.get_cultivos()
+            if not cultivos:
+                print("[INFO] No hay cultivos para regar")
+                return 0
+            
+            # Misma estimación que regar(): promedio aproximado de 3L por cultivo
+            agua_necesaria = 3 * len(cultivos)
+            agua_disponible = plantacion.get_agua_disponible()
+            
+            if agua_disponible < agua_necesaria:
+                raise AguaAgotadaException(agua_disponible, agua_necesaria)
+            
+            if plantacion.es_columnar():
+                total_absorbido, efecto = self._regar_columnar(cultivos, fecha)
+            else:
+                total_absorbido, efecto = self._regar_grupos(plantacion.agrupar_por_tipo(), fecha)
+            # El crecimiento es uniforme por especie: la plantación lo aplica (y
+            # desplaza sus índices de alturas) de una vez
+            plantacion.crecer_arboles(efecto[1])
+            
+            nueva_agua = agua_disponible - total_absorbido
+            plantacion.set_agua_disponible(max(nueva_agua, 0))
+            if diario is not None:
+                diario.regar(*efecto, plantacion.get_agua_disponible())
+            
+            print(f"[RIEGO] Consumidos {total_absorbido}L - Disponible: {plantacion.get_agua_disponible()}L")
+            
+            return total_absorbido
+    
+    def _regar_grupos(self, grupos: Dict[type, List['Cultivo']],
+                      fecha: date) -> Tuple[int, EfectoRiego]:
+        """Riego por lote sobre cultivos-objeto ya agrupados por tipo."""
+        litros_por_especie = {}
+        crecimiento_por_especie = {}
         total_absorbido = 0
-        for cultivo in cultivos:
-            litros = self._registry.absorber_agua(cultivo)
-            total_absorbido += litros
+        for tipo, grupo in grupos.items():
+            servicio = self._registry.get_servicio(tipo)
+            litros = servicio.calcular_absorcion_grupo(grupo[0], fecha)
+            crecimiento = servicio.get_crecimiento_por_riego()
+            especie = EspecieCultivo.de_clase(tipo)
+            crecimiento_por_especie[especie] = crecimiento
             
-            # Hacer crecer si es árbol
-            self._registry.crecer(cultivo)
+            if litros is None:
+                litros = servicio.calcular_absorcion_cultivos(grupo, fecha)
+                for cultivo, litros_cultivo in zip(grupo, litros):
+                    cultivo.set_agua(cultivo.get_agua() + litros_cultivo)
+                total_absorbido += sum(litros)
+            else:
+                for cultivo in grupo:
+                    cultivo.set_agua(cultivo.get_agua() + litros)
+                total_absorbido += litros * len(grupo)
+            litros_por_especie[especie] = litros
+        return total_absorbido, (litros_por_especie, crecimiento_por_especie)
+    
+    def _regar_columnar(self, almacen: 'AlmacenColumnar',
+                        fecha: date) -> Tuple[int, EfectoRiego]:
+        """Riego por lote sobre un AlmacenColumnar: una pasada por columna."""
+        litros_por_especie = {}
+        crecimiento_por_especie = {}
+        total_absorbido = 0
         
-        # Descontar agua
-        nueva_agua = agua_disponible - total_absorbido
-        plantacion.set_agua_disponible(max(nueva_agua, 0))
+        comunes = {}
         
-        print(f"[RIEGO] Consumidos {total_absorbido}L - Disponible: {plantacion.get_agua_disponible()}L")
+        for especie, cantidad in almacen.contar_por_especie().items():
+            servicio = self._registry.get_servicio(especie.get_clase())
+            # La primera fila de la especie sirve de representante del grupo
+            filas = almacen.filas_de_especie(especie)
+            litros = servicio.calcular_absorcion_grupo(almacen[filas[0]], fecha)
+            crecimiento_por_especie[especie] = servicio.get_crecimiento_por_riego()
+            if litros is None:
+                litros = servicio.calcular_absorcion_cultivos(almacen.cultivos_de_especie(especie), fecha)
+                almacen.sumar_en_filas('_agua', filas, litros)
+                total_absorbido += sum(litros)
+            else:
+                comunes[especie] = litros
+                total_absorbido += litros * cantidad
+            litros_por_especie[especie] = litros
         
-        return total_absorbido
+        almacen.sumar_por_especie('_agua', comunes)
+        return total_absorbido, (litros_por_especie, crecimiento_por_especie)
     
     def cosechar(self, plantacion: 'Plantacion') -> List['Cultivo']:
         """
@@ -105,19 +275,56 @@ class PlantacionService:
         Returns:
             Lista de cultivos cosechados
         """
-        cultivos = plantacion.get_cultivos()
-        print(f"[COSECHA] Cosechados {len(cultivos)} cultivos")
-        return cultivos.copy()
+        with plantacion.leyendo():
+            cultivos = plantacion.get_cultivos()
+            print(f"[COSECHA] Cosechados {len(cultivos)} cultivos")
+            return cultivos.copy()
+    
+    def cosechar_especie(self, plantacion: 'Plantacion', especie: str, cantidad: int,
+                         diario: 'DiarioRegistro' = None) -> List['Cultivo']:
+        """
+        Cosecha y retira de la plantación los primeros `cantidad` cultivos de una especie.
+        
+        Args:
+            plantacion: Plantación a cosechar
+            especie: Tipo de cultivo
+            cantidad: Cantidad a cosechar
+            diario: Diario del registro donde anotar la operación (opcional)
+        
+        Returns:
+            Cultivos cosechados (menos de `cantidad` si no hay suficientes)
+        """
+        codigo = EspecieCultivo.desde_nombre(especie)
+        # Con el diario dentro del bloqueo, sus entradas quedan en el orden real
+        with plantacion.modificando():
+            cosechados = plantacion.retirar_cultivos(codigo.get_clase(), cantidad)
+            if diario is not None and cosechados:
+                diario.cosechar(codigo, len(cosechados))
+        print(f"[COSECHA] Cosechados {len(cosechados)} {especie}(s)")
+        return cosechados
     
     def fumigar(self, plantacion: 'Plantacion', plaguicida: str) -> None:
         """Aplica plaguicida a toda la plantación."""
         print(f"[FUMIGACION] Aplicado {plaguicida} a {len(plantacion.get_cultivos())} cultivos")
     
     def mostrar_estado(self, plantacion: 'Plantacion') -> None:
-        """Muestra el estado completo de la plantación."""
-        print(f"\n--- Plantacion: {plantacion.get_nombre()} ---")
-        print(f"Superficie Total: {plantacion.get_superficie_total()}m2")
-        print(f"Superficie Disponible: {plantacion.calcular_superficie_disponible():.2f}m2")
-        print(f"Agua Disponible: {plantacion.get_agua_disponible()}L")
-        print(f"Cultivos: {len(plantacion.get_cultivos())}")
-        print(f"Trabajadores: {len(plantacion.get_trabajadores())}")
+        """
+        Muestra el estado completo de la plantación.
+        
+        Todos los datos salen de un único PlantacionStats (una pasada sobre
+        los cultivos).
+        """
+        stats = PlantacionStats.calcular(plantacion)
+        print(f"\n--- Plantacion: {stats.get_nombre()} ---")
+        print(f"Superficie Total: {stats.get_superficie_total()}m2")
+        print(f"Superficie Disponible: {stats.get_superficie_disponible():.2f}m2")
+        print(f"Agua Disponible: {stats.get_agua_disponible()}L")
+        print(f"Cultivos: {stats.get_cantidad_cultivos()}")
+        for especie, cantidad in stats.get_cantidad_por_especie().items():
+            print(f"  {especie.get_nombre()}: {cantidad}")
+        print(f"Agua absorbida: {stats.get_agua_total()}L "
+              f"(promedio {stats.get_agua_media():.2f}L por cultivo)")
+        for especie, alturas in stats.get_distribuciones_alturas().items():
+            print(f"Altura {especie.get_nombre()}: {alturas.get_minimo():.2f}m - "
+                  f"{alturas.get_maximo():.2f}m (promedio {alturas.get_media():.2f}m)")
+        print(f"Trabajadores: {stats.get_cantidad_trabajadores()}")
@@ -1,17 +1,83 @@
+import glob
 import pickle
 import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
 
 from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.entidades.terrenos.plantacion_stats import PlantacionStats
+from python_forestacion.persistencia.encabezado_registro import EncabezadoRegistro
+from python_forestacion.persistencia.serializador_registro import SerializadorRegistro
+from python_forestacion.persistencia.tabla_cultivos import TablaCultivos
+from python_forestacion.persistencia.escritura_atomica import EscrituraAtomica
+from python_forestacion.persistencia.cache_registros import CacheRegistros
+from python_forestacion.persistencia.compresion_registro import CompresionRegistro
+from python_forestacion.persistencia.diario_registro import DiarioRegistro
 from python_forestacion.excepciones.persistencia_exception import PersistenciaException
-from python_forestacion.constantes import DIRECTORIO_DATOS
+from python_forestacion.excepciones.persistencia_multiple_exception import PersistenciaMultipleException
+from python_forestacion.constantes import (
+    DIRECTORIO_DATOS,
+    TAMANIO_BLOQUE_CULTIVOS,
+    GENERACIONES_RESPALDO,
+    SINCRONIZAR_ESCRITURAS,
+    MAX_PROCESOS_PERSISTENCIA,
+    PRESUPUESTO_CACHE_REGISTROS,
+    SERIALIZADOR_REGISTROS,
+    COMPRESION_REGISTROS,
+    TAMANIO_COMPACTACION_DIARIO
+)
+
+if TYPE_CHECKING:
+    from python_forestacion.entidades.cultivos.cultivo import Cultivo
 
 
 class RegistroForestalService:
-    """Servicio para persistir y recuperar registros forestales."""
+    """
+    Servicio para persistir y recuperar registros forestales.
+    
+    Las escrituras son atómicas (temporal + fsync + os.replace): una caída
+    a mitad de persistir deja intacta la versión anterior del registro.
+    
+    Opcionalmente, los registros leídos se guardan en una cache compartida
+    por proceso (leer_registro con usar_cache=True, ver get_cache): volver a
+    leer un archivo sin cambios no toca el disco.
+    
+    Los cambios chicos pueden anotarse en el diario del registro
+    (abrir_diario) en lugar de reescribirlo: leer_registro reproduce el
+    diario sobre el último registro guardado, y compactar lo vuelca en un
+    registro nuevo.
+    """
+    
+    _cache = CacheRegistros(PRESUPUESTO_CACHE_REGISTROS)
     
-    def __init__(self, directorio_datos: str = DIRECTORIO_DATOS):
+    def __init__(self, directorio_datos: str = DIRECTORIO_DATOS,
+                 generaciones_respaldo: int = GENERACIONES_RESPALDO,
+                 sincronizar: bool = SINCRONIZAR_ESCRITURAS,
+                 serializador: Union[SerializadorRegistro, str] = SERIALIZADOR_REGISTROS,
+                 compresion: Optional[str] = COMPRESION_REGISTROS,
+                 nivel_compresion: Optional[int] = None):
+        """
+        Args:
+            directorio_datos: Directorio de los archivos de registro
+            generaciones_respaldo: Versiones anteriores de cada registro a
+                conservar (<propietario>.dat.1 ... .N); 0 las desactiva
+            sincronizar: Forzar a disco (fsync) cada escritura
+            serializador: Formato de escritura, como instancia o por nombre
+                ("pickle", "binario", "jsonl"); la lectura detecta el formato
+                de cada archivo
+            compresion: Codec para comprimir los registros ("zlib", "lzma",
+                "bz2") o None para no comprimir; la lectura lo detecta solo
+            nivel_compresion: Nivel del codec (None: el valor por defecto)
+        """
+        if isinstance(serializador, str):
+            serializador = SerializadorRegistro.por_nombre(serializador)
+        self._serializador = serializador
+        self._compresion = None if compresion is None else CompresionRegistro(compresion,
+                                                                             nivel_compresion)
         self._directorio = directorio_datos
+        self._generaciones_respaldo = generaciones_respaldo
+        self._sincronizar = sincronizar
         self._asegurar_directorio()
     
     def _asegurar_directorio(self) -> None:
@@ -23,12 +89,30 @@ class RegistroForestalService:
         nombre_archivo = f"{propietario}.dat"
         return os.path.join(self._directorio, nombre_archivo)
     
-    def persistir(self, registro: RegistroForestal) -> None:
+    @staticmethod
+    def _ruta_tabla(propietario: str, directorio: str) -> str:
+        """Genera la ruta de la tabla de cultivos de un propietario."""
+        return os.path.join(directorio, f"{propietario}.tabla")
+    
+    @staticmethod
+    def _ruta_diario(propietario: str, directorio: str) -> str:
+        return os.path.join(directorio, f"{propietario}.diario")
+    
+    def persistir(self, registro: RegistroForestal,
+                  tamanio_bloque: int = TAMANIO_BLOQUE_CULTIVOS) -> None:
         """
-        Persiste un registro forestal en disco usando Pickle.
+        Persiste un registro forestal en disco en el formato por bloques.
+        
+        Los cultivos se serializan en lotes de `tamanio_bloque`, así que
+        nunca se arma en memoria una copia serializada de toda la plantación.
+        Junto al registro se escribe la tabla de cultivos (.tabla) que usan
+        abrir_tabla y mostrar_resumen, con la firma del registro recién
+        guardado: si una caída deja la tabla de una versión anterior,
+        abrir_tabla lo detecta y la regenera.
         
         Args:
             registro: Registro a guardar
+            tamanio_bloque: Cultivos por bloque
             
         Raises:
             PersistenciaException: Si falla el guardado
@@ -37,20 +121,62 @@ class RegistroForestalService:
         ruta = self._obtener_ruta_archivo(propietario)
         
         try:
-            with open(ruta, 'wb') as archivo:
-                pickle.dump(registro, archivo)
+            EscrituraAtomica.escribir(
+                ruta,
+                lambda archivo: self._escribir_registro(registro, archivo, tamanio_bloque),
+                self._generaciones_respaldo,
+                self._sincronizar
+            )
+            RegistroForestalService._escribir_tabla(
+                registro, ruta, RegistroForestalService._ruta_tabla(propietario, self._directorio),
+                self._sincronizar
+            )
+            RegistroForestalService._cache.invalidar(ruta)
             print(f"[PERSISTENCIA] Registro guardado: {ruta}")
         except Exception as e:
             raise PersistenciaException(f"guardar registro de {propietario}", e)
     
     @staticmethod
-    def leer_registro(propietario: str, directorio: str = DIRECTORIO_DATOS) -> RegistroForestal:
+    def _escribir_tabla(registro: RegistroForestal, ruta: str, ruta_tabla: str,
+                        sincronizar: bool) -> None:
+        """Escribe en `ruta_tabla` la tabla del registro guardado en `ruta`, con su firma."""
+        firma = DiarioRegistro.firma_base(ruta)
+        # La tabla se regenera desde el registro: no necesita respaldos
+        EscrituraAtomica.escribir(
+            ruta_tabla,
+            lambda archivo: TablaCultivos.escribir(registro.get_plantacion(), archivo, firma),
+            sincronizar=sincronizar
+        )
+    
+    def _escribir_registro(self, registro: RegistroForestal, archivo,
+                           tamanio_bloque: int) -> None:
+        if self._compresion is None:
+            self._serializador.escribir(registro, archivo, tamanio_bloque)
+            return
+        with self._compresion.abrir_escritura(archivo) as comprimido:
+            self._serializador.escribir(registro, comprimido, tamanio_bloque)
+    
+    @staticmethod
+    def leer_registro(propietario: str, directorio: str = DIRECTORIO_DATOS,
+                      generacion: int = 0, usar_cache: bool = False) -> RegistroForestal:
         """
         Lee un registro forestal desde disco.
         
+        Acepta tanto el formato por bloques como los archivos pickle
+        anteriores. La versión vigente incluye las operaciones anotadas en
+        el diario del registro, si lo tiene.
+        
+        Por defecto cada llamada devuelve un registro nuevo. Con `usar_cache`
+        el registro se toma de la cache si el archivo no cambió desde la
+        última lectura: el objeto devuelto es el mismo en cada llamada, así
+        que sólo conviene para lecturas que no lo modifican.
+        
         Args:
             propietario: Nombre del propietario
             directorio: Directorio de datos
+            generacion: 0 para la versión vigente, k para el respaldo <propietario>.dat.k
+            usar_cache: Compartir el registro leído con las demás lecturas
+                con cache en lugar de deserializar el archivo
             
         Returns:
             Registro forestal recuperado
@@ -58,22 +184,354 @@ class RegistroForestalService:
         Raises:
             PersistenciaException: Si falla la lectura
         """
-        ruta = os.path.join(directorio, f"{propietario}.dat")
-        
-        if not os.path.exists(ruta):
-            raise PersistenciaException(
-                f"leer registro de {propietario}",
-                FileNotFoundError(f"No existe: {ruta}")
-            )
+        extension = ".dat" if generacion == 0 else f".dat.{generacion}"
+        ruta = RegistroForestalService._ruta_existente(propietario, directorio, extension)
+        # Los respaldos son snapshots anteriores: el diario no se les aplica
+        diarios = (RegistroForestalService._ruta_diario(propietario, directorio),) \
+            if generacion == 0 else ()
         
         try:
-            with open(ruta, 'rb') as archivo:
-                registro = pickle.load(archivo)
+            if usar_cache:
+                registro = RegistroForestalService._cache.obtener(
+                    ruta, lambda: RegistroForestalService._cargar(ruta, *diarios), diarios
+                )
+            else:
+                registro = RegistroForestalService._cargar(ruta, *diarios)
             print(f"[PERSISTENCIA] Registro leido: {ruta}")
             return registro
         except Exception as e:
             raise PersistenciaException(f"leer registro de {propietario}", e)
     
+    @staticmethod
+    def _cargar(ruta: str, ruta_diario: Optional[str] = None) -> RegistroForestal:
+        with open(ruta, 'rb') as archivo_disco, \
+                CompresionRegistro.abrir_lectura(archivo_disco) as archivo:
+            serializador = SerializadorRegistro.detectar(archivo)
+            if serializador is not None:
+                registro = serializador.leer(archivo)
+            else:
+                # Registros anteriores a los formatos por bloques
+                registro = pickle.load(archivo)
+        if ruta_diario is not None:
+            DiarioRegistro.reproducir(ruta_diario, ruta, registro.get_plantacion())
+        return registro
+    
+    def abrir_diario(self, propietario: str) -> DiarioRegistro:
+        """
+        Abre el diario de un registro ya guardado para anotar operaciones (debe cerrarse).
+        
+        Uso:
+            with servicio.abrir_diario("Juan Perez") as diario:
+                plantacion_service.regar_por_lote(plantacion, diario=diario)
+        
+        Raises:
+            PersistenciaException: Si el registro no existe o el diario es inválido
+        """
+        ruta = RegistroForestalService._ruta_existente(propietario, self._directorio)
+        try:
+            return DiarioRegistro(RegistroForestalService._ruta_diario(propietario, self._directorio),
+                                  ruta, self._sincronizar)
+        except Exception as e:
+            raise PersistenciaException(f"abrir diario de {propietario}", e)
+    
+    def compactar(self, propietario: str,
+                  umbral_bytes: int = TAMANIO_COMPACTACION_DIARIO) -> bool:
+        """
+        Vuelca el diario en un registro nuevo y lo vacía.
+        
+        Pensado para llamarse periódicamente con un umbral: mientras el
+        diario no lo alcance sólo cuesta un stat. La lectura, el guardado y
+        el vaciado se hacen con el diario bloqueado, así que las operaciones
+        que otros diarios abiertos anoten mientras tanto no se pierden.
+        
+        Args:
+            propietario: Nombre del propietario
+            umbral_bytes: Tamaño mínimo del diario para compactar (0: siempre
+                que tenga operaciones)
+        
+        Returns:
+            True si se compactó
+        
+        Raises:
+            PersistenciaException: Si falla la lectura o el guardado
+        """
+        ruta_diario = RegistroForestalService._ruta_diario(propietario, self._directorio)
+        try:
+            tamanio = os.path.getsize(ruta_diario)
+        except FileNotFoundError:
+            return False
+        if tamanio <= DiarioRegistro.TAMANIO_CABECERA or tamanio < umbral_bytes:
+            return False
+        
+        with self.abrir_diario(propietario) as diario:
+            diario.compactar(lambda: self.persistir(
+                RegistroForestalService.leer_registro(propietario, self._directorio)
+            ))
+        print(f"[PERSISTENCIA] Diario compactado: {ruta_diario}")
+        return True
+    
+    @staticmethod
+    def _detectar(archivo) -> SerializadorRegistro:
+        serializador = SerializadorRegistro.detectar(archivo)
+        if serializador is None:
+            raise ValueError("El archivo no está en un formato por bloques")
+        return serializador
+    
+    def get_serializador(self) -> SerializadorRegistro:
+        return self._serializador
+    
+    def get_compresion(self) -> Optional[CompresionRegistro]:
+        return self._compresion
+    
+    @staticmethod
+    def get_cache() -> CacheRegistros:
+        """Cache de registros leídos (estadísticas, presupuesto, limpieza)."""
+        return RegistroForestalService._cache
+    
+    def persistir_todos(self, registros: Iterable[RegistroForestal],
+                        max_procesos: Optional[int] = MAX_PROCESOS_PERSISTENCIA,
+                        al_completar: Callable[[str], None] = None) -> List[str]:
+        """
+        Persiste varios registros en paralelo con un pool de procesos.
+        
+        Un registro que falla no detiene al resto: los errores se juntan y
+        se informan al final.
+        
+        Args:
+            registros: Registros a guardar (se consumen de a poco)
+            max_procesos: Procesos del pool (None: cantidad de CPUs)
+            al_completar: Se invoca con el propietario de cada registro
+                guardado, a medida que terminan
+        
+        Returns:
+            Propietarios guardados, en orden de finalización
+        
+        Raises:
+            PersistenciaMultipleException: Si falló al menos un registro
+        """
+        tareas = ((registro.get_propietario(), self.persistir, (registro,))
+                  for registro in registros)
+        
+        guardados = []
+        errores: Dict[str, Exception] = {}
+        for propietario, _, error in RegistroForestalService._ejecutar_en_pool(tareas, max_procesos):
+            if error is not None:
+                errores[propietario] = error
+                continue
+            guardados.append(propietario)
+            if al_completar is not None:
+                al_completar(propietario)
+        
+        if errores:
+            raise PersistenciaMultipleException(
+                "guardar registros", errores, len(guardados) + len(errores)
+            )
+        return guardados
+    
+    @staticmethod
+    def leer_todos(propietarios: Union[Iterable[str], str],
+                   directorio: str = DIRECTORIO_DATOS,
+                   max_procesos: Optional[int] = MAX_PROCESOS_PERSISTENCIA,
+                   procesar: Callable[[RegistroForestal], object] = None) -> Iterator[object]:
+        """
+        Lee varios registros en paralelo con un pool de procesos.
+        
+        Los registros se entregan a medida que terminan de leerse (no en el
+        orden pedido). Los errores se juntan y se lanzan al agotar el
+        iterador, después de entregar todos los registros válidos.
+        
+        Args:
+            propietarios: Nombres de propietarios, o un patrón glob sobre
+                ellos (p. ej. "*" para todos los registros del directorio)
+            directorio: Directorio de datos
+            max_procesos: Procesos del pool (None: cantidad de CPUs)
+        
+        Yields:
+            Registros forestales recuperados
+        
+        Raises:
+            PersistenciaMultipleException: Si falló al menos un registro
+        """
+        if isinstance(propietarios, str):
+            propietarios = RegistroForestalService.listar_propietarios(propietarios, directorio)
+        
+        tareas = ((propietario, RegistroForestalService._leer_en_proceso,
+                   (propietario, directorio, procesar))
+                  for propietario in propietarios)
+        
+        leidos = 0
+        errores: Dict[str, Exception] = {}
+        for propietario, resultado, error in RegistroForestalService._ejecutar_en_pool(tareas, max_procesos):
+            if error is not None:
+                errores[propietario] = error
+                continue
+            leidos += 1
+            yield resultado
+        
+        if errores:
+            raise PersistenciaMultipleException("leer registros", errores, leidos + len(errores))
+    
+    @staticmethod
+    def _leer_en_proceso(propietario: str, directorio: str,
+                         procesar: Callable[[RegistroForestal], object] = None) -> object:
+        registro = RegistroForestalService.leer_registro(propietario, directorio)
+        return registro if procesar is None else procesar(registro)
+    
+    @staticmethod
+    def listar_propietarios(patron: str = "*", directorio: str = DIRECTORIO_DATOS) -> List[str]:
+        """Propietarios con registro en `directorio` cuyo nombre coincide con `patron`."""
+        rutas = glob.glob(os.path.join(glob.escape(directorio), f"{patron}.dat"))
+        return sorted(os.path.basename(ruta)[:-len(".dat")] for ruta in rutas)
+    
+    @staticmethod
+    def _ejecutar_en_pool(tareas: Iterable[Tuple[str, Callable, tuple]],
+                          max_procesos: Optional[int]) -> Iterator[Tuple[str, object, Optional[Exception]]]:
+        """
+        Ejecuta (clave, función, argumentos) en un pool de procesos.
+        
+        Mantiene como máximo dos tareas en vuelo por proceso, así los
+        registros pendientes no se serializan todos de entrada.
+        
+        Yields:
+            (clave, resultado, error) a medida que cada tarea termina
+        """
+        max_procesos = max_procesos or os.cpu_count() or 1
+        tareas = iter(tareas)
+        en_vuelo = {}
+        
+        pool = ProcessPoolExecutor(max_workers=max_procesos)
+        try:
+            def enviar() -> None:
+                while len(en_vuelo) < 2 * max_procesos:
+                    tarea = next(tareas, None)
+                    if tarea is None:
+                        return
+                    clave, funcion, argumentos = tarea
+                    en_vuelo[pool.submit(funcion, *argumentos)] = clave
+            
+            enviar()
+            while en_vuelo:
+                terminadas, _ = wait(en_vuelo, return_when=FIRST_COMPLETED)
+                for futuro in terminadas:
+                    clave = en_vuelo.pop(futuro)
+                    error = futuro.exception()
+                    yield clave, None if error else futuro.result(), error
+                enviar()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+    
+    @staticmethod
+    def leer_encabezado(propietario: str,
+                        directorio: str = DIRECTORIO_DATOS) -> EncabezadoRegistro:
+        """
+        Lee los datos del registro sin deserializar sus cultivos.
+        
+        Raises:
+            PersistenciaException: Si falla la lectura o el archivo no está
+                en un formato por bloques
+        """
+        ruta = RegistroForestalService._ruta_existente(propietario, directorio)
+        
+        try:
+            with open(ruta, 'rb') as archivo_disco, \
+                    CompresionRegistro.abrir_lectura(archivo_disco) as archivo:
+                return RegistroForestalService._detectar(archivo).leer_encabezado(archivo)
+        except Exception as e:
+            raise PersistenciaException(f"leer encabezado de {propietario}", e)
+    
+    @staticmethod
+    def iterar_cultivos(propietario: str,
+                        directorio: str = DIRECTORIO_DATOS) -> Iterator[List['Cultivo']]:
+        """
+        Recorre los cultivos guardados de a un bloque por vez.
+        
+        Permite procesar plantaciones grandes sin cargarlas completas.
+        
+        Yields:
+            Lotes de cultivos, en orden de plantación
+            
+        Raises:
+            PersistenciaException: Si falla la lectura
+        """
+        ruta = RegistroForestalService._ruta_existente(propietario, directorio)
+        
+        try:
+            with open(ruta, 'rb') as archivo_disco, \
+                    CompresionRegistro.abrir_lectura(archivo_disco) as archivo:
+                yield from RegistroForestalService._detectar(archivo).iterar_cultivos(archivo)
+        except Exception as e:
+            raise PersistenciaException(f"recorrer cultivos de {propietario}", e)
+    
+    @staticmethod
+    def abrir_tabla(propietario: str, directorio: str = DIRECTORIO_DATOS) -> TablaCultivos:
+        """
+        Abre la tabla de cultivos mapeada en memoria (debe cerrarse).
+        
+        Conteos, agregados y acceso por fila no deserializan ningún cultivo.
+        La tabla refleja el último registro guardado: las operaciones del
+        diario (abrir_diario) no aparecen en ella hasta compactar.
+        
+        Si la tabla falta, es inválida o su firma no coincide con la del
+        registro (quedó de una versión anterior), se regenera desde él.
+        
+        Raises:
+            PersistenciaException: Si no existe el registro o falla la regeneración
+        """
+        ruta = RegistroForestalService._ruta_existente(propietario, directorio)
+        ruta_tabla = RegistroForestalService._ruta_tabla(propietario, directorio)
+        
+        try:
+            tabla = RegistroForestalService._abrir_tabla_vigente(ruta, ruta_tabla)
+            if tabla is not None:
+                return tabla
+            RegistroForestalService._escribir_tabla(RegistroForestalService._cargar(ruta), ruta,
+                                                    ruta_tabla, SINCRONIZAR_ESCRITURAS)
+            print(f"[PERSISTENCIA] Tabla regenerada: {ruta_tabla}")
+            return TablaCultivos(ruta_tabla)
+        except Exception as e:
+            raise PersistenciaException(f"abrir tabla de {propietario}", e)
+    
+    @staticmethod
+    def _abrir_tabla_vigente(ruta: str, ruta_tabla: str) -> Optional[TablaCultivos]:
+        """La tabla de `ruta`, o None si falta, es inválida o es de otra versión del registro."""
+        try:
+            tabla = TablaCultivos(ruta_tabla)
+        except (OSError, ValueError):
+            return None
+        if tabla.get_firma_registro() != DiarioRegistro.firma_base(ruta):
+            tabla.cerrar()
+            return None
+        return tabla
+    
+    @staticmethod
+    def mostrar_resumen(propietario: str, directorio: str = DIRECTORIO_DATOS) -> None:
+        """
+        Muestra cultivos y agua de un registro guardado usando sólo su tabla.
+        
+        Como la tabla, no incluye las operaciones del diario sin compactar;
+        si las hay, lo advierte.
+        """
+        with RegistroForestalService.abrir_tabla(propietario, directorio) as tabla:
+            print(f"\nRESUMEN: {propietario}")
+            print(f"  Cultivos totales: {len(tabla)}")
+            for especie, cantidad in tabla.contar_por_especie().items():
+                print(f"    {especie.get_nombre()}: {cantidad}")
+            print(f"  Agua disponible: {tabla.get_agua_disponible()}L")
+        if DiarioRegistro.tiene_operaciones(RegistroForestalService._ruta_diario(propietario, directorio),
+                                            os.path.join(directorio, f"{propietario}.dat")):
+            print("  [WARN] El diario tiene operaciones sin compactar que el resumen no incluye")
+    
+    @staticmethod
+    def _ruta_existente(propietario: str, directorio: str, extension: str = ".dat") -> str:
+        ruta = os.path.join(directorio, f"{propietario}{extension}")
+        
+        if not os.path.exists(ruta):
+            raise PersistenciaException(
+                f"leer registro de {propietario}",
+                FileNotFoundError(f"No existe: {ruta}")
+            )
+        return ruta
+    
     def mostrar_datos(self, registro: RegistroForestal) -> None:
         """Muestra datos completos del registro."""
         print("\n" + "="*70)
@@ -86,10 +544,13 @@ class RegistroForestalService:
         print(f"  Superficie: {tierra.get_superficie()}m2")
         print(f"  Domicilio: {tierra.get_domicilio()}")
         
-        plantacion = registro.get_plantacion()
-        print(f"\nPLANTACION: {plantacion.get_nombre()}")
-        print(f"  Cultivos totales: {len(plantacion.get_cultivos())}")
-        print(f"  Agua disponible: {plantacion.get_agua_disponible()}L")
+        stats = PlantacionStats.calcular(registro.get_plantacion())
+        print(f"\nPLANTACION: {stats.get_nombre()}")
+        print(f"  Cultivos totales: {stats.get_cantidad_cultivos()}")
+        for especie, cantidad in stats.get_cantidad_por_especie().items():
+            print(f"    {especie.get_nombre()}: {cantidad}")
+        print(f"  Superficie ocupada: {stats.get_superficie_ocupada():.2f}m2")
+        print(f"  Agua disponible: {stats.get_agua_disponible()}L")
         
         print(f"\nPROPIETARIO: {registro.get_propietario()}")
         print(f"AVALUO: ${registro.get_avaluo():,.2f}")
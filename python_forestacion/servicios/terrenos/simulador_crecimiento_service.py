@@ -0,0 +1,245 @@
+from array import array
+from datetime import date, timedelta
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple, TYPE_CHECKING
+
+from python_forestacion.entidades.cultivos.arbol import Arbol
+from python_forestacion.entidades.cultivos.especie_cultivo import EspecieCultivo
+from python_forestacion.servicios.cultivos.cultivo_service_registry import CultivoServiceRegistry
+
+if TYPE_CHECKING:
+    from python_forestacion.entidades.terrenos.plantacion import Plantacion
+    from python_forestacion.entidades.cultivos.cultivo import Cultivo
+
+# Lectura climática de un día: (temperatura °C, humedad %)
+Clima = Tuple[float, float]
+
+
+class ResultadoSimulacion:
+    """Estado proyectado de una plantación al final de una simulación."""
+    
+    def __init__(self, ciclos: int, fecha_agotamiento: Optional[date],
+                 agua_consumida: int, agua_disponible: int,
+                 litros_por_cultivo: Dict[EspecieCultivo, int],
+                 crecimiento_por_arbol: Dict[EspecieCultivo, float],
+                 aguas: array, alturas: array):
+        self._ciclos = ciclos
+        self._fecha_agotamiento = fecha_agotamiento
+        self._agua_consumida = agua_consumida
+        self._agua_disponible = agua_disponible
+        self._litros_por_cultivo = litros_por_cultivo
+        self._crecimiento_por_arbol = crecimiento_por_arbol
+        self._aguas = aguas
+        self._alturas = alturas
+    
+    def get_ciclos(self) -> int:
+        """Riegos simulados."""
+        return self._ciclos
+    
+    def get_fecha_agotamiento(self) -> Optional[date]:
+        """Fecha del primer riego que no pudo hacerse por falta de agua (None si no faltó)."""
+        return self._fecha_agotamiento
+    
+    def get_agua_consumida(self) -> int:
+        return self._agua_consumida
+    
+    def get_agua_disponible(self) -> int:
+        """Agua disponible de la plantación al final."""
+        return self._agua_disponible
+    
+    def get_litros_por_cultivo(self) -> Dict[EspecieCultivo, int]:
+        """Litros que absorbió cada cultivo en toda la simulación, por especie."""
+        return dict(self._litros_por_cultivo)
+    
+    def get_crecimiento_por_arbol(self) -> Dict[EspecieCultivo, float]:
+        """Metros que creció cada árbol en toda la simulación, por especie (nominal)."""
+        return dict(self._crecimiento_por_arbol)
+    
+    def get_aguas(self) -> array:
+        """Agua final de cada cultivo, en el orden de get_cultivos()."""
+        return self._aguas
+    
+    def get_alturas(self) -> array:
+        """Altura final de cada cultivo (0 si no es árbol), en el orden de get_cultivos()."""
+        return self._alturas
+    
+    def __repr__(self) -> str:
+        return (f"ResultadoSimulacion(ciclos={self._ciclos}, "
+                f"agua_consumida={self._agua_consumida}L, "
+                f"agua_disponible={self._agua_disponible}L)")
+
+
+class SimuladorCrecimientoService:
+    """
+    Proyecta muchos ciclos de riego sin regar la plantación.
+    
+    Produce el mismo estado final que llamar a PlantacionService.regar_por_lote
+    (o regar) una vez por fecha, pero sin recorrer las plantas en cada ciclo:
+    - La estrategia de absorción de cada especie (AbsorcionSeasonalStrategy
+      para los árboles) se evalúa con calcular_absorcion_lote sobre toda la
+      serie de fechas y su clima, en una llamada por especie. El agua de
+      cada planta es su agua inicial más la suma de esos litros (enteros,
+      así que la suma es exacta).
+    - El crecimiento (CRECIMIENTO_*_POR_RIEGO) es igual para toda la especie,
+      así que basta con repetir las sumas sobre las alturas iniciales
+      distintas, no sobre cada árbol. Sumar de a un riego, y no
+      multiplicar, da exactamente las mismas alturas que el riego real.
+    
+    El costo es O(ciclos × especies + ciclos × alturas iniciales distintas
+    + plantas), contra O(ciclos × plantas) de regar en un bucle.
+    """
+    
+    # Misma estimación que PlantacionService.regar: promedio aproximado por cultivo
+    AGUA_ESTIMADA_POR_CULTIVO = 3
+    
+    # Clima que usan los servicios cuando no se informa
+    CLIMA_POR_DEFECTO: Clima = (20.0, 50.0)
+    
+    def __init__(self):
+        self._registry = CultivoServiceRegistry.get_instance()
+    
+    @staticmethod
+    def fechas_riego(fecha_inicio: date, fecha_fin: date, intervalo_dias: int = 1) -> Iterator[date]:
+        """
+        Fechas de riego entre fecha_inicio y fecha_fin (ambas incluidas).
+        
+        Raises:
+            ValueError: Si intervalo_dias no es positivo
+        """
+        if intervalo_dias <= 0:
+            raise ValueError(f"El intervalo de riego debe ser positivo: {intervalo_dias}")
+        paso = timedelta(days=intervalo_dias)
+        fecha = fecha_inicio
+        while fecha <= fecha_fin:
+            yield fecha
+            fecha += paso
+    
+    def simular(self, plantacion: 'Plantacion', fecha_inicio: date, fecha_fin: date,
+                clima: Mapping[date, Clima] = None,
+                intervalo_dias: int = 1) -> ResultadoSimulacion:
+        """
+        Simula un riego por lote cada `intervalo_dias` entre dos fechas.
+        
+        La plantación no se modifica. Como en regar_por_lote, un riego sólo
+        se hace si el agua disponible alcanza la estimación de 3L por
+        cultivo; el primero que no alcanza termina la simulación (donde
+        regar lanzaría AguaAgotadaException). El estado de partida se lee
+        con la plantación tomada para lectura (leyendo), así que en una
+        plantación concurrente no se mezclan datos de antes y después de
+        un riego o una cosecha.
+        
+        Args:
+            plantacion: Plantación de partida
+            fecha_inicio: Fecha del primer riego
+            fecha_fin: Última fecha posible de riego (incluida)
+            clima: (temperatura, humedad) por fecha; las fechas ausentes
+                usan CLIMA_POR_DEFECTO
+            intervalo_dias: Días entre riegos
+        
+        Returns:
+            Estado final proyectado
+        
+        Raises:
+            ValueError: Si intervalo_dias no es positivo
+        """
+        if clima is None:
+            clima = {}
+        with plantacion.leyendo():
+            grupos = self._representantes(plantacion)
+            cantidad = sum(grupo_cantidad for _, grupo_cantidad in grupos.values())
+            servicios = {especie: self._registry.get_servicio(especie.get_clase()) for especie in grupos}
+            
+            fechas = list(self.fechas_riego(fecha_inicio, fecha_fin, intervalo_dias)) if cantidad else []
+            lecturas = [clima.get(fecha, self.CLIMA_POR_DEFECTO) for fecha in fechas]
+            temperaturas = [temperatura for temperatura, _ in lecturas]
+            humedades = [humedad for _, humedad in lecturas]
+            # Litros por cultivo de cada especie en cada fecha: una llamada por especie
+            series = {especie: servicios[especie].calcular_absorcion_lote(
+                          [representante], fechas, temperaturas, humedades)
+                      for especie, (representante, _) in grupos.items()}
+            
+            agua_disponible = plantacion.get_agua_disponible()
+            agua_consumida = 0
+            ciclos = 0
+            fecha_agotamiento = None
+            for fecha in fechas:
+                if agua_disponible < self.AGUA_ESTIMADA_POR_CULTIVO * cantidad:
+                    fecha_agotamiento = fecha
+                    break
+                total = sum(series[especie][ciclos] * grupo_cantidad
+                            for especie, (_, grupo_cantidad) in grupos.items())
+                agua_consumida += total
+                agua_disponible = max(agua_disponible - total, 0)
+                ciclos += 1
+            litros_por_cultivo = {especie: sum(serie[:ciclos]) for especie, serie in series.items()}
+            
+            crecimiento = {especie: servicios[especie].get_crecimiento_por_riego()
+                           for especie in grupos
+                           if issubclass(especie.get_clase(), Arbol)}
+            alturas_finales = self._proyectar_alturas(plantacion, crecimiento, ciclos)
+            aguas, alturas = self._estado_por_planta(plantacion, litros_por_cultivo, alturas_finales)
+            crecimiento_por_arbol = {especie: metros * ciclos for especie, metros in crecimiento.items()}
+        return ResultadoSimulacion(ciclos, fecha_agotamiento, agua_consumida, agua_disponible,
+                                   litros_por_cultivo, crecimiento_por_arbol, aguas, alturas)
+    
+    @staticmethod
+    def _representantes(plantacion: 'Plantacion') -> Dict[EspecieCultivo, Tuple['Cultivo', int]]:
+        """Primer cultivo y cantidad de cada especie presente."""
+        cultivos = plantacion.get_cultivos()
+        if plantacion.es_columnar():
+            return {especie: (cultivos[cultivos.filas_de_especie(especie)[0]], cantidad)
+                    for especie, cantidad in cultivos.contar_por_especie().items()}
+        return {EspecieCultivo.de_clase(tipo): (grupo[0], len(grupo))
+                for tipo, grupo in plantacion.agrupar_por_tipo().items() if grupo}
+    
+    @staticmethod
+    def _proyectar_alturas(plantacion: 'Plantacion', crecimiento: Dict[EspecieCultivo, float],
+                           ciclos: int) -> Dict[EspecieCultivo, Dict[float, float]]:
+        """Altura final para cada altura inicial distinta de cada especie de árbol."""
+        cultivos = plantacion.get_cultivos()
+        finales = {}
+        for especie, metros in crecimiento.items():
+            if plantacion.es_columnar():
+                alturas = cultivos.get_alturas()
+                iniciales = list(set(map(alturas.__getitem__, cultivos.filas_de_especie(especie))))
+            else:
+                iniciales = list({c.get_altura() for c in
+                                  plantacion.get_cultivos_por_tipo(especie.get_clase())})
+            valores = iniciales
+            if metros:
+                for _ in range(ciclos):
+                    valores = [altura + metros for altura in valores]
+            finales[especie] = dict(zip(iniciales, valores))
+        return finales
+    
+    @staticmethod
+    def _estado_por_planta(plantacion: 'Plantacion', litros: Dict[EspecieCultivo, int],
+                           alturas_finales: Dict[EspecieCultivo, Dict[float, float]]
+                           ) -> Tuple[array, array]:
+        """Agua y altura final de cada cultivo, en una pasada sobre la plantación."""
+        litros_tabla = [0] * len(EspecieCultivo)
+        alturas_tabla: List[Dict[float, float]] = [{} for _ in EspecieCultivo]
+        for especie, valor in litros.items():
+            litros_tabla[especie] = valor
+        for especie, finales in alturas_finales.items():
+            alturas_tabla[especie] = finales
+        
+        cultivos = plantacion.get_cultivos()
+        if plantacion.es_columnar():
+            especies = cultivos.get_especies()
+            aguas = array('q', [agua + litros_tabla[e]
+                                for agua, e in zip(cultivos.get_aguas(), especies)])
+            alturas = array('d', [alturas_tabla[e].get(altura, altura)
+                                  for altura, e in zip(cultivos.get_alturas(), especies)])
+            return aguas, alturas
+        
+        aguas = array('q')
+        alturas = array('d')
+        for cultivo in cultivos:
+            especie = EspecieCultivo.de_cultivo(cultivo)
+            aguas.append(cultivo.get_agua() + litros_tabla[especie])
+            if isinstance(cultivo, Arbol):
+                altura = cultivo.get_altura()
+                alturas.append(alturas_tabla[especie].get(altura, altura))
+            else:
+                alturas.append(0.0)
+        return aguas, alturas
@@ -8,7 +8,8 @@ class TierraService:
     
     def crear_tierra_con_plantacion(self, id_padron_catastral: int,
                                     superficie: float, domicilio: str,
-                                    nombre_plantacion: str) -> Tierra:
+                                    nombre_plantacion: str,
+                                    columnar: bool = False) -> Tierra:
         """
         Crea una tierra con su plantación asociada.
         
@@ -17,13 +18,14 @@ class TierraService:
             superficie: Superficie en m²
             domicilio: Ubicación
             nombre_plantacion: Nombre de la plantación
+            columnar: Si True, la plantación usa almacenamiento columnar
             
         Returns:
             Tierra con plantación asociada
         """
         tierra = Tierra(id_padron_catastral, superficie, domicilio)
         
-        plantacion = Plantacion(nombre_plantacion, superficie)
+        plantacion = Plantacion(nombre_plantacion, superficie, columnar)
         plantacion.set_agua_disponible(AGUA_INICIAL_PLANTACION)
         
         tierra.set_finca(plantacion)
@@ -0,0 +1,27 @@
+import os
+import sys
+
+import pytest
+
+# La raíz del repositorio tiene __init__.py: sin esto pytest no encuentra
+# python_forestacion cuando se lo invoca como `pytest` en lugar de `python -m pytest`
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from python_forestacion.entidades.terrenos.plantacion import Plantacion  # noqa: E402
+from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal  # noqa: E402
+from python_forestacion.entidades.terrenos.tierra import Tierra  # noqa: E402
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory  # noqa: E402
+
+ESPECIES = ("Pino", "Olivo", "Lechuga", "Zanahoria")
+
+
+@pytest.fixture
+def registro() -> RegistroForestal:
+    """Registro chico con cultivos de todas las especies."""
+    tierra = Tierra(1, 10000.0, "Test")
+    plantacion = Plantacion("Test", 10000.0)
+    tierra.set_finca(plantacion)
+    plantacion.set_agua_disponible(1000)
+    for especie in ESPECIES:
+        plantacion.add_cultivos(CultivoFactory.crear_cultivos(especie, 10))
+    return RegistroForestal(1, tierra, plantacion, "Test", 1000.0)
@@ -0,0 +1,65 @@
+from datetime import date
+
+from python_forestacion.patrones.strategy.impl.absorcion_constante_strategy import AbsorcionConstanteStrategy
+from python_forestacion.patrones.strategy.impl.absorcion_seasonal_strategy import AbsorcionSeasonalStrategy
+from python_forestacion.servicios.cultivos.cultivo_service import CultivoService
+
+FECHAS = [date(2024, 1, 10), date(2024, 1, 20), date(2024, 7, 10)]
+
+
+class SeasonalPorTemperatura(AbsorcionSeasonalStrategy):
+    """Depende también de la temperatura, no sólo del mes."""
+
+    def calcular_absorcion(self, fecha, temperatura, humedad, cultivo) -> int:
+        return super().calcular_absorcion(fecha, temperatura, humedad, cultivo) + int(temperatura)
+
+
+class ConstantePorHumedad(AbsorcionConstanteStrategy):
+
+    def calcular_absorcion(self, fecha, temperatura, humedad, cultivo) -> int:
+        return self._cantidad + int(humedad > 50)
+
+
+def test_lote_coincide_con_calcular_absorcion():
+    temperaturas = [10.0, 30.0, 20.0]
+    humedades = [40.0, 60.0, 80.0]
+    for estrategia in (AbsorcionSeasonalStrategy(), SeasonalPorTemperatura(),
+                       AbsorcionConstanteStrategy(2), ConstantePorHumedad(2)):
+        esperado = [estrategia.calcular_absorcion(f, t, h, None)
+                    for f, t, h in zip(FECHAS, temperaturas, humedades)]
+        lote = estrategia.calcular_absorcion_lote(FECHAS, temperaturas, humedades, [None])
+        assert list(lote) == esperado, estrategia
+
+
+def test_subclase_con_otra_regla_no_hereda_la_clave_cache():
+    assert AbsorcionSeasonalStrategy().clave_cache(FECHAS[0], 10.0, 40.0, None) == 1
+    assert AbsorcionConstanteStrategy(2).clave_cache(FECHAS[0], 10.0, 40.0, None) == ()
+    assert SeasonalPorTemperatura().clave_cache(FECHAS[0], 10.0, 40.0, None) is None
+    assert ConstantePorHumedad(2).clave_cache(FECHAS[0], 10.0, 40.0, None) is None
+
+
+def test_servicio_no_memoriza_una_regla_que_depende_de_mas_datos():
+    servicio = CultivoService(SeasonalPorTemperatura())
+    assert servicio._evaluar_estrategia(FECHAS[0], 10.0, 40.0, None) == \
+        AbsorcionSeasonalStrategy().calcular_absorcion(FECHAS[0], 10.0, 40.0, None) + 10
+    assert servicio._evaluar_estrategia(FECHAS[1], 30.0, 40.0, None) == \
+        AbsorcionSeasonalStrategy().calcular_absorcion(FECHAS[1], 30.0, 40.0, None) + 30
+
+
+def test_estadisticas_cuentan_toda_evaluacion_fuera_de_cache():
+    servicio = CultivoService(AbsorcionSeasonalStrategy())
+    for fecha in FECHAS * 3:
+        servicio._evaluar_estrategia(fecha, 20.0, 50.0, None)
+    # Dos meses distintos: el resto sale de la cache
+    assert servicio.get_estadisticas_cache() == {'evaluaciones': 2, 'entradas': 2}
+
+    # Sin clave_cache cada llamada evalúa la estrategia
+    servicio = CultivoService(SeasonalPorTemperatura())
+    for fecha in FECHAS * 3:
+        servicio._evaluar_estrategia(fecha, 20.0, 50.0, None)
+    assert servicio.get_estadisticas_cache() == {'evaluaciones': 9, 'entradas': 0}
+
+    servicio = CultivoService(AbsorcionSeasonalStrategy(), tamanio_cache=0)
+    for fecha in FECHAS:
+        servicio._evaluar_estrategia(fecha, 20.0, 50.0, None)
+    assert servicio.get_estadisticas_cache() == {'evaluaciones': 3, 'entradas': 0}
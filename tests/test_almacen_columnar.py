@@ -0,0 +1,31 @@
+import random
+
+from python_forestacion.entidades.cultivos.especie_cultivo import EspecieCultivo
+from python_forestacion.entidades.terrenos.almacen_columnar import AlmacenColumnar
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+
+
+def filas_esperadas(almacen: AlmacenColumnar) -> dict:
+    filas = {}
+    for fila, codigo in enumerate(almacen.get_especies()):
+        filas.setdefault(EspecieCultivo(codigo), []).append(fila)
+    return filas
+
+
+def test_bajas_actualizan_el_indice_de_especies():
+    azar = random.Random(6)
+    almacen = AlmacenColumnar()
+    for _ in range(20):
+        especie = azar.choice(("Pino", "Olivo", "Lechuga", "Zanahoria"))
+        almacen.extend_repetido(CultivoFactory.get_prototipo(especie), azar.randint(1, 30))
+    almacen.contar_por_especie()
+
+    while len(almacen) > 10:
+        if azar.random() < 0.5:
+            del almacen[azar.randrange(len(almacen))]
+        else:
+            almacen.quitar_filas(azar.sample(range(len(almacen)), azar.randint(1, 15)))
+        esperadas = filas_esperadas(almacen)
+        for especie in EspecieCultivo:
+            assert list(almacen.filas_de_especie(especie)) == esperadas.get(especie, [])
+        assert almacen.contar_por_especie() == {e: len(f) for e, f in esperadas.items()}
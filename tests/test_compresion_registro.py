@@ -0,0 +1,55 @@
+import io
+
+import pytest
+
+from python_forestacion.persistencia.compresion_registro import CompresionRegistro
+from python_forestacion.servicios.terrenos.registro_forestal_service import RegistroForestalService
+
+CODECS = ("zlib", "lzma", "bz2")
+
+
+def describir(plantacion) -> tuple:
+    return ([(type(c).__name__, c.get_agua(), c.get_superficie()) for c in plantacion.get_cultivos()],
+            plantacion.get_agua_disponible())
+
+
+@pytest.mark.parametrize("serializador", ["binario", "jsonl"])
+@pytest.mark.parametrize("codec,nivel", [(codec, None) for codec in CODECS] + [("zlib", 1), ("lzma", 9)])
+def test_registro_comprimido_ida_y_vuelta(codec, nivel, serializador, registro, tmp_path, capsys):
+    servicio = RegistroForestalService(str(tmp_path), generaciones_respaldo=0, sincronizar=False,
+                                       serializador=serializador, compresion=codec,
+                                       nivel_compresion=nivel)
+    servicio.persistir(registro)
+
+    with open(tmp_path / "Test.dat", "rb") as archivo:
+        assert CompresionRegistro.es_comprimido(archivo)
+    leido = RegistroForestalService.leer_registro("Test", str(tmp_path))
+    assert describir(leido.get_plantacion()) == describir(registro.get_plantacion())
+    assert RegistroForestalService.leer_encabezado("Test", str(tmp_path)).get_cantidad_cultivos() == 40
+    capsys.readouterr()
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_flujo_comprimido_no_cierra_el_destino(codec):
+    destino = io.BytesIO()
+    datos = b"cultivo;" * 10000
+    with CompresionRegistro(codec).abrir_escritura(destino) as comprimido:
+        comprimido.write(datos)
+    assert not destino.closed
+    assert len(destino.getvalue()) < len(datos)
+
+    destino.seek(0)
+    assert CompresionRegistro.abrir_lectura(destino).read() == datos
+
+
+def test_archivo_sin_comprimir_se_lee_tal_cual():
+    archivo = io.BytesIO(b"PFRB datos")
+    assert not CompresionRegistro.es_comprimido(archivo)
+    assert CompresionRegistro.abrir_lectura(archivo) is archivo
+
+
+def test_codec_desconocido():
+    with pytest.raises(ValueError):
+        CompresionRegistro("zstd")
+    with pytest.raises(ValueError):
+        CompresionRegistro.abrir_lectura(io.BytesIO(CompresionRegistro.MAGIA + b"?"))
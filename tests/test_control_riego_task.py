@@ -0,0 +1,106 @@
+import time
+
+import pytest
+
+from python_forestacion.constantes import DEBOUNCE_CONTROL_RIEGO, INTERVALO_CONTROL_RIEGO
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.patrones.observer.eventos.evento_sensor import EventoSensor
+from python_forestacion.patrones.observer.eventos.tipo_sensor import TipoSensor
+from python_forestacion.patrones.observer.observable import Observable
+from python_forestacion.riego.control.control_riego_task import ControlRiegoTask
+
+
+class FuenteFalsa(Observable[EventoSensor]):
+    """Sensor que emite sólo cuando la prueba lo pide."""
+
+    def __init__(self, tipo: TipoSensor):
+        super().__init__()
+        self._tipo = tipo
+
+    def emitir(self, valor: float) -> None:
+        self.notificar_observadores(EventoSensor("falso", self._tipo, valor))
+
+
+class ServicioFalso:
+
+    def __init__(self):
+        self.riegos = 0
+
+    def regar(self, plantacion, fecha=None, diario=None) -> int:
+        self.riegos += 1
+        return 0
+
+
+@pytest.fixture
+def armar(capsys):
+    controles = []
+
+    def armar(debounce: float):
+        temperatura = FuenteFalsa(TipoSensor.TEMPERATURA)
+        humedad = FuenteFalsa(TipoSensor.HUMEDAD)
+        servicio = ServicioFalso()
+        control = ControlRiegoTask(temperatura, humedad, Plantacion("Controlada", 100.0),
+                                   servicio, por_eventos=True, debounce=debounce)
+        controles.append(control)
+        control.start()
+        return control, temperatura, humedad, servicio
+
+    yield armar
+    for control in controles:
+        control.detener()
+        control.join(5)
+    capsys.readouterr()
+
+
+def esperar(condicion, limite: float = 5.0) -> None:
+    fin = time.monotonic() + limite
+    while not condicion():
+        assert time.monotonic() < fin, "la condición no se cumplió a tiempo"
+        time.sleep(0.005)
+
+
+def test_lectura_nueva_se_evalua_sin_esperar_el_intervalo(armar):
+    control, temperatura, humedad, servicio = armar(debounce=0.01)
+    time.sleep(0.05)
+    assert control.get_evaluaciones() == 0
+
+    inicio = time.monotonic()
+    temperatura.emitir(10.0)
+    humedad.emitir(30.0)
+    esperar(lambda: servicio.riegos == 1)
+    assert time.monotonic() - inicio < INTERVALO_CONTROL_RIEGO
+
+
+def test_rafaga_dentro_del_debounce_se_evalua_una_vez(armar):
+    control, temperatura, humedad, servicio = armar(debounce=DEBOUNCE_CONTROL_RIEGO)
+    for i in range(10):
+        temperatura.emitir(10.0 + i * 0.1)
+        humedad.emitir(30.0)
+    esperar(lambda: control.get_evaluaciones() == 1)
+    time.sleep(DEBOUNCE_CONTROL_RIEGO * 2)
+
+    assert control.get_evaluaciones() == 1
+    assert servicio.riegos == 1
+
+
+def test_detener_despierta_al_hilo_que_espera(armar):
+    control, temperatura, humedad, servicio = armar(debounce=10.0)
+    time.sleep(0.05)
+    # Esperando lecturas
+    inicio = time.monotonic()
+    control.detener()
+    control.join(1)
+    assert not control.is_alive()
+    assert time.monotonic() - inicio < 0.5
+
+    # Esperando el fin de la ventana de debounce: no riega con la ráfaga a medias
+    control, temperatura, humedad, servicio = armar(debounce=10.0)
+    temperatura.emitir(10.0)
+    humedad.emitir(30.0)
+    time.sleep(0.05)
+    inicio = time.monotonic()
+    control.detener()
+    control.join(1)
+    assert not control.is_alive()
+    assert time.monotonic() - inicio < 0.5
+    assert servicio.riegos == 0
@@ -0,0 +1,52 @@
+import pytest
+
+from python_forestacion.entidades.cultivos.arbol import Arbol
+from python_forestacion.entidades.cultivos.tipo_aceituna import TipoAceituna
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+
+# Un setter de atributo de la especie y el valor a poner, por especie
+ATRIBUTOS = {
+    "Pino": ("set_variedad", "Elliotis"),
+    "Olivo": ("set_tipo_aceituna", TipoAceituna.PICUAL),
+    "Lechuga": ("set_variedad", "Mantecosa"),
+    "Zanahoria": ("set_es_baby", True),
+}
+
+
+def estado(cultivo) -> tuple:
+    return (type(cultivo), cultivo.get_agua(), cultivo._descriptor,
+            cultivo.get_altura() if isinstance(cultivo, Arbol) else None)
+
+
+@pytest.mark.parametrize("especie", ATRIBUTOS)
+def test_clones_independientes(especie):
+    prototipo = CultivoFactory.get_prototipo(especie)
+    original = estado(prototipo)
+    modificado, intacto = CultivoFactory.crear_cultivos(especie, 2)
+    assert modificado is not intacto and modificado is not prototipo
+
+    modificado.set_agua(modificado.get_agua() + 7)
+    modificado.set_superficie(modificado.get_superficie() * 3)
+    setter, valor = ATRIBUTOS[especie]
+    getattr(modificado, setter)(valor)
+    if isinstance(modificado, Arbol):
+        modificado.set_altura(modificado.get_altura() + 2.5)
+
+    assert estado(modificado) != original
+    assert estado(intacto) == original
+    assert estado(prototipo) == original
+    # Los clones posteriores tampoco heredan los cambios
+    assert estado(CultivoFactory.crear_cultivo(especie)) == original
+    assert [estado(c) for c in CultivoFactory.crear_cultivos(especie, 3)] == [original] * 3
+
+
+def test_clon_de_un_cultivo_modificado():
+    pino = CultivoFactory.crear_cultivo("Pino")
+    pino.set_agua(40)
+    pino.set_altura(3.0)
+    clon = pino.clonar()
+    assert estado(clon) == estado(pino)
+
+    clon.set_agua(1)
+    clon.set_altura(0.1)
+    assert (pino.get_agua(), pino.get_altura()) == (40, 3.0)
@@ -0,0 +1,34 @@
+import pytest
+
+from python_forestacion.entidades.cultivos.lechuga import Lechuga
+from python_forestacion.entidades.cultivos.pino import Pino
+from python_forestacion.servicios.cultivos.cultivo_service_registry import CultivoServiceRegistry
+
+
+class PinoInjertado(Pino):
+    pass
+
+
+class LechugaHidroponica(Lechuga):
+    pass
+
+
+def test_subclases_se_resuelven_y_se_cachean():
+    registry = CultivoServiceRegistry.get_instance()
+    assert registry.get_servicio(PinoInjertado) is registry.get_servicio(Pino)
+    assert registry._servicios[PinoInjertado] is registry.get_servicio(Pino)
+
+
+def test_busqueda_sin_handler_se_cachea():
+    registry = CultivoServiceRegistry.get_instance()
+    # Las hortalizas no crecen: crecer no hace nada, y la búsqueda queda cacheada
+    registry.crecer(LechugaHidroponica("Crespa"))
+    assert registry._crecer_handlers[LechugaHidroponica] is None
+    registry.crecer(LechugaHidroponica("Crespa"))
+
+
+def test_tipo_desconocido():
+    registry = CultivoServiceRegistry.get_instance()
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            registry.get_servicio(int)
@@ -0,0 +1,51 @@
+import pickle
+
+from python_forestacion.entidades.cultivos.descriptor_cultivo import DescriptorCultivo
+from python_forestacion.entidades.cultivos.lechuga import Lechuga
+from python_forestacion.entidades.cultivos.olivo import Olivo
+from python_forestacion.entidades.cultivos.pino import Pino
+from python_forestacion.entidades.cultivos.tipo_aceituna import TipoAceituna
+from python_forestacion.entidades.cultivos.zanahoria import Zanahoria
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+
+
+def test_cultivos_iguales_comparten_descriptor():
+    a, b = Lechuga("Crespa"), Lechuga("Crespa")
+    assert a._descriptor is b._descriptor
+    assert a.get_variedad() == "Crespa"
+    assert a.tiene_invernadero() is True
+
+
+def test_constructor_arma_el_descriptor_completo():
+    pino = Pino("Paraná")
+    olivo = Olivo(TipoAceituna.ARBEQUINA)
+    zanahoria = Zanahoria(True)
+    assert pino._descriptor is DescriptorCultivo.obtener(pino.get_superficie(), _variedad="Paraná")
+    assert olivo.get_tipo_aceituna() is TipoAceituna.ARBEQUINA
+    assert zanahoria.es_baby() is True
+    assert zanahoria.tiene_invernadero() is False
+
+
+def test_setter_no_afecta_a_otros_cultivos():
+    a, b = Lechuga("Crespa"), Lechuga("Crespa")
+    a.set_variedad("Mantecosa")
+    assert a.get_variedad() == "Mantecosa"
+    assert b.get_variedad() == "Crespa"
+    assert a._descriptor is Lechuga("Mantecosa")._descriptor
+
+
+def test_pickle_vuelve_a_internar():
+    pino = Pino("Paraná")
+    copia = pickle.loads(pickle.dumps(pino))
+    assert copia._descriptor is pino._descriptor
+
+
+def test_crear_cultivo_equivale_al_constructor():
+    for especie, constructor in (("Pino", lambda: Pino(variedad="Paraná")),
+                                 ("Lechuga", lambda: Lechuga(variedad="Crespa")),
+                                 ("Zanahoria", lambda: Zanahoria(es_baby=False))):
+        creado, esperado = CultivoFactory.crear_cultivo(especie), constructor()
+        assert type(creado) is type(esperado)
+        assert creado._descriptor is esperado._descriptor
+        assert creado.get_agua() == esperado.get_agua()
+        assert creado is not CultivoFactory.get_prototipo(especie)
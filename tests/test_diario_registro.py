@@ -0,0 +1,179 @@
+import os
+import struct
+import threading
+import time
+import zlib
+from datetime import date
+
+import pytest
+
+from python_forestacion.entidades.cultivos.arbol import Arbol
+from python_forestacion.entidades.cultivos.especie_cultivo import EspecieCultivo
+from python_forestacion.entidades.cultivos.olivo import Olivo
+from python_forestacion.entidades.cultivos.pino import Pino
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.persistencia.diario_registro import DiarioRegistro
+from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
+from python_forestacion.servicios.terrenos.registro_forestal_service import RegistroForestalService
+
+FECHA = date(2024, 1, 15)
+
+
+@pytest.fixture
+def servicio(tmp_path, registro):
+    registro.get_plantacion().set_agua_disponible(10 ** 6)
+    servicio = RegistroForestalService(str(tmp_path), generaciones_respaldo=0, sincronizar=False)
+    servicio.persistir(registro)
+    return servicio
+
+
+@pytest.fixture(params=[False, True], ids=["objetos", "columnar"])
+def registro_modo(request, registro):
+    """El registro del fixture, con la plantación en modo objetos o columnar."""
+    if not request.param:
+        return registro
+    plantacion = Plantacion("Test", 10000.0, columnar=True)
+    plantacion.add_cultivos(registro.get_plantacion().get_cultivos())
+    registro.get_tierra().set_finca(plantacion)
+    return RegistroForestal(1, registro.get_tierra(), plantacion, "Test", 1000.0)
+
+
+def estado(plantacion) -> tuple:
+    return ([(type(c).__name__, c.get_agua(), c.get_altura() if isinstance(c, Arbol) else None)
+             for c in plantacion.get_cultivos()],
+            plantacion.get_agua_disponible())
+
+
+def leer(tmp_path):
+    return RegistroForestalService.leer_registro("Test", str(tmp_path)).get_plantacion()
+
+
+def test_reproducir_diario_iguala_la_plantacion(servicio, registro, tmp_path):
+    plantacion = registro.get_plantacion()
+    plantacion_service = PlantacionService()
+    with servicio.abrir_diario("Test") as diario:
+        plantacion_service.plantar_lote(plantacion, "Pino", 5, diario=diario)
+        plantacion_service.regar_por_lote(plantacion, FECHA, diario=diario)
+        plantacion_service.cosechar_especie(plantacion, "Lechuga", 3, diario=diario)
+        plantacion_service.regar_por_lote(plantacion, FECHA, diario=diario)
+        assert diario.get_cantidad_operaciones() == 4
+
+    assert estado(leer(tmp_path)) == estado(plantacion)
+
+
+def test_compactar_vuelca_y_vacia_el_diario(servicio, registro, tmp_path):
+    plantacion = registro.get_plantacion()
+    with servicio.abrir_diario("Test") as diario:
+        PlantacionService().regar_por_lote(plantacion, FECHA, diario=diario)
+
+    assert servicio.compactar("Test", 0)
+    assert os.path.getsize(tmp_path / "Test.diario") == DiarioRegistro.TAMANIO_CABECERA
+    assert estado(leer(tmp_path)) == estado(plantacion)
+    assert not servicio.compactar("Test", 0)
+
+
+def test_compactar_no_pierde_operaciones_de_otros_diarios(servicio, registro, tmp_path):
+    plantacion = registro.get_plantacion()
+    plantacion_service = PlantacionService()
+    otro = servicio.abrir_diario("Test")
+    desactualizado = servicio.abrir_diario("Test")
+    with servicio.abrir_diario("Test") as diario:
+        plantacion_service.regar_por_lote(plantacion, FECHA, diario=diario)
+
+        def volcar():
+            # Otro diario intenta anotar a mitad de la compactación
+            hilo.start()
+            time.sleep(0.05)
+            assert hilo.is_alive()
+            servicio.persistir(RegistroForestalService.leer_registro("Test", str(tmp_path)))
+
+        hilo = threading.Thread(target=lambda: plantacion_service.plantar_lote(
+            plantacion, "Olivo", 2, diario=otro))
+        diario.compactar(volcar)
+        hilo.join()
+
+    # Un diario abierto antes de compactar no vacía lo anotado después
+    plantacion_service.cosechar_especie(plantacion, "Pino", 1, diario=desactualizado)
+    otro.close()
+    desactualizado.close()
+
+    assert DiarioRegistro.tiene_operaciones(str(tmp_path / "Test.diario"), str(tmp_path / "Test.dat"))
+    assert estado(leer(tmp_path)) == estado(plantacion)
+
+
+def test_operacion_incompleta_se_descarta(servicio, registro, tmp_path):
+    with servicio.abrir_diario("Test") as diario:
+        diario.plantar(EspecieCultivo.PINO, 1)
+    ruta = tmp_path / "Test.diario"
+    with open(ruta, "ab") as archivo:
+        archivo.write(b"R\x00\x00")
+
+    plantacion = leer(tmp_path)
+    assert len(plantacion.get_cultivos()) == len(registro.get_plantacion().get_cultivos()) + 1
+    with servicio.abrir_diario("Test") as diario:
+        assert diario.get_cantidad_operaciones() == 1
+
+
+def test_regar_planta_por_planta_queda_en_el_diario(registro_modo, tmp_path, capsys):
+    plantacion = registro_modo.get_plantacion()
+    plantacion.set_agua_disponible(10 ** 6)
+    servicio = RegistroForestalService(str(tmp_path), generaciones_respaldo=0, sincronizar=False)
+    servicio.persistir(registro_modo)
+    with servicio.abrir_diario("Test") as diario:
+        PlantacionService().regar(plantacion, FECHA, diario=diario)
+        assert diario.get_cantidad_operaciones() == 1
+    capsys.readouterr()
+
+    assert estado(leer(tmp_path)) == estado(plantacion)
+
+
+def test_riego_con_litros_por_cultivo(registro_modo, tmp_path, capsys):
+    plantacion = registro_modo.get_plantacion()
+    servicio = RegistroForestalService(str(tmp_path), generaciones_respaldo=0, sincronizar=False)
+    servicio.persistir(registro_modo)
+    pinos = [c for c in plantacion.get_cultivos() if isinstance(c, Pino)]
+    litros = list(range(len(pinos)))
+    for pino, valor in zip(pinos, litros):
+        pino.set_agua(pino.get_agua() + valor)
+    olivos = [c for c in plantacion.get_cultivos() if isinstance(c, Olivo)]
+    for olivo in olivos:
+        olivo.set_agua(olivo.get_agua() + 4)
+        olivo.set_altura(olivo.get_altura() + 0.5)
+    plantacion.set_agua_disponible(plantacion.get_agua_disponible() - sum(litros) - 4 * len(olivos))
+
+    with servicio.abrir_diario("Test") as diario:
+        diario.regar({EspecieCultivo.PINO: litros, EspecieCultivo.OLIVO: [4] * len(olivos)},
+                     {EspecieCultivo.OLIVO: 0.5}, plantacion.get_agua_disponible())
+    capsys.readouterr()
+
+    assert estado(leer(tmp_path)) == estado(plantacion)
+
+
+def test_registro_reescrito_con_igual_tamanio_y_mtime_invalida_el_diario(servicio, registro, tmp_path):
+    with servicio.abrir_diario("Test") as diario:
+        diario.plantar(EspecieCultivo.PINO, 1)
+    ruta = tmp_path / "Test.dat"
+    anterior = os.stat(ruta)
+    # Reemplazo atómico con el mismo contenido, dentro del mismo tick de mtime
+    copia = tmp_path / "Test.dat.tmp"
+    copia.write_bytes(ruta.read_bytes())
+    os.replace(copia, ruta)
+    os.utime(ruta, ns=(anterior.st_atime_ns, anterior.st_mtime_ns))
+
+    assert not DiarioRegistro.tiene_operaciones(str(tmp_path / "Test.diario"), str(ruta))
+    assert len(leer(tmp_path).get_cultivos()) == len(registro.get_plantacion().get_cultivos())
+
+
+def test_diario_de_version_1_se_sigue_leyendo(servicio, registro, tmp_path):
+    base = os.stat(tmp_path / "Test.dat")
+    payload = struct.pack("<BQ", EspecieCultivo.PINO, 2)
+    operacion = struct.pack("<cII", b"P", len(payload), zlib.crc32(b"P" + payload)) + payload
+    (tmp_path / "Test.diario").write_bytes(
+        struct.pack("<4sBQq", b"PFDJ", 1, base.st_size, base.st_mtime_ns) + operacion
+    )
+    with servicio.abrir_diario("Test") as diario:
+        assert diario.get_cantidad_operaciones() == 1
+        diario.cosechar(EspecieCultivo.LECHUGA, 1)
+
+    assert len(leer(tmp_path).get_cultivos()) == len(registro.get_plantacion().get_cultivos()) + 1
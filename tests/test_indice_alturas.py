@@ -0,0 +1,93 @@
+import math
+import random
+from datetime import date
+
+import pytest
+
+from python_forestacion.entidades.cultivos.especie_cultivo import EspecieCultivo
+from python_forestacion.entidades.cultivos.pino import Pino
+from python_forestacion.entidades.terrenos.indice_alturas import IndiceAlturas
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.entidades.terrenos.plantacion_stats import PlantacionStats
+from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
+
+
+class IndiceChico(IndiceAlturas):
+    """Bloques chicos: las pruebas cortas también parten y vacían bloques."""
+    TAMANIO_BLOQUE = 4
+
+
+def percentil(ordenadas, porcentaje):
+    return ordenadas[max(math.ceil(porcentaje / 100 * len(ordenadas)), 1) - 1]
+
+
+def test_consultas_coinciden_con_recorrido_completo():
+    azar = random.Random(17)
+    indice = IndiceChico(azar.choice((1.0, 2.5, 3.0)) for _ in range(30))
+    alturas = sorted(indice)
+    for _ in range(2000):
+        operacion = azar.random()
+        if operacion < 0.4 or not alturas:
+            altura = round(azar.uniform(0, 20), 1)
+            indice.agregar(altura)
+            alturas.append(altura)
+        elif operacion < 0.7:
+            altura = azar.choice(alturas)
+            indice.quitar(altura)
+            alturas.remove(altura)
+        elif operacion < 0.9:
+            anterior, nueva = azar.choice(alturas), round(azar.uniform(0, 20), 1)
+            indice.reemplazar(anterior, nueva)
+            alturas[alturas.index(anterior)] = nueva
+        else:
+            incremento = azar.uniform(0, 1)
+            indice.desplazar(incremento)
+            alturas = [altura + incremento for altura in alturas]
+        alturas.sort()
+
+        assert list(indice) == alturas
+        desde, hasta = sorted((azar.uniform(0, 20), azar.uniform(0, 20)))
+        assert indice.contar_rango(desde, hasta) == sum(desde <= a < hasta for a in alturas)
+        assert indice.contar_mayores(hasta) == sum(a > hasta for a in alturas)
+        assert indice.contar_menores(desde) == sum(a < desde for a in alturas)
+        if alturas:
+            porcentaje = azar.uniform(0, 100)
+            assert indice.percentil(porcentaje) == percentil(alturas, porcentaje)
+            assert (indice.get_minimo(), indice.get_maximo()) == (alturas[0], alturas[-1])
+
+
+def test_quitar_altura_ausente_y_percentil_vacio():
+    indice = IndiceAlturas([1.0, 2.0])
+    with pytest.raises(ValueError):
+        indice.quitar(3.0)
+    assert IndiceAlturas().percentil(50) is None
+    with pytest.raises(ValueError):
+        indice.percentil(101)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_plantacion_mantiene_el_indice(columnar, capsys):
+    plantacion = Plantacion("Alturas", 10000.0, columnar=columnar)
+    plantacion.set_agua_disponible(10 ** 6)
+    servicio = PlantacionService()
+    servicio.plantar_lote(plantacion, "Pino", 40)
+    servicio.plantar_lote(plantacion, "Lechuga", 10)
+    indice = plantacion.get_indice_alturas(Pino)
+
+    pinos = [c for c in plantacion.get_cultivos() if isinstance(c, Pino)]
+    for i, pino in enumerate(pinos[:10]):
+        pino.set_altura(pino.get_altura() + i * 0.5)
+    servicio.regar_por_lote(plantacion, date(2024, 1, 15))
+    servicio.plantar_lote(plantacion, "Pino", 5)
+    servicio.cosechar_especie(plantacion, "Pino", 3)
+    capsys.readouterr()
+
+    alturas = sorted(c.get_altura() for c in plantacion.get_cultivos() if isinstance(c, Pino))
+    assert list(indice) == alturas
+    assert indice.percentil(50) == percentil(alturas, 50)
+
+    distribucion = PlantacionStats.calcular(plantacion).get_distribucion_alturas(EspecieCultivo.PINO)
+    assert distribucion.get_cantidad() == len(alturas)
+    assert sum(cantidad for _, _, cantidad in distribucion.get_histograma()) == len(alturas)
+    for desde, hasta, cantidad in distribucion.get_histograma():
+        assert cantidad == sum(desde <= a < hasta for a in alturas)
@@ -0,0 +1,105 @@
+import copyreg
+import pickle
+
+import pytest
+
+from python_forestacion.entidades.cultivos.arbol import Arbol
+from python_forestacion.entidades.cultivos.lechuga import Lechuga
+from python_forestacion.entidades.cultivos.olivo import Olivo
+from python_forestacion.entidades.cultivos.pino import Pino
+from python_forestacion.entidades.cultivos.tipo_aceituna import TipoAceituna
+from python_forestacion.entidades.cultivos.zanahoria import Zanahoria
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+
+ESPECIES = ("Pino", "Olivo", "Lechuga", "Zanahoria")
+
+
+class PickleLegado:
+    """Se serializa como un cultivo de antes de __slots__: un __dict__ con todos los campos."""
+
+    def __init__(self, clase: type, estado: dict):
+        self._clase = clase
+        self._estado = estado
+
+    def __reduce_ex__(self, protocolo):
+        return (copyreg._reconstructor, (self._clase, object, None), self._estado)
+
+
+def estado(cultivo) -> tuple:
+    return (type(cultivo), cultivo.get_agua(), cultivo._descriptor,
+            cultivo.get_altura() if isinstance(cultivo, Arbol) else None)
+
+
+@pytest.mark.parametrize("especie", ESPECIES)
+@pytest.mark.parametrize("protocolo", [2, pickle.HIGHEST_PROTOCOL])
+def test_ida_y_vuelta_de_cultivos_con_slots(especie, protocolo):
+    cultivo = CultivoFactory.crear_cultivo(especie)
+    cultivo.set_agua(17)
+    cultivo.set_superficie(4.25)
+    if isinstance(cultivo, Arbol):
+        cultivo.set_altura(2.75)
+    assert not hasattr(cultivo, '__dict__')
+
+    copia = pickle.loads(pickle.dumps(cultivo, protocolo))
+
+    assert copia is not cultivo
+    assert estado(copia) == estado(cultivo)
+    # El descriptor se vuelve a internar: no se duplica por cada carga
+    assert copia._descriptor is cultivo._descriptor
+    assert copia._plantacion is None
+
+
+@pytest.mark.parametrize("clase,estado_legado,esperado", [
+    (Pino, {'_agua': 5, '_superficie': 2.0, '_altura': 1.25, '_variedad': "Elliotis"},
+     lambda: Pino("Elliotis")),
+    (Olivo, {'_agua': 5, '_superficie': 1.5, '_altura': 1.25, '_tipo_aceituna': TipoAceituna.PICUAL},
+     lambda: Olivo(TipoAceituna.PICUAL)),
+    (Lechuga, {'_agua': 5, '_superficie': 0.5, '_invernadero': True, '_variedad': "Crespa"},
+     lambda: Lechuga("Crespa")),
+    (Zanahoria, {'_agua': 5, '_superficie': 0.3, '_invernadero': False, '_es_baby': True},
+     lambda: Zanahoria(True)),
+])
+def test_pickle_legado_con_dict_se_carga(clase, estado_legado, esperado):
+    datos = pickle.dumps(PickleLegado(clase, dict(estado_legado)))
+
+    cultivo = pickle.loads(datos)
+
+    assert type(cultivo) is clase
+    assert not hasattr(cultivo, '__dict__')
+    assert cultivo.get_agua() == 5
+    assert cultivo._descriptor is esperado()._descriptor
+    if isinstance(cultivo, Arbol):
+        assert cultivo.get_altura() == 1.25
+    assert cultivo._plantacion is None
+
+
+def test_cultivo_suelto_no_arrastra_su_plantacion():
+    plantacion = Plantacion("Origen", 1000.0)
+    plantacion.add_cultivos(CultivoFactory.crear_cultivos("Pino", 3))
+    cultivo = plantacion.get_cultivos()[0]
+
+    datos = pickle.dumps(cultivo)
+    copia = pickle.loads(datos)
+
+    assert b"Origen" not in datos
+    assert copia._plantacion is None
+    ocupada = plantacion.get_superficie_ocupada()
+    copia.set_superficie(50.0)
+    assert plantacion.get_superficie_ocupada() == ocupada
+
+
+def test_plantacion_vuelve_a_vincular_sus_cultivos():
+    plantacion = Plantacion("Origen", 1000.0)
+    plantacion.add_cultivos(CultivoFactory.crear_cultivos("Pino", 3))
+    plantacion.add_cultivos(CultivoFactory.crear_cultivos("Lechuga", 2))
+
+    copia = pickle.loads(pickle.dumps(plantacion))
+
+    assert all(c._plantacion is copia for c in copia.get_cultivos())
+    assert [estado(c) for c in copia.get_cultivos()] == [estado(c) for c in plantacion.get_cultivos()]
+    assert copia.get_cultivos_por_tipo(Pino) == copia.get_cultivos()[:3]
+    # El contador de la copia sigue los cambios de sus propios cultivos
+    copia.get_cultivos()[0].set_superficie(12.0)
+    assert copia.get_superficie_ocupada() == pytest.approx(plantacion.get_superficie_ocupada() + 10.0)
+    assert copia.get_superficie_ocupada() == pytest.approx(copia._sumar_superficies())
@@ -0,0 +1,132 @@
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.patrones.observer.eventos.evento_sensor import EventoSensor
+from python_forestacion.patrones.observer.eventos.tipo_sensor import TipoSensor
+from python_forestacion.patrones.observer.observable import Observable
+from python_forestacion.riego.control.planificador_riego import PlanificadorRiego
+
+
+class FuenteFalsa(Observable[EventoSensor]):
+    """Sensor que emite sólo cuando la prueba lo pide."""
+
+    def emitir_condiciones_de_riego(self) -> None:
+        self.notificar_observadores(EventoSensor("falso", TipoSensor.TEMPERATURA, 10.0))
+        self.notificar_observadores(EventoSensor("falso", TipoSensor.HUMEDAD, 30.0))
+
+
+class ServicioFalso:
+    """Registra los riegos y los retiene hasta que la prueba los libera."""
+
+    def __init__(self):
+        self.orden = []
+        self.en_curso = Counter()
+        self.max_en_curso = 0
+        self.solapados = False
+        self.liberar = threading.Event()
+        self._lock = threading.Lock()
+
+    def regar(self, plantacion, fecha=None, diario=None) -> int:
+        nombre = plantacion.get_nombre()
+        with self._lock:
+            self.orden.append(nombre)
+            self.solapados |= self.en_curso[nombre] > 0
+            self.en_curso[nombre] += 1
+            self.max_en_curso = max(self.max_en_curso, sum(self.en_curso.values()))
+        self.liberar.wait(5)
+        with self._lock:
+            self.en_curso[nombre] -= 1
+        return 0
+
+    def get_en_curso(self) -> int:
+        with self._lock:
+            return sum(self.en_curso.values())
+
+
+def esperar(condicion, limite: float = 5.0) -> None:
+    fin = time.monotonic() + limite
+    while not condicion():
+        assert time.monotonic() < fin, "la condición no se cumplió a tiempo"
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def servicio():
+    servicio = ServicioFalso()
+    yield servicio
+    servicio.liberar.set()
+
+
+def armar(servicio: ServicioFalso, cantidad: int, max_hilos: int):
+    planificador = PlanificadorRiego(servicio, max_hilos=max_hilos)
+    fuentes = []
+    for i in range(cantidad):
+        fuente = FuenteFalsa()
+        planificador.agregar_plantacion(Plantacion(f"P{i}", 100.0), [fuente])
+        fuentes.append(fuente)
+    return planificador, fuentes
+
+
+def detener(planificador: PlanificadorRiego) -> None:
+    planificador.detener()
+    planificador.join(5)
+    assert not planificador.is_alive()
+
+
+def test_despacha_en_orden_de_llegada(servicio, capsys):
+    planificador, fuentes = armar(servicio, 5, max_hilos=1)
+    for fuente in fuentes:
+        fuente.emitir_condiciones_de_riego()
+    planificador.start()
+    esperar(lambda: servicio.orden == ["P0"])
+    # P0 recibe lecturas mientras se riega: vuelve al final, detrás de las demás
+    fuentes[0].emitir_condiciones_de_riego()
+    servicio.liberar.set()
+    esperar(lambda: planificador.get_riegos() == 6)
+    detener(planificador)
+    capsys.readouterr()
+
+    assert servicio.orden == ["P0", "P1", "P2", "P3", "P4", "P0"]
+
+
+def test_no_supera_max_hilos(servicio, capsys):
+    planificador, fuentes = armar(servicio, 6, max_hilos=2)
+    for fuente in fuentes:
+        fuente.emitir_condiciones_de_riego()
+    planificador.start()
+    esperar(lambda: servicio.get_en_curso() == 2)
+    time.sleep(0.05)
+    # Sin hilos libres no se despacha: el resto espera en la cola, no en el pool
+    assert servicio.get_en_curso() == 2
+    assert planificador.get_cantidad_en_cola() == 4
+    servicio.liberar.set()
+    esperar(lambda: planificador.get_riegos() == 6)
+    detener(planificador)
+    capsys.readouterr()
+
+    assert servicio.max_en_curso == 2
+
+
+def test_lecturas_durante_un_riego_se_unen_en_un_solo_turno(servicio, capsys):
+    planificador, fuentes = armar(servicio, 1, max_hilos=3)
+    fuentes[0].emitir_condiciones_de_riego()
+    planificador.start()
+    esperar(lambda: servicio.get_en_curso() == 1)
+    for _ in range(5):
+        fuentes[0].emitir_condiciones_de_riego()
+    time.sleep(0.05)
+    # Hay hilos libres, pero la plantación no se despacha de nuevo mientras se riega
+    assert servicio.get_en_curso() == 1
+    assert planificador.get_cantidad_en_cola() == 0
+    servicio.liberar.set()
+    esperar(lambda: planificador.get_riegos() == 2)
+    time.sleep(0.05)
+    detener(planificador)
+    capsys.readouterr()
+
+    assert servicio.orden == ["P0", "P0"]
+    assert not servicio.solapados
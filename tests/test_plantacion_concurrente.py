@@ -0,0 +1,83 @@
+import math
+import threading
+import time
+
+import pytest
+
+from python_forestacion.entidades.cultivos.pino import Pino
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.entidades.terrenos.plantacion_stats import PlantacionStats
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
+
+AGUA_INICIAL = 10 ** 12
+ESPECIES = ("Pino", "Olivo", "Lechuga", "Zanahoria")
+SEGUNDOS = 0.3
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_hilos_concurrentes_conservan_agua_y_cultivos(columnar, capsys):
+    plantacion = Plantacion("Concurrente", 10 ** 9, columnar=columnar, concurrente=True)
+    plantacion.set_agua_disponible(AGUA_INICIAL)
+    servicio = PlantacionService()
+    limite = time.monotonic() + SEGUNDOS
+    lock = threading.Lock()
+    regado = [0]
+    plantados = {especie: 0 for especie in ESPECIES}
+    cosechados = []
+    errores = []
+
+    def correr(funcion):
+        def envoltura():
+            try:
+                while time.monotonic() < limite:
+                    funcion()
+            except Exception as e:
+                errores.append(e)
+        return threading.Thread(target=envoltura)
+
+    def regar(regar_con):
+        litros = regar_con(plantacion)
+        with lock:
+            regado[0] += litros
+
+    def plantar(especie):
+        servicio.plantar_lote(plantacion, especie, 7)
+        with lock:
+            plantados[especie] += 7
+
+    def cosechar():
+        cosecha = servicio.cosechar_especie(plantacion, "Pino", 5)
+        with lock:
+            cosechados.extend(cosecha)
+
+    def leer():
+        with plantacion.leyendo():
+            assert len(plantacion.get_indice_alturas(Pino)) == plantacion.contar_por_tipo(Pino)
+        PlantacionStats.calcular(plantacion)
+
+    hilos = [correr(lambda: regar(servicio.regar)),
+             correr(lambda: regar(servicio.regar_por_lote)),
+             correr(lambda: plantar("Pino")), correr(lambda: plantar("Lechuga")),
+             correr(cosechar), correr(leer)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    capsys.readouterr()
+
+    assert errores == []
+    cultivos = plantacion.get_cultivos()
+    assert len(cultivos) + len(cosechados) == sum(plantados.values())
+
+    # El agua que salió de la plantación es la que sumaron los cultivos
+    assert AGUA_INICIAL - plantacion.get_agua_disponible() == regado[0]
+    agua_inicial = sum(CultivoFactory.get_prototipo(especie).get_agua() * cantidad
+                       for especie, cantidad in plantados.items())
+    agua_cultivos = sum(c.get_agua() for c in cultivos) + sum(c.get_agua() for c in cosechados)
+    assert agua_cultivos == agua_inicial + regado[0]
+
+    assert math.isclose(plantacion.get_superficie_ocupada(),
+                        sum(c.get_superficie() for c in cultivos), abs_tol=1e-6)
+    alturas = sorted(c.get_altura() for c in cultivos if isinstance(c, Pino))
+    assert list(plantacion.get_indice_alturas(Pino)) == alturas
@@ -0,0 +1,115 @@
+from datetime import date
+
+import pytest
+
+from python_forestacion.entidades.cultivos.arbol import Arbol
+from python_forestacion.entidades.cultivos.pino import Pino
+from python_forestacion.entidades.terrenos import almacen_columnar
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.patrones.strategy.absorcion_agua_strategy import AbsorcionAguaStrategy
+from python_forestacion.servicios.cultivos.cultivo_service_registry import CultivoServiceRegistry
+from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
+
+FECHAS = (date(2025, 1, 1), date(2024, 7, 15))
+
+
+class AbsorcionPorAltura(AbsorcionAguaStrategy):
+    """Depende de cada árbol y no declara clave_cache."""
+
+    def calcular_absorcion(self, fecha, temperatura, humedad, cultivo) -> int:
+        return fecha.month + int(cultivo.get_altura() * 4)
+
+
+@pytest.fixture(autouse=True)
+def silencio(capsys):
+    yield
+    capsys.readouterr()
+
+
+@pytest.fixture(params=["sin numpy", "numpy"])
+def numpy(request, monkeypatch):
+    """Recorre los dos caminos de AlmacenColumnar.sumar_por_especie."""
+    if request.param == "numpy":
+        monkeypatch.setattr(almacen_columnar, "np", pytest.importorskip("numpy"))
+    else:
+        monkeypatch.setattr(almacen_columnar, "np", None)
+
+
+def crear_plantacion(columnar: bool) -> Plantacion:
+    plantacion = Plantacion("Regada", 10000.0, columnar=columnar)
+    plantacion.set_agua_disponible(10 ** 6)
+    servicio = PlantacionService()
+    for especie, cantidad in (("Pino", 12), ("Olivo", 8), ("Lechuga", 10), ("Zanahoria", 6)):
+        servicio.plantar_lote(plantacion, especie, cantidad)
+    for i, cultivo in enumerate(plantacion.get_cultivos()[:16]):
+        cultivo.set_altura(cultivo.get_altura() + i * 0.3)
+    return plantacion
+
+
+def estado(plantacion: Plantacion) -> tuple:
+    return ([(type(c).__name__.replace("Vista", ""), c.get_agua(),
+              c.get_altura() if isinstance(c, Arbol) else None)
+             for c in plantacion.get_cultivos()],
+            plantacion.get_agua_disponible())
+
+
+def regar_de_las_dos_formas(columnar: bool, fecha: date) -> None:
+    servicio = PlantacionService()
+    por_planta, por_lote = crear_plantacion(columnar), crear_plantacion(columnar)
+    for _ in range(3):
+        assert servicio.regar(por_planta, fecha) == servicio.regar_por_lote(por_lote, fecha)
+    assert estado(por_lote) == estado(por_planta)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize("fecha", FECHAS)
+def test_regar_por_lote_equivale_a_regar(columnar, fecha, numpy):
+    regar_de_las_dos_formas(columnar, fecha)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_estrategia_sin_clave_se_evalua_planta_por_planta(columnar, monkeypatch):
+    servicio_pino = CultivoServiceRegistry.get_instance().get_servicio(Pino)
+    estrategia = AbsorcionPorAltura()
+    monkeypatch.setattr(servicio_pino, "_estrategia_absorcion", estrategia)
+    monkeypatch.setattr(servicio_pino, "_clave_cache", estrategia.clave_cache)
+
+    regar_de_las_dos_formas(columnar, FECHAS[0])
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_cosechar_especie_conserva_el_orden_del_resto(columnar):
+    plantacion = crear_plantacion(columnar)
+    PlantacionService().plantar_lote(plantacion, "Pino", 5)
+    antes = estado(plantacion)[0]
+    pinos = [i for i, fila in enumerate(antes) if fila[0] == "Pino"]
+
+    cosechados = PlantacionService().cosechar_especie(plantacion, "Pino", 14)
+
+    assert [(type(c).__name__, c.get_agua(), c.get_altura()) for c in cosechados] == \
+        [antes[i] for i in pinos[:14]]
+    quitados = set(pinos[:14])
+    assert estado(plantacion)[0] == [fila for i, fila in enumerate(antes) if i not in quitados]
+    assert len(plantacion.get_cultivos_por_tipo(Pino)) == 3
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_plantar_lote_equivale_a_plantar(columnar):
+    por_cultivo = Plantacion("Uno a uno", 10000.0, columnar=columnar)
+    por_lote = Plantacion("Lote", 10000.0, columnar=columnar)
+    servicio = PlantacionService()
+    for especie, cantidad in (("Pino", 6), ("Lechuga", 4), ("Olivo", 3), ("Zanahoria", 5), ("Pino", 2)):
+        servicio.plantar(por_cultivo, especie, cantidad)
+        servicio.plantar_lote(por_lote, especie, cantidad)
+
+    assert [(type(c), c.get_agua(), c._descriptor, c.get_altura() if isinstance(c, Arbol) else None)
+            for c in por_lote.get_cultivos()] == \
+        [(type(c), c.get_agua(), c._descriptor, c.get_altura() if isinstance(c, Arbol) else None)
+         for c in por_cultivo.get_cultivos()]
+    assert por_lote.get_superficie_ocupada() == pytest.approx(por_cultivo.get_superficie_ocupada())
+    assert len(por_lote.get_indice_alturas(Pino)) == len(por_cultivo.get_indice_alturas(Pino)) == 8
+
+    # Los cultivos del lote no comparten estado entre sí
+    primero, segundo = por_lote.get_cultivos_por_tipo(Pino)[:2]
+    primero.set_agua(primero.get_agua() + 5)
+    assert segundo.get_agua() == por_cultivo.get_cultivos()[1].get_agua()
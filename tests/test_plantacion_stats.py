@@ -0,0 +1,83 @@
+import pytest
+
+from python_forestacion.entidades.cultivos.especie_cultivo import EspecieCultivo
+from python_forestacion.entidades.terrenos.indice_alturas import IndiceAlturas
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.entidades.terrenos.plantacion_stats import DistribucionAlturas, PlantacionStats
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+
+
+def crear_cultivos(especie: str, aguas: list, alturas: list = None) -> list:
+    cultivos = CultivoFactory.crear_cultivos(especie, len(aguas))
+    for i, cultivo in enumerate(cultivos):
+        cultivo.set_agua(aguas[i])
+        if alturas is not None:
+            cultivo.set_altura(alturas[i])
+    return cultivos
+
+
+def crear_plantacion(columnar: bool) -> Plantacion:
+    plantacion = Plantacion("Chica", 100.0, columnar=columnar)
+    plantacion.set_agua_disponible(321)
+    pinos = crear_cultivos("Pino", [2, 5, 0, 10], [0.5, 1.0, 1.2, 3.7])
+    pinos[3].set_superficie(3.0)
+    plantacion.add_cultivos(pinos[:2])
+    plantacion.add_cultivos(crear_cultivos("Lechuga", [1, 1, 1]))
+    plantacion.add_cultivos(crear_cultivos("Olivo", [2, 2], [0.9, 0.4]))
+    plantacion.add_cultivos(pinos[2:])
+    return plantacion
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_estadisticas_de_una_plantacion_chica(columnar):
+    stats = PlantacionStats.calcular(crear_plantacion(columnar))
+
+    assert stats.get_nombre() == "Chica"
+    assert stats.get_agua_disponible() == 321
+    assert stats.get_cantidad_trabajadores() == 0
+    assert stats.get_cantidad_cultivos() == 9
+    assert stats.get_cantidad_por_especie() == {EspecieCultivo.PINO: 4, EspecieCultivo.OLIVO: 2,
+                                                EspecieCultivo.LECHUGA: 3}
+    assert stats.get_agua_por_especie() == {EspecieCultivo.PINO: 17, EspecieCultivo.OLIVO: 4,
+                                            EspecieCultivo.LECHUGA: 3}
+    assert stats.get_agua_total() == 24
+    assert stats.get_agua_media() == pytest.approx(24 / 9)
+    assert stats.get_superficie_por_especie() == pytest.approx(
+        {EspecieCultivo.PINO: 9.0, EspecieCultivo.OLIVO: 3.0, EspecieCultivo.LECHUGA: 1.5})
+    assert stats.get_superficie_ocupada() == pytest.approx(13.5)
+    assert stats.get_superficie_disponible() == pytest.approx(86.5)
+
+    assert set(stats.get_distribuciones_alturas()) == {EspecieCultivo.PINO, EspecieCultivo.OLIVO}
+    assert stats.get_distribucion_alturas(EspecieCultivo.LECHUGA) is None
+    pinos = stats.get_distribucion_alturas(EspecieCultivo.PINO)
+    assert pinos.get_cantidad() == 4
+    assert (pinos.get_minimo(), pinos.get_maximo()) == (0.5, 3.7)
+    assert pinos.get_media() == pytest.approx(1.6)
+    assert pinos.get_histograma() == [(0.5, 1.0, 1), (1.0, 1.5, 2), (3.5, 4.0, 1)]
+    olivos = stats.get_distribucion_alturas(EspecieCultivo.OLIVO)
+    assert olivos.get_histograma() == [(0.0, 0.5, 1), (0.5, 1.0, 1)]
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_plantacion_vacia(columnar):
+    stats = PlantacionStats.calcular(Plantacion("Vacia", 10.0, columnar=columnar))
+    assert stats.get_cantidad_cultivos() == 0
+    assert stats.get_agua_media() == 0.0
+    assert stats.get_superficie_disponible() == 10.0
+    assert stats.get_distribuciones_alturas() == {}
+
+
+@pytest.mark.parametrize("intervalo", [0.5, 0.3, 0.1])
+def test_distribucion_desde_indice_equivale_a_agregar(intervalo):
+    alturas = [0.3, 0.6, 0.6, 0.9, 1.2, 1.5, 0.1 * 7, 2.0, 5.9, 0.0] * 3
+    esperada = DistribucionAlturas(intervalo)
+    for altura in alturas:
+        esperada.agregar(altura)
+
+    distribucion = DistribucionAlturas.desde_indice(IndiceAlturas(alturas), intervalo)
+
+    assert distribucion.get_histograma() == esperada.get_histograma()
+    assert distribucion.get_cantidad() == esperada.get_cantidad()
+    assert (distribucion.get_minimo(), distribucion.get_maximo()) == (0.0, 5.9)
+    assert distribucion.get_media() == pytest.approx(esperada.get_media())
+    assert DistribucionAlturas.desde_indice(IndiceAlturas()).get_histograma() == []
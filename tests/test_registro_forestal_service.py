@@ -0,0 +1,120 @@
+import pytest
+
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.entidades.terrenos.tierra import Tierra
+from python_forestacion.excepciones.persistencia_exception import PersistenciaException
+from python_forestacion.excepciones.persistencia_multiple_exception import PersistenciaMultipleException
+from python_forestacion.persistencia.diario_registro import DiarioRegistro
+from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
+from python_forestacion.servicios.terrenos.registro_forestal_service import RegistroForestalService
+
+
+@pytest.fixture
+def servicio(tmp_path):
+    RegistroForestalService.get_cache().limpiar()
+    return RegistroForestalService(str(tmp_path), generaciones_respaldo=0, sincronizar=False)
+
+
+def test_lectura_sin_cache_devuelve_registros_distintos(servicio, registro, tmp_path):
+    servicio.persistir(registro)
+    a = RegistroForestalService.leer_registro("Test", str(tmp_path))
+    b = RegistroForestalService.leer_registro("Test", str(tmp_path))
+    assert a is not b
+    a.get_plantacion().set_agua_disponible(0)
+    assert b.get_plantacion().get_agua_disponible() == 1000
+
+
+def test_lectura_con_cache_es_opcional(servicio, registro, tmp_path):
+    servicio.persistir(registro)
+    a = RegistroForestalService.leer_registro("Test", str(tmp_path), usar_cache=True)
+    b = RegistroForestalService.leer_registro("Test", str(tmp_path), usar_cache=True)
+    assert a is b
+    # Persistir invalida la entrada
+    servicio.persistir(registro)
+    assert RegistroForestalService.leer_registro("Test", str(tmp_path), usar_cache=True) is not a
+
+
+def test_tabla_de_otra_version_del_registro_se_regenera(servicio, registro, tmp_path):
+    servicio.persistir(registro)
+    tabla_anterior = (tmp_path / "Test.tabla").read_bytes()
+    PlantacionService().plantar_lote(registro.get_plantacion(), "Pino", 3)
+    servicio.persistir(registro)
+    # Caída entre escribir el registro y su tabla: queda la tabla anterior
+    (tmp_path / "Test.tabla").write_bytes(tabla_anterior)
+
+    with RegistroForestalService.abrir_tabla("Test", str(tmp_path)) as tabla:
+        assert len(tabla) == len(registro.get_plantacion().get_cultivos())
+        assert tabla.get_firma_registro() == DiarioRegistro.firma_base(str(tmp_path / "Test.dat"))
+
+
+def test_tabla_invalida_o_faltante_se_regenera(servicio, registro, tmp_path):
+    servicio.persistir(registro)
+    (tmp_path / "Test.tabla").write_bytes(b"basura")
+    with RegistroForestalService.abrir_tabla("Test", str(tmp_path)) as tabla:
+        assert len(tabla) == len(registro.get_plantacion().get_cultivos())
+    (tmp_path / "Test.tabla").unlink()
+    with RegistroForestalService.abrir_tabla("Test", str(tmp_path)) as tabla:
+        assert tabla.get_agua_disponible() == 1000
+
+
+def crear_registro(propietario: str, pinos: int) -> RegistroForestal:
+    tierra = Tierra(1, 1000.0, propietario)
+    plantacion = Plantacion(propietario, 1000.0)
+    tierra.set_finca(plantacion)
+    PlantacionService().plantar_lote(plantacion, "Pino", pinos)
+    return RegistroForestal(1, tierra, plantacion, propietario, 100.0)
+
+
+def test_persistir_todos_junta_los_errores(servicio, tmp_path, capsys):
+    # "falta/Nadie" apunta a un subdirectorio inexistente: no se puede escribir
+    registros = [crear_registro(nombre, i + 1)
+                 for i, nombre in enumerate(("A", "B", "falta/Nadie", "C", "D"))]
+    completados = []
+
+    with pytest.raises(PersistenciaMultipleException) as error:
+        servicio.persistir_todos(registros, max_procesos=2, al_completar=completados.append)
+    capsys.readouterr()
+
+    assert list(error.value.errores) == ["falta/Nadie"]
+    assert isinstance(error.value.errores["falta/Nadie"], PersistenciaException)
+    assert error.value.total == 5
+    # Orden de finalización: se comparan conjuntos
+    assert sorted(completados) == ["A", "B", "C", "D"]
+    assert RegistroForestalService.listar_propietarios("*", str(tmp_path)) == ["A", "B", "C", "D"]
+
+
+def test_leer_todos_entrega_los_validos_y_despues_falla(servicio, tmp_path, capsys):
+    for i, nombre in enumerate(("A", "B", "C", "D")):
+        servicio.persistir(crear_registro(nombre, i + 1))
+    (tmp_path / "Roto.dat").write_bytes(b"no es un registro")
+
+    leidos = {}
+    with pytest.raises(PersistenciaMultipleException) as error:
+        for registro in RegistroForestalService.leer_todos("*", str(tmp_path), max_procesos=2):
+            leidos[registro.get_propietario()] = len(registro.get_plantacion().get_cultivos())
+    capsys.readouterr()
+
+    assert leidos == {"A": 1, "B": 2, "C": 3, "D": 4}
+    assert list(error.value.errores) == ["Roto"]
+    assert error.value.total == 5
+
+
+def test_leer_todos_acota_las_tareas_en_vuelo(servicio, tmp_path, capsys):
+    nombres = [f"R{i}" for i in range(12)]
+    for nombre in nombres:
+        servicio.persistir(crear_registro(nombre, 1))
+    consumidos = []
+
+    def propietarios():
+        for nombre in nombres:
+            consumidos.append(nombre)
+            yield nombre
+
+    entregados = 0
+    for _ in RegistroForestalService.leer_todos(propietarios(), str(tmp_path), max_procesos=2):
+        # Al entregar un resultado, a lo sumo 2 tareas por proceso se pidieron de más
+        assert len(consumidos) - entregados <= 2 * 2
+        entregados += 1
+    capsys.readouterr()
+    assert entregados == len(nombres)
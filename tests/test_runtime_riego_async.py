@@ -0,0 +1,68 @@
+import threading
+import time
+
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.patrones.observer.eventos.tipo_sensor import TipoSensor
+from python_forestacion.riego import runtime_riego_async
+from python_forestacion.riego.runtime_riego_async import RuntimeRiegoAsync
+from python_forestacion.riego.sensores.sensores_async import SensorAsync
+
+
+class TemperaturaFija(SensorAsync):
+    """Sensor falso: siempre una temperatura que habilita el riego, cada 10 ms."""
+
+    TIPO = TipoSensor.TEMPERATURA
+
+    def __init__(self, sensor_id: str = "temperatura", intervalo: float = 0.01,
+                 mostrar_lecturas: bool = False):
+        super().__init__(sensor_id, intervalo, mostrar_lecturas)
+
+    def _leer(self) -> float:
+        return 10.0
+
+
+class HumedadFija(SensorAsync):
+    """Sensor falso: siempre una humedad baja, cada 10 ms."""
+
+    TIPO = TipoSensor.HUMEDAD
+
+    def __init__(self, sensor_id: str = "humedad", intervalo: float = 0.01,
+                 mostrar_lecturas: bool = False):
+        super().__init__(sensor_id, intervalo, mostrar_lecturas)
+
+    def _leer(self) -> float:
+        return 30.0
+
+
+class ServicioFalso:
+
+    def __init__(self):
+        self.riegos = {}
+        self._lock = threading.Lock()
+
+    def regar(self, plantacion, fecha=None, diario=None) -> int:
+        with self._lock:
+            nombre = plantacion.get_nombre()
+            self.riegos[nombre] = self.riegos.get(nombre, 0) + 1
+        return 0
+
+
+def test_runtime_riega_y_se_detiene(monkeypatch, capsys):
+    monkeypatch.setattr(runtime_riego_async, "TemperaturaReaderAsync", TemperaturaFija)
+    monkeypatch.setattr(runtime_riego_async, "HumedadReaderAsync", HumedadFija)
+    servicio = ServicioFalso()
+    runtime = RuntimeRiegoAsync(servicio)
+    for i in range(3):
+        runtime.agregar_plantacion(Plantacion(f"P{i}", 100.0))
+
+    inicio = time.monotonic()
+    runtime.correr(duracion=0.8)
+    salida = capsys.readouterr().out
+
+    # detener corta las esperas de sensores y controladores: no se espera un intervalo más
+    assert time.monotonic() - inicio < 1.5
+    assert "Riego asincrónico detenido" in salida
+    for controlador in runtime.get_controladores():
+        nombre = controlador.get_plantacion().get_nombre()
+        assert controlador.get_riegos() >= 1
+        assert controlador.get_riegos() == servicio.riegos[nombre]
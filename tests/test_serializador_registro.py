@@ -0,0 +1,137 @@
+import io
+from datetime import date
+
+import pytest
+
+from python_forestacion.entidades.cultivos.arbol import Arbol
+from python_forestacion.entidades.cultivos.lechuga import Lechuga
+from python_forestacion.entidades.cultivos.olivo import Olivo
+from python_forestacion.entidades.cultivos.pino import Pino
+from python_forestacion.entidades.cultivos.zanahoria import Zanahoria
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.entidades.terrenos.tierra import Tierra
+from python_forestacion.excepciones.persistencia_exception import PersistenciaException
+from python_forestacion.persistencia.serializador_registro import SerializadorRegistro
+from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
+from python_forestacion.servicios.terrenos.registro_forestal_service import RegistroForestalService
+
+SERIALIZADORES = ("pickle", "binario", "jsonl")
+
+
+def describir(cultivo) -> tuple:
+    """Estado observable de un cultivo, comparable entre formatos."""
+    extra = {
+        Pino: lambda c: c.get_variedad(),
+        Olivo: lambda c: c.get_tipo_aceituna(),
+        Lechuga: lambda c: (c.get_variedad(), c.tiene_invernadero()),
+        Zanahoria: lambda c: (c.es_baby(), c.tiene_invernadero()),
+    }
+    tipo = next(t for t in extra if isinstance(cultivo, t))
+    altura = cultivo.get_altura() if isinstance(cultivo, Arbol) else None
+    return tipo.__name__, cultivo.get_agua(), cultivo.get_superficie(), altura, extra[tipo](cultivo)
+
+
+def describir_registro(registro: RegistroForestal) -> tuple:
+    plantacion = registro.get_plantacion()
+    tierra = registro.get_tierra()
+    return (registro.get_id_padron(), registro.get_propietario(), registro.get_avaluo(),
+            tierra.get_superficie(), tierra.get_domicilio(),
+            plantacion.get_nombre(), plantacion.get_agua_disponible(),
+            [describir(c) for c in plantacion.get_cultivos()])
+
+
+def crear_registro(columnar: bool) -> RegistroForestal:
+    tierra = Tierra(7, 5000.0, "Ruta 40 km 3")
+    plantacion = Plantacion("Serializada", 5000.0, columnar=columnar)
+    tierra.set_finca(plantacion)
+    plantacion.set_agua_disponible(10 ** 6)
+    servicio = PlantacionService()
+    for especie in ("Pino", "Olivo", "Lechuga", "Zanahoria"):
+        servicio.plantar_lote(plantacion, especie, 25)
+    # Estado distinto del prototipo: riegos y una variedad cambiada
+    servicio.regar_por_lote(plantacion, date(2024, 1, 15))
+    servicio.regar_por_lote(plantacion, date(2024, 7, 15))
+    plantacion.get_cultivos()[0].set_variedad("Elliotis")
+    return RegistroForestal(7, tierra, plantacion, "Serializado", 123456.78)
+
+
+@pytest.fixture(autouse=True)
+def silencio(capsys):
+    yield
+    capsys.readouterr()
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize("nombre", SERIALIZADORES)
+def test_ida_y_vuelta(nombre, columnar, tmp_path):
+    registro = crear_registro(columnar)
+    servicio = RegistroForestalService(str(tmp_path), generaciones_respaldo=0, sincronizar=False,
+                                       serializador=nombre, compresion=None)
+    servicio.persistir(registro, tamanio_bloque=16)
+
+    leido = RegistroForestalService.leer_registro("Serializado", str(tmp_path))
+    assert describir_registro(leido) == describir_registro(registro)
+
+    with open(tmp_path / "Serializado.dat", "rb") as archivo:
+        assert SerializadorRegistro.detectar(archivo).get_nombre() == nombre
+
+    encabezado = RegistroForestalService.leer_encabezado("Serializado", str(tmp_path))
+    assert encabezado.get_cantidad_cultivos() == 100
+    assert encabezado.get_avaluo() == registro.get_avaluo()
+
+    lotes = list(RegistroForestalService.iterar_cultivos("Serializado", str(tmp_path)))
+    if nombre != "jsonl":
+        # JSON-lines guarda un cultivo por línea: el lote lo decide la lectura
+        assert [len(lote) for lote in lotes] == [16] * 6 + [4]
+    assert [describir(c) for lote in lotes for c in lote] == \
+        [describir(c) for c in registro.get_plantacion().get_cultivos()]
+
+
+def test_serializador_desconocido():
+    with pytest.raises(ValueError):
+        SerializadorRegistro.por_nombre("xml")
+
+
+@pytest.mark.parametrize("nombre", SERIALIZADORES)
+def test_encabezado_no_decodifica_los_cultivos(nombre, tmp_path):
+    registro = crear_registro(False)
+    serializador = SerializadorRegistro.por_nombre(nombre)
+    archivo = io.BytesIO()
+    serializador.escribir(registro, archivo, 16)
+    datos = archivo.getvalue()
+    archivo = io.BytesIO(datos)
+    serializador.leer_encabezado(archivo)
+    # leer_encabezado deja el archivo en el primer lote: lo que sigue es el cuerpo
+    inicio_cuerpo = archivo.tell()
+    assert 0 < inicio_cuerpo < len(datos)
+    (tmp_path / "Serializado.dat").write_bytes(datos[:inicio_cuerpo] +
+                                               b"\xff" * (len(datos) - inicio_cuerpo))
+
+    encabezado = RegistroForestalService.leer_encabezado("Serializado", str(tmp_path))
+
+    assert encabezado.get_propietario() == "Serializado"
+    assert encabezado.get_avaluo() == registro.get_avaluo()
+    assert encabezado.get_cantidad_cultivos() == 100
+    plantacion = encabezado.get_registro().get_plantacion()
+    assert plantacion.get_nombre() == "Serializada"
+    assert plantacion.get_agua_disponible() == registro.get_plantacion().get_agua_disponible()
+    assert plantacion.get_cultivos() == []
+    # El cuerpo dañado sólo falla al leer los cultivos
+    with pytest.raises(PersistenciaException):
+        RegistroForestalService.leer_registro("Serializado", str(tmp_path))
+
+
+@pytest.mark.parametrize("compresion", [None, "zlib"])
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize("nombre", SERIALIZADORES)
+def test_iterar_cultivos_equivale_a_leer_registro(nombre, columnar, compresion, tmp_path):
+    servicio = RegistroForestalService(str(tmp_path), generaciones_respaldo=0, sincronizar=False,
+                                       serializador=nombre, compresion=compresion)
+    servicio.persistir(crear_registro(columnar), tamanio_bloque=7)
+
+    leido = RegistroForestalService.leer_registro("Serializado", str(tmp_path))
+    lotes = list(RegistroForestalService.iterar_cultivos("Serializado", str(tmp_path)))
+
+    assert [describir(c) for lote in lotes for c in lote] == \
+        [describir(c) for c in leido.get_plantacion().get_cultivos()]
@@ -0,0 +1,58 @@
+from datetime import date
+
+import pytest
+
+from python_forestacion.entidades.cultivos.arbol import Arbol
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.excepciones.agua_agotada_exception import AguaAgotadaException
+from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
+from python_forestacion.servicios.terrenos.simulador_crecimiento_service import SimuladorCrecimientoService
+
+
+def crear_plantacion(columnar: bool, agua: int) -> Plantacion:
+    plantacion = Plantacion("Simulada", 10000.0, columnar=columnar)
+    plantacion.set_agua_disponible(agua)
+    servicio = PlantacionService()
+    for especie, cantidad in (("Pino", 30), ("Olivo", 20), ("Lechuga", 25), ("Zanahoria", 15)):
+        servicio.plantar_lote(plantacion, especie, cantidad)
+    # Alturas iniciales distintas dentro de una especie
+    for i, cultivo in enumerate(plantacion.get_cultivos()[:10]):
+        cultivo.set_altura(cultivo.get_altura() + i * 0.25)
+    return plantacion
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize("agua", [10 ** 7, 20000])
+def test_simular_equivale_a_regar_por_lote(columnar, agua, capsys):
+    inicio, fin = date(2024, 1, 1), date(2024, 12, 31)
+    plantacion = crear_plantacion(columnar, agua)
+    resultado = SimuladorCrecimientoService().simular(plantacion, inicio, fin, intervalo_dias=3)
+
+    regada = crear_plantacion(columnar, agua)
+    servicio = PlantacionService()
+    ciclos, agotamiento, consumida = 0, None, 0
+    for fecha in SimuladorCrecimientoService.fechas_riego(inicio, fin, 3):
+        try:
+            consumida += servicio.regar_por_lote(regada, fecha)
+        except AguaAgotadaException:
+            agotamiento = fecha
+            break
+        ciclos += 1
+    capsys.readouterr()
+
+    assert resultado.get_ciclos() == ciclos
+    assert resultado.get_fecha_agotamiento() == agotamiento
+    assert (agotamiento is None) == (agua == 10 ** 7)
+    assert resultado.get_agua_consumida() == consumida
+    assert resultado.get_agua_disponible() == regada.get_agua_disponible()
+    cultivos = regada.get_cultivos()
+    assert list(resultado.get_aguas()) == [c.get_agua() for c in cultivos]
+    assert list(resultado.get_alturas()) == [c.get_altura() if isinstance(c, Arbol) else 0.0
+                                             for c in cultivos]
+    # La plantación simulada no cambia
+    assert plantacion.get_agua_disponible() == agua
+
+
+def test_intervalo_invalido():
+    with pytest.raises(ValueError):
+        list(SimuladorCrecimientoService.fechas_riego(date(2024, 1, 1), date(2024, 2, 1), 0))
@@ -0,0 +1,82 @@
+import math
+
+import pytest
+
+from python_forestacion.entidades.cultivos.lechuga import Lechuga
+from python_forestacion.entidades.cultivos.pino import Pino
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+
+SUPERFICIE_TOTAL = 1000.0
+
+
+def crear_plantacion(columnar: bool) -> Plantacion:
+    plantacion = Plantacion("Superficie", SUPERFICIE_TOTAL, columnar=columnar)
+    # Cada consulta de superficie disponible contrasta el contador con la suma completa
+    plantacion.set_verificar_superficie(True)
+    return plantacion
+
+
+def verificar(plantacion: Plantacion) -> None:
+    suma = sum(c.get_superficie() for c in plantacion.get_cultivos())
+    assert math.isclose(plantacion.get_superficie_ocupada(), suma, abs_tol=1e-9)
+    assert math.isclose(plantacion._sumar_superficies(), suma, abs_tol=1e-9)
+    assert math.isclose(plantacion.calcular_superficie_disponible(),
+                        SUPERFICIE_TOTAL - suma, abs_tol=1e-9)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_contador_sigue_altas_y_bajas(columnar):
+    plantacion = crear_plantacion(columnar)
+    verificar(plantacion)
+
+    plantacion.add_cultivo(CultivoFactory.crear_cultivo("Pino"))
+    verificar(plantacion)
+    for especie in ("Olivo", "Lechuga", "Pino", "Zanahoria"):
+        plantacion.add_cultivos(CultivoFactory.crear_cultivos(especie, 6))
+        verificar(plantacion)
+
+    plantacion.remove_cultivo(plantacion.get_cultivos()[3])
+    verificar(plantacion)
+    assert len(plantacion.retirar_cultivos(Pino, 4)) == 4
+    verificar(plantacion)
+    assert len(plantacion.retirar_cultivos(Lechuga, 100)) == 6
+    verificar(plantacion)
+    assert plantacion.retirar_cultivos(Lechuga, 1) == []
+    verificar(plantacion)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_set_superficie_de_un_cultivo_plantado(columnar):
+    plantacion = crear_plantacion(columnar)
+    plantacion.add_cultivos(CultivoFactory.crear_cultivos("Pino", 5))
+    plantacion.add_cultivos(CultivoFactory.crear_cultivos("Lechuga", 5))
+
+    cultivos = plantacion.get_cultivos()
+    cultivos[1].set_superficie(7.5)
+    cultivos[7].set_superficie(0.25)
+    verificar(plantacion)
+    assert cultivos[1].get_superficie() == 7.5
+
+    # Después de un retiro las filas se desplazan: se cambia otra planta ya plantada
+    plantacion.retirar_cultivos(Pino, 2)
+    plantacion.get_cultivos()[0].set_superficie(3.0)
+    verificar(plantacion)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_cultivo_fuera_de_la_plantacion_no_la_modifica(columnar):
+    plantacion = crear_plantacion(columnar)
+    suelto = CultivoFactory.crear_cultivo("Pino")
+    plantacion.add_cultivo(suelto)
+    plantacion.add_cultivos(CultivoFactory.crear_cultivos("Olivo", 3))
+    ocupada = plantacion.get_superficie_ocupada()
+
+    retirado, = plantacion.retirar_cultivos(Pino, 1)
+    ocupada -= retirado.get_superficie()
+    # Ni el cultivo retirado ni (en modo columnar) el objeto original copiado
+    # a una fila siguen vinculados a la plantación
+    retirado.set_superficie(50.0)
+    suelto.set_superficie(60.0)
+    assert math.isclose(plantacion.get_superficie_ocupada(), ocupada)
+    verificar(plantacion)
@@ -0,0 +1,83 @@
+import pytest
+
+from python_forestacion.entidades.cultivos.arbol import Arbol
+from python_forestacion.entidades.cultivos.especie_cultivo import EspecieCultivo
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.persistencia.diario_registro import DiarioRegistro
+from python_forestacion.persistencia.tabla_cultivos import TablaCultivos
+from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
+from python_forestacion.servicios.terrenos.registro_forestal_service import RegistroForestalService
+
+
+def crear_plantacion(columnar: bool) -> Plantacion:
+    plantacion = Plantacion("Tabulada", 5000.0, columnar=columnar)
+    plantacion.set_agua_disponible(777)
+    servicio = PlantacionService()
+    for especie, cantidad in (("Pino", 7), ("Lechuga", 5), ("Olivo", 3), ("Pino", 2)):
+        servicio.plantar_lote(plantacion, especie, cantidad)
+    for i, cultivo in enumerate(plantacion.get_cultivos()):
+        cultivo.set_agua(cultivo.get_agua() + i)
+        if isinstance(cultivo, Arbol):
+            cultivo.set_altura(cultivo.get_altura() + i * 0.1)
+    return plantacion
+
+
+def filas(plantacion: Plantacion) -> list:
+    return [(EspecieCultivo.de_cultivo(c), c.get_agua(), c.get_superficie(),
+             c.get_altura() if isinstance(c, Arbol) else 0.0)
+            for c in plantacion.get_cultivos()]
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_agregados_coinciden_con_la_plantacion(columnar, tmp_path, capsys):
+    plantacion = crear_plantacion(columnar)
+    capsys.readouterr()
+    ruta = tmp_path / "Tabulada.tabla"
+    with open(ruta, "wb") as archivo:
+        TablaCultivos.escribir(plantacion, archivo)
+    esperadas = filas(plantacion)
+
+    with TablaCultivos(str(ruta)) as tabla:
+        assert len(tabla) == len(esperadas)
+        assert [tabla[i] for i in range(len(tabla))] == esperadas
+        assert tabla[-1] == esperadas[-1]
+        with pytest.raises(IndexError):
+            tabla[len(esperadas)]
+
+        assert tabla.contar_por_especie() == {EspecieCultivo.PINO: 9, EspecieCultivo.LECHUGA: 5,
+                                              EspecieCultivo.OLIVO: 3}
+        assert tabla.sumar_agua() == sum(agua for _, agua, _, _ in esperadas)
+        assert tabla.calcular_superficie_ocupada() == sum(s for _, _, s, _ in esperadas)
+        for posicion, columna in enumerate(("agua", "superficie", "altura"), 1):
+            esperado = {}
+            for fila in esperadas:
+                esperado[fila[0]] = esperado.get(fila[0], 0) + fila[posicion]
+            assert tabla.sumar_por_especie(columna) == esperado
+        with pytest.raises(ValueError):
+            tabla.sumar_por_especie("variedad")
+
+        assert tabla.get_agua_disponible() == 777
+        assert tabla.get_superficie_total() == 5000.0
+        assert tabla.get_firma_registro() == (0, 0, 0)
+
+
+def test_archivo_que_no_es_tabla(tmp_path):
+    ruta = tmp_path / "otra.tabla"
+    ruta.write_bytes(b"PFRB" + bytes(100))
+    with pytest.raises(ValueError):
+        TablaCultivos(str(ruta))
+
+
+def test_tabla_con_firma_de_otro_registro_se_regenera(registro, tmp_path, capsys):
+    servicio = RegistroForestalService(str(tmp_path), generaciones_respaldo=0, sincronizar=False)
+    servicio.persistir(registro)
+    # Tabla válida pero escrita para otro registro, con otro estado
+    otra = crear_plantacion(False)
+    with open(tmp_path / "Test.tabla", "wb") as archivo:
+        TablaCultivos.escribir(otra, archivo, (1, 2, 3))
+
+    with RegistroForestalService.abrir_tabla("Test", str(tmp_path)) as tabla:
+        assert tabla.get_firma_registro() == DiarioRegistro.firma_base(str(tmp_path / "Test.dat"))
+        assert len(tabla) == 40
+        assert tabla.get_agua_disponible() == 1000
+    assert "Tabla regenerada" in capsys.readouterr().out
@@ -0,0 +1,74 @@
+import pytest
+
+from python_forestacion.constantes import (
+    ANTIGUEDAD_MAXIMA_LECTURA,
+    TEMP_MIN,
+    TEMP_MAX,
+    HUMEDAD_MIN,
+    HUMEDAD_MAX
+)
+from python_forestacion.patrones.observer.eventos.evento_sensor import EventoSensor
+from python_forestacion.patrones.observer.eventos.tipo_sensor import TipoSensor
+from python_forestacion.patrones.observer.eventos.ultimas_lecturas import UltimasLecturas
+
+
+def evento(tipo: TipoSensor, valor: float, timestamp: float) -> EventoSensor:
+    return EventoSensor("sensor", tipo, valor, timestamp)
+
+
+def test_lectura_vigente_y_vencida():
+    lecturas = UltimasLecturas()
+    assert lecturas.get_valor_vigente(TipoSensor.TEMPERATURA) is None
+    assert lecturas.registrar(evento(TipoSensor.TEMPERATURA, 12.0, 100.0))
+
+    limite = 100.0 + ANTIGUEDAD_MAXIMA_LECTURA
+    assert lecturas.get_valor_vigente(TipoSensor.TEMPERATURA, ahora=limite) == 12.0
+    assert lecturas.get_valor_vigente(TipoSensor.TEMPERATURA, ahora=limite + 0.01) is None
+    # La lectura vencida se conserva, sólo deja de habilitar riegos
+    assert lecturas.get_lectura(TipoSensor.TEMPERATURA).get_valor() == 12.0
+    assert lecturas.get_valor_vigente(TipoSensor.HUMEDAD, ahora=100.0) is None
+
+
+def test_antiguedad_maxima_propia():
+    lecturas = UltimasLecturas(antiguedad_maxima=1.0)
+    lecturas.registrar(evento(TipoSensor.HUMEDAD, 40.0, 50.0))
+    assert lecturas.get_valor_vigente(TipoSensor.HUMEDAD, ahora=50.5) == 40.0
+    assert lecturas.get_valor_vigente(TipoSensor.HUMEDAD, ahora=51.5) is None
+
+
+def test_lectura_mas_vieja_se_ignora():
+    lecturas = UltimasLecturas()
+    assert lecturas.registrar(evento(TipoSensor.TEMPERATURA, 10.0, 100.0))
+    assert not lecturas.registrar(evento(TipoSensor.TEMPERATURA, 20.0, 99.0))
+    assert lecturas.get_lectura(TipoSensor.TEMPERATURA).get_valor() == 10.0
+
+    # Cada tipo tiene su propia última lectura
+    assert lecturas.registrar(evento(TipoSensor.HUMEDAD, 30.0, 99.0))
+    assert lecturas.registrar(evento(TipoSensor.TEMPERATURA, 11.0, 101.0))
+    assert lecturas.get_lectura(TipoSensor.TEMPERATURA).get_valor() == 11.0
+
+
+@pytest.mark.parametrize("tipo,valor", [
+    (TipoSensor.TEMPERATURA, TEMP_MIN - 0.1),
+    (TipoSensor.TEMPERATURA, TEMP_MAX + 0.1),
+    (TipoSensor.HUMEDAD, HUMEDAD_MIN - 0.1),
+    (TipoSensor.HUMEDAD, HUMEDAD_MAX + 0.1),
+    # Una humedad válida no es una temperatura válida: el tipo decide el rango
+    (TipoSensor.TEMPERATURA, 75.0),
+])
+def test_valor_fuera_de_rango_se_rechaza(tipo, valor):
+    lecturas = UltimasLecturas()
+    assert lecturas.registrar(evento(tipo, (TEMP_MIN + TEMP_MAX) / 2
+                                      if tipo is TipoSensor.TEMPERATURA else 50.0, 100.0))
+    assert not lecturas.registrar(evento(tipo, valor, 101.0))
+    assert lecturas.get_lectura(tipo).get_timestamp() == 100.0
+
+
+@pytest.mark.parametrize("tipo,minimo,maximo", [
+    (TipoSensor.TEMPERATURA, TEMP_MIN, TEMP_MAX),
+    (TipoSensor.HUMEDAD, HUMEDAD_MIN, HUMEDAD_MAX),
+])
+def test_extremos_del_rango_se_aceptan(tipo, minimo, maximo):
+    lecturas = UltimasLecturas()
+    assert lecturas.registrar(evento(tipo, minimo, 1.0))
+    assert lecturas.registrar(evento(tipo, maximo, 2.0))